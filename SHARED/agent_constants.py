@@ -118,9 +118,14 @@ class LogEvent:
     REFEREE_REGISTERED = "REFEREE_REGISTERED"
     PLAYER_REGISTERED = "PLAYER_REGISTERED"
     MATCH_RESULT = "MATCH_RESULT"
+    MATCH_RESULT_BATCH = "MATCH_RESULT_BATCH"
     TIMEOUT = "TIMEOUT"
     REQUEST_ERROR = "REQUEST_ERROR"
     DUPLICATE_REGISTRATION = "DUPLICATE_REGISTRATION"
+    AGENT_EXITED = "AGENT_EXITED"
+    AGENT_CRASHED = "AGENT_CRASHED"
+    AGENT_RESTARTED = "AGENT_RESTARTED"
+    LOOP_BLOCKED = "LOOP_BLOCKED"  # A callback held the event loop past the watchdog threshold
 
 
 class Points:
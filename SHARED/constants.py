@@ -23,16 +23,28 @@ from SHARED.agent_constants import (
     Winner,
 )
 
+# Re-export logging constants
+from SHARED.logging_constants import (
+    ADMIN_LOGGING_PATH, ADMIN_MEMORY_PATH, ADMIN_PROFILE_PATH, ADMIN_TOKEN_ENV, ADMIN_TRANSPORT_PATH,
+    LATENCY_FIELD, FsyncPolicy, PayloadMode, PhaseEvent, SpanKind,
+)
+
 # Re-export all protocol and network constants
 from SHARED.protocol_constants import (
+    DECISION_DEADLINE_ERROR,
+    HEALTH_PATH,
+    METRICS_PATH,
     HTTP_PROTOCOL,
     LOCALHOST,
     MCP_PATH,
     PROTOCOL_VERSION,
     SERVER_HOST,
     STANDINGS_SCHEMA_VERSION,
+    Capability,
     Field,
     MessageType,
+    QueryType,
+    StandingsMode,
     Status,
     Timeout,
     format_sender,
@@ -45,12 +57,18 @@ __all__ = [
     # Protocol constants
     "PROTOCOL_VERSION",
     "MCP_PATH",
+    "HEALTH_PATH",
+    "METRICS_PATH",
     "LOCALHOST",
     "SERVER_HOST",
     "HTTP_PROTOCOL",
+    "DECISION_DEADLINE_ERROR",
     "STANDINGS_SCHEMA_VERSION",
     "MessageType",
     "Timeout",
+    "Capability",
+    "QueryType",
+    "StandingsMode",
     "Status",
     "Field",
     # Protocol helpers
@@ -74,4 +92,15 @@ __all__ = [
     "FileName",
     "LogEvent",
     "Points",
+    # Logging constants
+    "ADMIN_LOGGING_PATH",
+    "ADMIN_TRANSPORT_PATH",
+    "ADMIN_PROFILE_PATH",
+    "ADMIN_MEMORY_PATH",
+    "ADMIN_TOKEN_ENV",
+    "FsyncPolicy",
+    "PayloadMode",
+    "PhaseEvent",
+    "SpanKind",
+    "LATENCY_FIELD",
 ]
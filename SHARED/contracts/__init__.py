@@ -22,6 +22,7 @@ from .exceptions import (
     ProtocolValidationError,
     SchemaNotFoundError,
 )
+from .batch_contracts import build_match_result_batch, build_match_result_batch_ack
 from .league_manager_contracts import (
     build_league_completed,
     build_league_error,
@@ -111,6 +112,8 @@ __all__ = [
     "build_match_result_report",
     "build_game_error",
     "build_run_match_ack",
+    "build_match_result_batch",
+    "build_match_result_batch_ack",
     # Player contracts
     "build_game_join_ack",
     "build_choose_parity_response",
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from SHARED.constants import PROTOCOL_VERSION, Field
+from SHARED.league_sdk.trace_context import current_span
 from SHARED.protocol_constants import format_sender, generate_conversation_id, generate_timestamp
 
 # Re-export JSON-RPC helpers for backward compatibility
@@ -34,7 +35,8 @@ def create_base_message(
         **extra_fields: Additional fields to include in message
 
     Returns:
-        Base message dictionary with all required fields
+        Base message dictionary with all required fields, plus the trace
+        context of the active span if there is one
     """
     msg = {
         Field.PROTOCOL: PROTOCOL_VERSION,
@@ -43,6 +45,9 @@ def create_base_message(
         Field.TIMESTAMP: generate_timestamp(),
         Field.CONVERSATION_ID: conversation_id or generate_conversation_id(),
     }
+    span = current_span()
+    if span is not None:
+        msg[Field.TRACEPARENT] = span.traceparent
     msg.update(extra_fields)
     return msg
 
@@ -0,0 +1,59 @@
+"""Batched result reporting contract builders.
+
+Referees running many concurrent matches coalesce their results:
+- MATCH_RESULT_BATCH: Referee → League Manager (list of MATCH_RESULT_REPORT bodies)
+- MATCH_RESULT_BATCH_ACK: League Manager → Referee
+"""
+
+from typing import Any, Dict, List, Optional
+
+from SHARED.constants import PROTOCOL_VERSION, Field, MessageType, Status
+from SHARED.protocol_constants import JSONRPCMethod, generate_conversation_id, generate_timestamp
+
+from .base_contract import create_base_message
+from .jsonrpc_helpers import wrap_jsonrpc_request, wrap_jsonrpc_response
+
+
+def build_match_result_batch(
+    referee_id: str,
+    league_id: str,
+    reports: List[Dict[str, Any]],
+    conversation_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build MATCH_RESULT_BATCH message.
+
+    Args:
+        referee_id: Reporting referee
+        league_id: League the matches belong to
+        reports: MATCH_RESULT_REPORT params (unwrapped), one per match
+    """
+    params = create_base_message(
+        message_type=MessageType.MATCH_RESULT_BATCH,
+        sender_type="referee",
+        sender_id=referee_id,
+        conversation_id=conversation_id,
+    )
+    params[Field.LEAGUE_ID] = league_id
+    params[Field.REPORTS] = reports
+    return wrap_jsonrpc_request(JSONRPCMethod.MATCH_RESULT_BATCH, params, agent_id=referee_id)
+
+
+def build_match_result_batch_ack(
+    match_ids: List[str],
+    status: str = Status.RECORDED,
+    conversation_id: Optional[str] = None,
+    request_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build MATCH_RESULT_BATCH_ACK message acknowledging every match in a batch."""
+    result = {
+        Field.PROTOCOL: PROTOCOL_VERSION,
+        Field.MESSAGE_TYPE: MessageType.MATCH_RESULT_BATCH_ACK,
+        Field.SENDER: "league_manager",
+        Field.TIMESTAMP: generate_timestamp(),
+        Field.CONVERSATION_ID: conversation_id or generate_conversation_id(),
+        Field.MATCH_IDS: match_ids,
+        Field.STATUS: status,
+    }
+    if request_id is not None:
+        return wrap_jsonrpc_response(result, request_id)
+    return wrap_jsonrpc_request(JSONRPCMethod.MATCH_RESULT_BATCH_ACK, result, agent_id="LM")
@@ -40,6 +40,7 @@ def build_game_invitation(
     params[Field.GAME_TYPE] = game_type
     params[Field.ROLE_IN_MATCH] = role_in_match
     params[Field.OPPONENT_ID] = opponent_id
+    params[Field.RECIPIENT] = player_id
     return wrap_jsonrpc_request(JSONRPCMethod.GAME_INVITATION, params, agent_id=referee_id)
 
 
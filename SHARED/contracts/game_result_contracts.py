@@ -54,6 +54,7 @@ def build_match_result_report(
     choices: Dict[str, str],
     game_type: str = "even_odd",
     conversation_id: Optional[str] = None,
+    match_seed: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Build MATCH_RESULT_REPORT message sent by referee to LM after game completion."""
     params = create_game_message(
@@ -71,6 +72,8 @@ def build_match_result_report(
         "score": score,
         "details": {"drawn_number": drawn_number, "choices": choices},
     }
+    if match_seed is not None:
+        params[Field.RESULT]["details"][Field.MATCH_SEED] = match_seed
     return wrap_jsonrpc_request(JSONRPCMethod.MATCH_RESULT_REPORT, params, agent_id=referee_id)
 
 
@@ -11,8 +11,12 @@ Referee-sourced messages:
 - MATCH_RESULT_REPORT: Referee → League Manager
 - GAME_ERROR: Referee → Player
 - RUN_MATCH_ACK: Referee → League Manager
+- MATCH_RESULT_BATCH: Referee → League Manager
 """
 
+# Re-export batched reporting contracts
+from .batch_contracts import build_match_result_batch
+
 # Re-export game flow contracts
 from .game_flow_contracts import (
     build_choose_parity_call,
@@ -37,4 +41,5 @@ __all__ = [
     "build_match_result_report",
     "build_game_error",
     "build_run_match_ack",
+    "build_match_result_batch",
 ]
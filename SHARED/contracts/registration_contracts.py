@@ -74,8 +74,13 @@ def build_league_register_request(
     contact_endpoint: str,
     game_types: Optional[List[str]] = None,
     conversation_id: Optional[str] = None,
+    capabilities: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
-    """Build LEAGUE_REGISTER_REQUEST message."""
+    """Build LEAGUE_REGISTER_REQUEST message.
+
+    capabilities lists optional protocol features the player supports
+    (e.g. Capability.STANDINGS_DELTA).
+    """
     params = {
         Field.PROTOCOL: PROTOCOL_VERSION,
         Field.MESSAGE_TYPE: MessageType.LEAGUE_REGISTER_REQUEST,
@@ -89,6 +94,8 @@ def build_league_register_request(
             Field.CONTACT_ENDPOINT: contact_endpoint,
         },
     }
+    if capabilities:
+        params[Field.PLAYER_META][Field.CAPABILITIES] = capabilities
     return wrap_jsonrpc_request(JSONRPCMethod.REGISTER_PLAYER, params, agent_id=player_id)
 
 
@@ -98,8 +105,12 @@ def build_league_register_response(
     reason: Optional[str] = None,
     conversation_id: Optional[str] = None,
     request_id: Optional[int] = None,
+    seed: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Build LEAGUE_REGISTER_RESPONSE message."""
+    """Build LEAGUE_REGISTER_RESPONSE message.
+
+    seed, when given, is the player's derived random seed for reproducible runs.
+    """
     result = {
         Field.PROTOCOL: PROTOCOL_VERSION,
         Field.MESSAGE_TYPE: MessageType.LEAGUE_REGISTER_RESPONSE,
@@ -111,6 +122,8 @@ def build_league_register_response(
     }
     if reason:
         result[Field.REASON] = reason
+    if seed is not None:
+        result[Field.SEED] = seed
     if request_id is not None:
         return wrap_jsonrpc_response(result, request_id)
     return wrap_jsonrpc_request(JSONRPCMethod.REGISTER_PLAYER_RESPONSE, result, agent_id="LM")
@@ -16,10 +16,13 @@ def build_round_announcement(
     round_id: int,
     matches: List[Dict[str, Any]],
     conversation_id: Optional[str] = None,
+    total_matches: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Build ROUND_ANNOUNCEMENT message.
 
-    Sent by league manager to all agents when a new round begins.
+    Sent by league manager to all agents when a new round begins. For targeted
+    announcements, matches holds only the recipient's matches and total_matches
+    gives the size of the whole round.
     """
     params = {
         Field.PROTOCOL: PROTOCOL_VERSION,
@@ -31,6 +34,8 @@ def build_round_announcement(
         Field.ROUND_ID: round_id,
         Field.MATCHES: matches,
     }
+    if total_matches is not None:
+        params[Field.TOTAL_MATCHES] = total_matches
     return wrap_jsonrpc_request(JSONRPCMethod.ROUND_ANNOUNCEMENT, params, agent_id="LM")
 
 
@@ -6,12 +6,13 @@ Handles loading JSON schemas from disk and caching them.
 import json
 import logging
 from pathlib import Path
-from typing import Dict
-
-from jsonschema import Draft7Validator, RefResolver
+from typing import TYPE_CHECKING, Dict
 
 from SHARED.contracts.exceptions import SchemaNotFoundError
 
+if TYPE_CHECKING:  # jsonschema is imported on first validation, not at import time
+    from jsonschema import Draft7Validator
+
 logger = logging.getLogger(__name__)
 
 # Schema directory path
@@ -21,7 +22,7 @@ SCHEMAS_DIR = Path(__file__).parent / "schemas"
 _schema_cache: Dict[str, dict] = {}
 
 # Cache for compiled validators
-_validator_cache: Dict[str, Draft7Validator] = {}
+_validator_cache: Dict[str, "Draft7Validator"] = {}
 
 # Message type to schema file mapping
 MESSAGE_TYPE_TO_SCHEMA = {
@@ -34,6 +35,7 @@ MESSAGE_TYPE_TO_SCHEMA = {
     "LEAGUE_ERROR": "league_error.schema.json",
     "LEAGUE_STATUS": "league_status.schema.json",
     "MATCH_RESULT_ACK": "match_result_ack.schema.json",
+    "MATCH_RESULT_BATCH_ACK": "match_result_batch_ack.schema.json",
     "RUN_MATCH": "run_match.schema.json",
     "SHUTDOWN_COMMAND": "shutdown_command.schema.json",
     # Registration
@@ -46,6 +48,7 @@ MESSAGE_TYPE_TO_SCHEMA = {
     "CHOOSE_PARITY_CALL": "choose_parity_call.schema.json",
     "GAME_OVER": "game_over.schema.json",
     "MATCH_RESULT_REPORT": "match_result_report.schema.json",
+    "MATCH_RESULT_BATCH": "match_result_batch.schema.json",
     "GAME_ERROR": "game_error.schema.json",
     "RUN_MATCH_ACK": "run_match_ack.schema.json",
     # Player source
@@ -85,7 +88,7 @@ def load_schema(schema_file: str) -> dict:
     return schema
 
 
-def get_validator(message_type: str) -> Draft7Validator:
+def get_validator(message_type: str) -> "Draft7Validator":
     """Get or create a validator for the given message type.
 
     Args:
@@ -105,6 +108,7 @@ def get_validator(message_type: str) -> Draft7Validator:
         raise SchemaNotFoundError(message_type)
 
     schema = load_schema(schema_file)
+    from jsonschema import Draft7Validator, RefResolver
 
     # Create resolver for $ref handling
     resolver = RefResolver(
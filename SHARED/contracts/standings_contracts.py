@@ -40,8 +40,15 @@ def build_league_standings_update(
     round_id: int,
     standings: List[Dict[str, Any]],
     conversation_id: Optional[str] = None,
+    update_mode: Optional[str] = None,
+    standings_version: Optional[int] = None,
+    base_version: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Build LEAGUE_STANDINGS_UPDATE message. Sent by LM to players after each round."""
+    """Build LEAGUE_STANDINGS_UPDATE message. Sent by LM to players after each round.
+
+    In StandingsMode.DELTA, standings holds only rows changed since base_version;
+    a full update (the default) holds every row.
+    """
     params = {
         Field.PROTOCOL: PROTOCOL_VERSION,
         Field.MESSAGE_TYPE: MessageType.LEAGUE_STANDINGS_UPDATE,
@@ -52,6 +59,12 @@ def build_league_standings_update(
         Field.ROUND_ID: round_id,
         Field.STANDINGS: standings,
     }
+    if update_mode is not None:
+        params[Field.UPDATE_MODE] = update_mode
+    if standings_version is not None:
+        params[Field.STANDINGS_VERSION] = standings_version
+    if base_version is not None:
+        params[Field.BASE_VERSION] = base_version
     return wrap_jsonrpc_request(JSONRPCMethod.LEAGUE_STANDINGS_UPDATE, params, agent_id="LM")
 
 
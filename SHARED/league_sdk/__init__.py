@@ -3,10 +3,19 @@
 from .agent_comm import get_transport, reset_transport, send, send_with_retry, set_transport
 from .config_loader import (
     load_agent_config,
+    load_agent_defaults,
     load_game_config,
     load_league_config,
     load_system_config,
 )
+from .config_service import (
+    ConfigService,
+    get_agent_config,
+    get_config_service,
+    get_league_config,
+    get_lm_endpoint,
+    get_system_config,
+)
 from .config_models import GameConfig, LeagueConfig, PlayerConfig, RefereeConfig, SystemConfig
 from .session_manager import (
     AgentType,
@@ -19,11 +28,12 @@ from .session_manager import (
 from .transport import (
     BaseTransport,
     HTTPTransport,
-    STDIOTransport,
     TransportType,
     create_transport,
     register_transport,
 )
+from .inprocess_transport import InProcessTransport
+from .stdio_transport import STDIOTransport
 
 __version__ = "1.0.0"
 __all__ = [
@@ -37,11 +47,20 @@ __all__ = [
     "load_system_config",
     "load_league_config",
     "load_agent_config",
+    "load_agent_defaults",
     "load_game_config",
+    # Cached config service
+    "ConfigService",
+    "get_config_service",
+    "get_system_config",
+    "get_agent_config",
+    "get_league_config",
+    "get_lm_endpoint",
     # Transport abstraction
     "BaseTransport",
     "HTTPTransport",
     "STDIOTransport",
+    "InProcessTransport",
     "TransportType",
     "create_transport",
     "register_transport",
@@ -0,0 +1,124 @@
+"""Runtime administration endpoints shared by every agent server.
+
+``GET /admin/logging`` returns the log policy of each agent hosted by the
+process; ``POST /admin/logging`` changes it without a restart, e.g.
+``{"agent_id": "P01", "debug_payloads": true}`` or ``{"min_level": "WARN"}``
+(no ``agent_id``: every hosted agent). ``GET /admin/transport`` returns the
+process's transport metrics and circuit breaker states.
+
+Profiling endpoints run a CPU session (``POST /admin/profile/start`` with
+``{"mode": "sampling"}`` or ``{"mode": "cprofile"}``, then ``/stop``) or
+tracemalloc (``POST /admin/memory/start``, ``/snapshot``, ``/stop``). They,
+and ``POST /admin/logging``, answer only loopback clients or requests
+carrying ``Authorization: Bearer $LEAGUE_ADMIN_TOKEN``.
+"""
+
+import hmac
+import os
+from typing import Any, Callable, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from SHARED.constants import (
+    ADMIN_LOGGING_PATH, ADMIN_MEMORY_PATH, ADMIN_PROFILE_PATH, ADMIN_TOKEN_ENV, ADMIN_TRANSPORT_PATH,
+)
+from SHARED.league_sdk.cpu_profiler import get_cpu_profiler
+from SHARED.league_sdk.log_policy import log_policies
+from SHARED.league_sdk.memory_profiler import get_memory_tracker
+from SHARED.league_sdk.profile_output import ProfilingError
+from SHARED.league_sdk.transport_metrics import transport_status
+
+_LOOPBACK = {"127.0.0.1", "::1", "localhost"}
+
+
+def _policy_view() -> Dict[str, Any]:
+    return {agent_id: policy.to_dict() for agent_id, policy in log_policies().items()}
+
+
+def _admin_allowed(request: Request) -> bool:
+    """Loopback clients, or anyone with the admin token when one is set."""
+    token = os.environ.get(ADMIN_TOKEN_ENV)
+    if token and hmac.compare_digest(request.headers.get("authorization", ""), f"Bearer {token}"):
+        return True
+    return request.client is not None and request.client.host in _LOOPBACK
+
+
+def _forbidden() -> JSONResponse:
+    return JSONResponse({"error": "Local-only without the admin token"}, status_code=403)
+
+
+async def _profiling(request: Request, action: Callable[..., Dict[str, Any]]) -> JSONResponse:
+    """Run a profiling action with the request's JSON body (if any) as keyword arguments."""
+    if not _admin_allowed(request):
+        return _forbidden()
+    try:
+        options = await request.json() if await request.body() else {}
+        return JSONResponse(action(**options))
+    except (TypeError, ValueError) as e:  # Malformed body, unknown or invalid option
+        return JSONResponse({"error": str(e)}, status_code=400)
+    except ProfilingError as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
+
+
+def add_admin_routes(app: FastAPI) -> None:
+    """Register the admin endpoints on an agent's FastAPI app."""
+
+    @app.get(ADMIN_LOGGING_PATH)
+    async def get_logging() -> Dict[str, Any]:
+        return _policy_view()
+
+    @app.post(ADMIN_LOGGING_PATH)
+    async def set_logging(request: Request) -> JSONResponse:
+        if not _admin_allowed(request):
+            return _forbidden()
+        try:
+            settings = await request.json()
+        except ValueError:
+            settings = None
+        if not isinstance(settings, dict):
+            return JSONResponse({"error": "Expected a JSON object"}, status_code=400)
+        agent_id = settings.pop("agent_id", None)
+        policies = log_policies()
+        if agent_id is not None:
+            if not isinstance(agent_id, str) or agent_id not in policies:
+                return JSONResponse({"error": f"Unknown agent: {agent_id}"}, status_code=404)
+            policies = {agent_id: policies[agent_id]}
+        try:
+            for policy in policies.values():
+                policy.configure(**settings)
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        return JSONResponse(_policy_view())
+
+    @app.get(ADMIN_TRANSPORT_PATH)
+    async def get_transport() -> Dict[str, Any]:
+        return transport_status()
+
+    @app.get(ADMIN_PROFILE_PATH)
+    async def profile_status(request: Request) -> JSONResponse:
+        return await _profiling(request, get_cpu_profiler().status)
+
+    @app.post(ADMIN_PROFILE_PATH + "/start")
+    async def profile_start(request: Request) -> JSONResponse:
+        return await _profiling(request, get_cpu_profiler().start)
+
+    @app.post(ADMIN_PROFILE_PATH + "/stop")
+    async def profile_stop(request: Request) -> JSONResponse:
+        return await _profiling(request, get_cpu_profiler().stop)
+
+    @app.get(ADMIN_MEMORY_PATH)
+    async def memory_status(request: Request) -> JSONResponse:
+        return await _profiling(request, get_memory_tracker().status)
+
+    @app.post(ADMIN_MEMORY_PATH + "/start")
+    async def memory_start(request: Request) -> JSONResponse:
+        return await _profiling(request, get_memory_tracker().start)
+
+    @app.post(ADMIN_MEMORY_PATH + "/snapshot")
+    async def memory_snapshot(request: Request) -> JSONResponse:
+        return await _profiling(request, get_memory_tracker().snapshot)
+
+    @app.post(ADMIN_MEMORY_PATH + "/stop")
+    async def memory_stop(request: Request) -> JSONResponse:
+        return await _profiling(request, get_memory_tracker().stop)
@@ -4,9 +4,11 @@ This module provides a high-level API for agent communication that abstracts
 away the transport mechanism. Agents should use this instead of http_client directly.
 """
 
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
-from SHARED.league_sdk.config_loader import load_system_config
+from SHARED.league_sdk.config_service import get_system_config
+from SHARED.league_sdk.tracing import client_span
 from SHARED.league_sdk.transport import (
     BaseTransport,
     HTTPTransport,
@@ -16,33 +18,42 @@ from SHARED.league_sdk.transport import (
 
 # Module-level transport instance (singleton pattern)
 _transport: Optional[BaseTransport] = None
-_system_config = None
 
 
 def get_transport() -> BaseTransport:
     """Get or create the global transport instance."""
-    global _transport, _system_config
+    global _transport
     if _transport is None:
-        _system_config = load_system_config()
+        system_config = get_system_config()
         # Transport type could be configurable via system config in future
-        transport_type = getattr(_system_config, "transport_type", TransportType.HTTP)
-        timeout = _system_config.timeouts.get("http_request", 30)
-        _transport = create_transport(transport_type, timeout=timeout)
+        transport_type = getattr(system_config, "transport_type", TransportType.HTTP)
+        kwargs = {}
+        if transport_type == TransportType.HTTP:
+            kwargs = dict(system_config.connection_pool)
+            kwargs["timeout"] = system_config.timeouts.get("http_request", 30)
+        _transport = create_transport(transport_type, **kwargs)
     return _transport
 
 
 def get_config():
-    """Get system config (lazy load)."""
-    global _system_config
-    if _system_config is None:
-        _system_config = load_system_config()
-    return _system_config
+    """Get system config (lazy, shared with every other module)."""
+    return get_system_config()
 
 
 async def send(endpoint: str, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Send a message via the configured transport."""
+    """Send a message via the configured transport (traced as a client span)."""
     transport = get_transport()
-    return await transport.send(endpoint, message)
+    with client_span(endpoint, message) as (traced, tags):
+        response = await transport.send(endpoint, traced)
+        tags["responded"] = response is not None
+        return response
+
+
+async def timed_send(endpoint: str, message: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Send a message; returns (response, round-trip latency in milliseconds)."""
+    started = time.perf_counter()
+    response = await send(endpoint, message)
+    return response, round(1000 * (time.perf_counter() - started), 3)
 
 
 async def send_with_retry(
@@ -62,7 +73,10 @@ async def send_with_retry(
     if retry_delay is None:
         retry_delay = config.retry_policy.get("retry_delay", 1)
 
-    return await transport.send_with_retry(endpoint, message, max_retries, retry_delay)
+    with client_span(endpoint, message) as (traced, tags):
+        response = await transport.send_with_retry(endpoint, traced, max_retries, retry_delay)
+        tags["responded"] = response is not None
+        return response
 
 
 def set_transport(transport: BaseTransport) -> None:
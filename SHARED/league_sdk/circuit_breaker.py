@@ -5,7 +5,10 @@ States: CLOSED (normal), OPEN (blocking), HALF_OPEN (testing)
 
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
+
+# Called as listener(endpoint, old_state, new_state) on every state change
+TransitionListener = Callable[[str, "CircuitState", "CircuitState"], None]
 
 
 class CircuitState(Enum):
@@ -19,8 +22,10 @@ class CircuitState(Enum):
 class CircuitBreaker:
     """Circuit breaker for a single endpoint."""
 
-    def __init__(self, failure_threshold: int = 5, reset_timeout: int = 60):
-        """Initialize with failure threshold and reset timeout (seconds)."""
+    def __init__(self, failure_threshold: int = 5, reset_timeout: int = 60, endpoint: str = "",
+                 listeners: Optional[List[TransitionListener]] = None):
+        """Initialize with failure threshold and reset timeout (seconds); listeners see transitions."""
+        self.endpoint, self._listeners = endpoint, listeners if listeners is not None else []
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
         self._failures = 0
@@ -32,10 +37,17 @@ class CircuitBreaker:
     def state(self) -> CircuitState:
         """Get current state, auto-transition OPEN->HALF_OPEN after timeout."""
         if self._state == CircuitState.OPEN and self._timeout_elapsed():
-            self._state = CircuitState.HALF_OPEN
+            self._transition(CircuitState.HALF_OPEN)
             self._half_open_calls = 0
         return self._state
 
+    def _transition(self, state: CircuitState) -> None:
+        """Change state, telling the listeners if it differs."""
+        old, self._state = self._state, state
+        if old is not state:
+            for listener in self._listeners:
+                listener(self.endpoint, old, state)
+
     @property
     def failures(self) -> int:
         """Get failure count."""
@@ -63,21 +75,21 @@ class CircuitBreaker:
         """Record success, reset to CLOSED."""
         self._failures = 0
         self._half_open_calls = 0
-        self._state = CircuitState.CLOSED
+        self._transition(CircuitState.CLOSED)
 
     def record_failure(self) -> None:
         """Record failure, may open circuit."""
         self._failures += 1
         self._last_failure_time = datetime.now()
         if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
-            self._state = CircuitState.OPEN
+            self._transition(CircuitState.OPEN)
 
     def reset(self) -> None:
         """Manual reset to CLOSED."""
         self._failures = 0
         self._half_open_calls = 0
         self._last_failure_time = None
-        self._state = CircuitState.CLOSED
+        self._transition(CircuitState.CLOSED)
 
     def get_status(self) -> Dict:
         """Get monitoring status."""
@@ -92,13 +104,19 @@ class CircuitBreakerRegistry:
         self._breakers: Dict[str, CircuitBreaker] = {}
         self._threshold = default_failure_threshold
         self._timeout = default_reset_timeout
+        self._listeners: List[TransitionListener] = []
 
     def get_breaker(self, endpoint: str) -> CircuitBreaker:
         """Get or create breaker for endpoint."""
         if endpoint not in self._breakers:
-            self._breakers[endpoint] = CircuitBreaker(self._threshold, self._timeout)
+            self._breakers[endpoint] = CircuitBreaker(self._threshold, self._timeout, endpoint, self._listeners)
         return self._breakers[endpoint]
 
+    def add_listener(self, listener: TransitionListener) -> None:
+        """Call listener(endpoint, old, new) on every breaker's state change (once per listener)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
     def can_execute(self, endpoint: str) -> bool:
         """Check if request to endpoint allowed."""
         return self.get_breaker(endpoint).can_execute()
@@ -33,6 +33,11 @@ def load_system_config(config_dir: Path = None) -> SystemConfig:
         active_league_id=data.get("active_league_id", ""),
         timeouts=data.get("timeouts", {}),
         retry_policy=data.get("retry_policy", {}),
+        connection_pool=data.get("connection_pool", {}),
+        logging=data.get("logging", {}),
+        tracing=data.get("tracing", {}),
+        metrics=data.get("metrics", {}),
+        profiling=data.get("profiling", {}),
     )
 
 
@@ -58,6 +63,10 @@ def load_league_config(league_id: str, config_dir: Path = None) -> LeagueConfig:
         scoring=data["scoring"],
         status=data.get("status", "ACTIVE"),
         participants=participants,
+        seed=data.get("seed"),
+        standings_snapshot_interval=data.get("standings_snapshot_interval", 5),
+        inter_round_delay_s=data.get("inter_round_delay_s", 2.0),
+        completion_grace_s=data.get("completion_grace_s", 3.0),
     )
 
 
@@ -70,6 +79,14 @@ def load_agent_config(config_dir: Path = None) -> Dict[str, Any]:
     return _load_json(config_path)
 
 
+def load_agent_defaults(agent_type: str, config_dir: Path = None) -> Dict[str, Any]:
+    """Load default settings for an agent type ("player" or "referee")."""
+    if config_dir is None:
+        config_dir = Path("SHARED/config/defaults")
+
+    return _load_json(config_dir / f"{agent_type}.json")
+
+
 def load_game_config(game_id: str, config_dir: Path = None) -> GameConfig:
     """Load game configuration."""
     if config_dir is None:
@@ -16,6 +16,11 @@ class SystemConfig:
     active_league_id: str = ""
     timeouts: Dict[str, int] = field(default_factory=dict)
     retry_policy: Dict[str, Any] = field(default_factory=dict)
+    connection_pool: Dict[str, Any] = field(default_factory=dict)
+    logging: Dict[str, Any] = field(default_factory=dict)
+    tracing: Dict[str, Any] = field(default_factory=dict)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    profiling: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -35,6 +40,10 @@ class LeagueConfig:
     scoring: Dict[str, int]
     status: str = "ACTIVE"
     participants: Optional[ParticipantsConfig] = None
+    seed: Optional[int] = None
+    standings_snapshot_interval: int = 5
+    inter_round_delay_s: float = 2.0
+    completion_grace_s: float = 3.0
 
 
 @dataclass
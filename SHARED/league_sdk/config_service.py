@@ -0,0 +1,99 @@
+"""Process-wide cached configuration service.
+
+Modules ask for configuration when they need it instead of parsing JSON at
+import time. Each file is parsed once per process and re-read only when its
+modification time changes, so every module shares the same parsed objects.
+Relative config paths are resolved against the working directory at call
+time, so a process that changes directory sees that directory's config.
+
+Returned objects are shared: treat them as read-only.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .config_loader import load_agent_config, load_agent_defaults, load_league_config, load_system_config
+from .config_models import LeagueConfig, SystemConfig
+
+
+class ConfigService:
+    """Lazily loaded, mtime-invalidated configuration cache."""
+
+    def __init__(self, root: Path = Path("SHARED/config")):
+        self.root = root
+        self._cache: Dict[str, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def system(self) -> SystemConfig:
+        return self._get(self.root / "system.json", lambda: load_system_config(self.root))
+
+    def agents(self) -> Dict[str, Any]:
+        agents_dir = self.root / "agents"
+        return self._get(agents_dir / "agents_config.json", lambda: load_agent_config(agents_dir))
+
+    def league(self, league_id: str) -> LeagueConfig:
+        leagues_dir = self.root / "leagues"
+        return self._get(leagues_dir / f"{league_id}.json", lambda: load_league_config(league_id, leagues_dir))
+
+    def agent_defaults(self, agent_type: str) -> Dict[str, Any]:
+        defaults_dir = self.root / "defaults"
+        return self._get(
+            defaults_dir / f"{agent_type}.json", lambda: load_agent_defaults(agent_type, defaults_dir)
+        )
+
+    def lm_endpoint(self) -> str:
+        """League Manager endpoint from agents_config.json."""
+        return self.agents()["league_manager"]["endpoint"]
+
+    def clear(self) -> None:
+        """Drop every cached file (the next access re-reads from disk)."""
+        with self._lock:
+            self._cache.clear()
+
+    def _get(self, path: Path, load: Callable[[], Any]) -> Any:
+        resolved = path.resolve()
+        try:
+            mtime = resolved.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = -1  # Let the loader raise its usual error
+        key = str(resolved)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        value = load()
+        with self._lock:
+            self._cache[key] = (mtime, value)
+        return value
+
+
+_service: Optional[ConfigService] = None
+
+
+def get_config_service() -> ConfigService:
+    """Get the process-wide config service."""
+    global _service
+    if _service is None:
+        _service = ConfigService()
+    return _service
+
+
+def get_system_config() -> SystemConfig:
+    return get_config_service().system()
+
+
+def get_agent_config() -> Dict[str, Any]:
+    return get_config_service().agents()
+
+
+def get_league_config(league_id: str) -> LeagueConfig:
+    return get_config_service().league(league_id)
+
+
+def get_agent_defaults(agent_type: str) -> Dict[str, Any]:
+    return get_config_service().agent_defaults(agent_type)
+
+
+def get_lm_endpoint() -> str:
+    return get_config_service().lm_endpoint()
@@ -0,0 +1,136 @@
+"""On-demand CPU profiling of a running agent process.
+
+Two modes, one session at a time per process:
+
+- ``cprofile``: deterministic cProfile of the event loop thread (where all
+  agent code runs), dumped as a ``.prof`` pstats file.
+- ``sampling``: a daemon thread samples every thread's stack each
+  ``interval_ms`` and writes collapsed stacks (``thread;outer;...;inner count``)
+  to a ``.folded`` file, ready for flamegraph.pl or speedscope. Overhead does
+  not depend on how much code runs, so it suits production-shaped load.
+
+Either way, stopping returns the file path and the top functions.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from SHARED.league_sdk.profile_output import ProfilingError, profile_path, profiling_settings
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Collapsed-stack sampler over all threads but its own."""
+
+    def __init__(self, interval_s: float):
+        self.interval_s, self.samples = interval_s, 0
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval_s):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame))
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+
+class CpuProfiler:
+    """The process's CPU profiling session."""
+
+    def __init__(self):
+        self.mode: Optional[str] = None
+        self._session: Any = None
+        self._started = 0.0
+
+    def status(self) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self._started if self.mode else 0.0
+        return {"running": self.mode is not None, "mode": self.mode, "elapsed_s": round(elapsed, 3)}
+
+    def start(self, mode: str = "sampling", interval_ms: Optional[float] = None) -> Dict[str, Any]:
+        """Start a session; call from the event loop thread (cProfile follows the calling thread)."""
+        if self.mode is not None:
+            raise ProfilingError(f"A {self.mode} session is already running")
+        if mode == "cprofile":
+            self._session = cProfile.Profile()
+            try:
+                self._session.enable()
+            except ValueError as e:  # Another profiler holds the thread
+                raise ProfilingError(str(e)) from e
+        elif mode == "sampling":
+            interval_ms = interval_ms or profiling_settings().get("sampling_interval_ms", 5)
+            if interval_ms <= 0:
+                raise ValueError("interval_ms must be positive")
+            self._session = StackSampler(interval_ms / 1000)
+            self._session.start()
+        else:
+            raise ProfilingError(f"Unknown mode: {mode} (cprofile or sampling)")
+        self.mode, self._started = mode, time.monotonic()
+        return self.status()
+
+    def stop(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """End the session, write its output file and return the top functions."""
+        if self.mode is None:
+            raise ProfilingError("No profiling session is running")
+        top = top or profiling_settings().get("top", 25)
+        session, mode, duration = self._session, self.mode, time.monotonic() - self._started
+        self.mode, self._session = None, None
+        result = {"mode": mode, "duration_s": round(duration, 3)}
+        if mode == "cprofile":
+            session.disable()
+            path = profile_path("cpu", ".prof")
+            session.dump_stats(path)
+            result["top"] = _top_functions(pstats.Stats(session), top)
+        else:
+            session.stop()
+            path = profile_path("cpu", ".folded")
+            path.write_text("".join(f"{stack} {count}\n" for stack, count in session.stacks.most_common()))
+            leaves = Counter()
+            for stack, count in session.stacks.items():
+                leaves[stack.rsplit(";", 1)[-1]] += count
+            result["samples"] = session.samples
+            result["top"] = [{"function": name, "samples": count} for name, count in leaves.most_common(top)]
+        result["file"] = str(path)
+        return result
+
+
+def _top_functions(stats: pstats.Stats, top: int) -> List[Dict[str, Any]]:
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+    return [
+        {"function": f"{func} ({Path(file).name}:{line})", "calls": calls, "own_s": round(own, 6), "cumulative_s": round(cum, 6)}
+        for (file, line, func), (_, calls, own, cum, _) in rows
+    ]
+
+
+_profiler = CpuProfiler()
+
+
+def get_cpu_profiler() -> CpuProfiler:
+    """The process-wide CPU profiler."""
+    return _profiler
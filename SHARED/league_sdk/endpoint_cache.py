@@ -55,6 +55,10 @@ class EndpointCache:
         """Get player endpoint by ID."""
         return self.player_endpoints.get(player_id)
 
+    def set_player(self, player_id: str, endpoint: str) -> None:
+        """Record a player endpoint pushed at runtime (e.g. by the League Manager)."""
+        self.player_endpoints[player_id] = endpoint
+
     def get_referee(self, referee_id: str) -> Optional[str]:
         """Get referee endpoint by ID."""
         return self.referee_endpoints.get(referee_id)
@@ -0,0 +1,91 @@
+"""Random access into gzip-compressed log segments.
+
+Reading a line in the middle of a gzip file normally means decompressing
+everything before it. The first read of a segment decompresses it once and
+keeps a copy of the zlib state every ``SEEK_POINT_SPACING`` uncompressed
+bytes; later reads resume from the nearest of these seek points. Seek points
+of the most recently read segments stay in memory, keyed by size and mtime
+(compressed segments never change once written).
+"""
+
+import bisect
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, List, Tuple
+
+SEEK_POINT_SPACING = 4 << 20  # Uncompressed bytes between seek points
+CACHED_SEGMENTS = 32
+_CHUNK = 1 << 16
+_GZIP_WBITS = 31  # zlib stream with a gzip header
+
+SeekPoint = Tuple[int, int, Any]  # (uncompressed offset, compressed offset, zlib state there)
+_cache: "OrderedDict[Tuple[str, int, int], List[SeekPoint]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _inflate(raw: IO[bytes], inflater: Any, consumed: int) -> Iterator[Tuple[bytes, int, Any]]:
+    """Yield (output, compressed bytes consumed, zlib state) per input chunk, across gzip members."""
+    while True:
+        chunk = raw.read(_CHUNK)
+        if not chunk:
+            return
+        consumed += len(chunk)
+        output = inflater.decompress(chunk)
+        while inflater.eof and inflater.unused_data:  # Next gzip member
+            rest, inflater = inflater.unused_data, zlib.decompressobj(_GZIP_WBITS)
+            output += inflater.decompress(rest)
+        yield output, consumed, inflater
+
+
+def _build(path: Path) -> List[SeekPoint]:
+    points: List[SeekPoint] = [(0, 0, zlib.decompressobj(_GZIP_WBITS))]
+    produced = 0
+    with open(path, "rb") as raw:
+        for output, consumed, inflater in _inflate(raw, zlib.decompressobj(_GZIP_WBITS), 0):
+            produced += len(output)
+            if produced - points[-1][0] >= SEEK_POINT_SPACING:
+                points.append((produced, consumed, inflater.copy()))
+    return points
+
+
+def seek_points(path: Path) -> List[SeekPoint]:
+    """Seek points of a segment, from the cache or built by one full decompression."""
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    points = _build(path)
+    with _cache_lock:
+        _cache[key] = points
+        while len(_cache) > CACHED_SEGMENTS:
+            _cache.popitem(last=False)
+    return points
+
+
+def read_lines(path: Path, offsets: Iterable[int]) -> List[Tuple[int, bytes]]:
+    """The lines starting at the given uncompressed offsets: [(offset, line)], in offset order."""
+    points = seek_points(path)
+    starts = [point[0] for point in points]
+    lines: List[Tuple[int, bytes]] = []
+    stream, start, buffer = None, 0, b""  # buffer holds uncompressed bytes from ``start``
+    with open(path, "rb") as raw:
+        for offset in sorted(offsets):
+            point = points[bisect.bisect_right(starts, offset) - 1]
+            if stream is None or start + len(buffer) < point[0]:  # Jump ahead to the seek point
+                raw.seek(point[1])
+                stream, start, buffer = _inflate(raw, point[2].copy(), point[1]), point[0], b""
+            while True:
+                cut = min(max(0, offset - start), len(buffer))  # Drop what lies before the line
+                start, buffer = start + cut, buffer[cut:]
+                if start == offset and b"\n" in buffer:
+                    break
+                output = next(stream, None)
+                if output is None:
+                    break
+                buffer += output[0]
+            lines.append((offset, buffer[: buffer.find(b"\n") + 1] or buffer))
+    return lines
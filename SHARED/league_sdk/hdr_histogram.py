@@ -0,0 +1,62 @@
+"""HDR-style log-linear histogram buckets over non-negative integers.
+
+Values below 64 are exact; larger ones fall into 32 buckets per power of
+two (at most ~3% relative error), so any latency from microseconds to hours
+costs a few hundred sparse buckets at most.
+"""
+
+from typing import Dict, Iterator, Tuple
+
+_SUB_BITS = 6
+_EXACT = 1 << _SUB_BITS  # Values below this get their own bucket
+_HALF = _EXACT >> 1
+
+
+def bucket_index(value: int) -> int:
+    """Bucket of a non-negative integer value."""
+    if value < _EXACT:
+        return max(value, 0)
+    shift = value.bit_length() - _SUB_BITS
+    return shift * _HALF + (value >> shift)
+
+
+def bucket_upper(index: int) -> int:
+    """Largest value that falls into a bucket."""
+    if index < _EXACT:
+        return index
+    shift = index // _HALF - 1
+    return ((index - shift * _HALF + 1) << shift) - 1
+
+
+class HdrCounts:
+    """Bucket counts, total count, sum and maximum of one label set (in us)."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count, self.total, self.max = 0, 0, 0
+
+    def record(self, value: int) -> None:
+        index = bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> int:
+        """Upper bound of the bucket holding the q-quantile (capped at the maximum)."""
+        wanted, seen = q * self.count, 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= wanted:
+                return min(bucket_upper(index), self.max)
+        return self.max
+
+    def cumulative(self) -> Iterator[Tuple[int, int]]:
+        """(bucket upper bound, count of values up to it), ascending."""
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            yield bucket_upper(index), seen
@@ -0,0 +1,106 @@
+"""Server metrics and the Prometheus ``/metrics`` endpoint of every agent and the API.
+
+``add_metrics(app, agent_id)`` installs MetricsMiddleware, which counts requests per
+route, message type and status, times them into an HDR histogram and tracks
+requests in flight. It is plain ASGI, so the body is not buffered again: the
+message type is picked out of the raw body with a regex instead of a second
+JSON parse (``-`` for requests without one, such as the REST API). The app
+also starts the event loop lag monitor (with the blocking-call watchdog when
+enabled, reporting under the given agent ID), and ``GET /metrics`` renders the
+process-wide registry: these metrics, transport metrics, the log writer
+backlog and whatever agent state gauges the process registered.
+"""
+
+import re
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+
+from SHARED.constants import METRICS_PATH
+from SHARED.league_sdk.config_service import get_system_config
+from SHARED.league_sdk.log_writer import get_log_writer
+from SHARED.league_sdk.loop_lag import (
+    DEFAULT_INTERVAL_S, configured_interval_s, ensure_loop_lag_monitor, stop_loop_lag_monitor,
+)
+from SHARED.league_sdk.loop_watchdog import BlockingWatchdog, create_watchdog
+from SHARED.league_sdk.metrics import get_metrics_registry
+from SHARED.league_sdk.prometheus_text import CONTENT_TYPE, render
+
+NO_MESSAGE_TYPE = "-"
+_MESSAGE_TYPE = re.compile(rb'"message_type"\s*:\s*"([A-Za-z0-9_]+)"')
+
+_registry = get_metrics_registry()
+requests_total = _registry.counter(
+    "http_requests_total", "Requests handled", ("route", "message_type", "status")
+)
+request_seconds = _registry.histogram("http_request_seconds", "Request latency", ("route", "message_type"))
+in_flight = _registry.gauge("http_requests_in_flight", "Requests being handled")
+_registry.gauge("log_write_backlog", "Log lines waiting for the writer thread").set_function(
+    (), lambda: get_log_writer().backlog
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording every HTTP request; starts the loop lag monitor."""
+
+    def __init__(self, app: Callable, loop_lag_interval_s: float = DEFAULT_INTERVAL_S,
+                 watchdog: Optional[BlockingWatchdog] = None):
+        self.app, self.loop_lag_interval_s, self.watchdog = app, loop_lag_interval_s, watchdog
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            return await self.app(scope, self._lifespan(receive), send)
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        ensure_loop_lag_monitor(self.loop_lag_interval_s, self.watchdog)
+        message_type, status = NO_MESSAGE_TYPE, 500
+
+        async def receive_body() -> Dict[str, Any]:
+            nonlocal message_type
+            message = await receive()
+            if message_type == NO_MESSAGE_TYPE and message["type"] == "http.request":
+                found = _MESSAGE_TYPE.search(message.get("body", b""))
+                message_type = found.group(1).decode() if found else message_type
+            return message
+
+        async def send_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight.inc(())
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_body, send_status)
+        finally:
+            in_flight.inc((), -1)
+            labels = (getattr(scope.get("route"), "path", "unmatched"), message_type)
+            request_seconds.observe(labels, time.perf_counter() - start)
+            requests_total.inc(labels + (str(status),))
+
+    def _lifespan(self, receive: Callable) -> Callable:
+        async def receive_lifespan() -> Dict[str, Any]:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                ensure_loop_lag_monitor(self.loop_lag_interval_s, self.watchdog)
+            elif message["type"] == "lifespan.shutdown":
+                stop_loop_lag_monitor()
+            return message
+        return receive_lifespan
+
+
+def add_metrics(app: FastAPI, agent_id: str) -> None:
+    """Install the metrics middleware and ``GET /metrics`` (unless metrics.enabled is false)."""
+    settings = get_system_config().metrics
+    if not settings.get("enabled", True):
+        return
+    app.add_middleware(
+        MetricsMiddleware, loop_lag_interval_s=configured_interval_s(), watchdog=create_watchdog(agent_id)
+    )
+
+    @app.get(METRICS_PATH, include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(render(), media_type=CONTENT_TYPE)
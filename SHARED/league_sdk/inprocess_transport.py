@@ -0,0 +1,81 @@
+"""In-process transport: delivers messages straight to agent handlers.
+
+Used when the league manager, referees and players share one event loop.
+Each agent registers a handler for its endpoint; sending to that endpoint
+awaits the handler directly, with no HTTP and no JSON encoding. In debug
+mode every message and response is round-tripped through JSON, so anything
+that would not survive the wire fails loudly, and receivers never share
+objects with senders. Attempts and retries are counted like HTTP ones (see
+transport_metrics), without byte counts.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from SHARED.league_sdk.transport import BaseTransport, TransportType, register_transport
+from SHARED.league_sdk.transport_metrics import NO_HANDLER, OK, error_kind, record_attempt, record_retry
+
+MessageHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class InProcessTransport(BaseTransport):
+    """Endpoint -> handler dispatch within one process."""
+
+    def __init__(self, debug: bool = False, **_ignored: Any):
+        # Accepts (and ignores) HTTP options such as timeout, for create_transport
+        self.debug = debug
+        self._handlers: Dict[str, MessageHandler] = {}
+
+    def register_endpoint(self, endpoint: str, handler: MessageHandler) -> None:
+        """Route messages sent to an endpoint to a handler."""
+        self._handlers[endpoint] = handler
+
+    def unregister_endpoint(self, endpoint: str) -> None:
+        self._handlers.pop(endpoint, None)
+
+    async def probe(self, endpoint: str) -> bool:
+        """Readiness probe: an endpoint is ready once its handler is registered."""
+        return endpoint in self._handlers
+
+    async def send(self, endpoint: str, message: Dict[str, Any]) -> Optional[Dict]:
+        """Deliver a message; None if nobody listens or the handler fails (like HTTP)."""
+        handler = self._handlers.get(endpoint)
+        if handler is None:
+            record_attempt(endpoint, message, 0.0, NO_HANDLER)
+            return None
+        if self.debug:
+            message = _round_trip(message)
+        outcome, start = OK, time.perf_counter()
+        try:
+            response = await handler(message)
+        except Exception as e:
+            outcome = error_kind(e)
+            return None
+        finally:
+            record_attempt(endpoint, message, time.perf_counter() - start, outcome)
+        return _round_trip(response) if self.debug and response is not None else response
+
+    async def send_with_retry(
+        self, endpoint: str, message: Dict[str, Any],
+        max_retries: int = 3, retry_delay: float = 1.0, use_circuit_breaker: bool = False
+    ) -> Optional[Dict]:
+        """Send with retry (no circuit breaker: a missing handler will not appear later)."""
+        for attempt in range(max_retries):
+            if attempt:
+                record_retry(endpoint, message)
+            result = await self.send(endpoint, message)
+            if result is not None:
+                return result
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay * (attempt + 1))
+        return None
+
+
+def _round_trip(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize and parse a message; raises TypeError if it is not JSON-safe."""
+    return json.loads(json.dumps(message))
+
+
+register_transport(TransportType.IN_PROCESS, InProcessTransport)
@@ -0,0 +1,150 @@
+"""Per-phase match latencies from referee logs.
+
+Streams the agent logs (active files, rotated and gzipped segments) line by
+line and keeps only the match phase events, which are found with a regular
+expression before any JSON is parsed. Consecutive events of one match give
+its phase latencies:
+
+    join     STARTING_MATCH -> last PLAYER_JOINED
+    choices  last PLAYER_JOINED -> last CHOICE_RECEIVED
+    decide   last CHOICE_RECEIVED -> WINNER_DETERMINED
+    notify   WINNER_DETERMINED -> GAME_OVER_SENT
+    report   GAME_OVER_SENT -> MATCH_RESULT_REPORT_SENT (or the batch carrying it)
+    match    STARTING_MATCH -> report sent
+
+plus each player's round trips (``player_join``, ``player_choice``) from the
+``latency_ms`` of PLAYER_JOINED and CHOICE_RECEIVED. Latencies are counted
+per referee, round and overall (round trips also per player) into
+LatencyHistograms a batch at a time, so memory is bounded by the matches in
+flight and the number of groups, not by the size of the logs.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from SHARED.constants import LATENCY_FIELD, Field, PhaseEvent
+from SHARED.league_sdk.latency_histogram import LatencyHistograms
+from SHARED.league_sdk.log_index import DEFAULT_LOG_DIR
+from SHARED.league_sdk.log_scan import log_files, open_log
+
+BATCH_EVENTS = 50_000
+
+# Marks of a match in order, and the phase that ends at each of them
+_MARKS = [
+    (PhaseEvent.STARTING_MATCH, None),
+    (PhaseEvent.PLAYER_JOINED, "join"),
+    (PhaseEvent.CHOICE_RECEIVED, "choices"),
+    (PhaseEvent.WINNER_DETERMINED, "decide"),
+    (PhaseEvent.GAME_OVER_SENT, "notify"),
+    (PhaseEvent.MATCH_RESULT_REPORT_SENT, "report"),
+]
+_REPORTED = {PhaseEvent.MATCH_RESULT_REPORT_SENT, PhaseEvent.MATCH_RESULT_BATCH_SENT}
+_PLAYER_PHASES = {PhaseEvent.PLAYER_JOINED: "player_join", PhaseEvent.CHOICE_RECEIVED: "player_choice"}
+_EVENTS = {event for event, _ in _MARKS} | _REPORTED
+_HEAD_PATTERN = re.compile(rb'^\{"timestamp": "([^"]*)", "level": "\w+", "agent_id": "([^"]*)", "event_type": "(\w+)"')
+_ROUND_PATTERN = re.compile(r"^R(\d+)M")
+
+Event = Tuple[str, str, str, dict]  # (timestamp, agent_id, event_type, data)
+
+
+def phase_events(paths: Iterable[Path]) -> Iterable[Event]:
+    """Stream the phase events of the given files, parsing only their lines."""
+    for path in paths:
+        with open_log(path) as handle:
+            for line in handle:
+                head = _HEAD_PATTERN.match(line)
+                if head and head.group(3).decode() in _EVENTS:
+                    timestamp, agent_id, event_type = (part.decode() for part in head.groups())
+                    yield timestamp, agent_id, event_type, json.loads(line).get("data") or {}
+
+
+class PhaseLatencyAnalyzer:
+    """Turns a stream of phase events into latency histograms."""
+
+    def __init__(self, batch_events: int = BATCH_EVENTS):
+        self.histograms = LatencyHistograms()
+        self.batch_events = batch_events
+        self._open: Dict[Tuple[str, str], Dict[str, float]] = {}  # (referee, match_id) -> marks
+        self._samples: List[Tuple[str, str, str, float]] = []
+
+    def feed(self, events: Iterable[Event]) -> None:
+        batch: List[Event] = []
+        for event in events:
+            batch.append(event)
+            if len(batch) >= self.batch_events:
+                self._process(batch)
+                batch = []
+        self._process(batch)
+
+    def finish(self) -> pd.DataFrame:
+        """Count matches never reported (phases seen so far) and return the summary."""
+        for (referee_id, match_id), marks in list(self._open.items()):
+            self._close(referee_id, match_id, marks)
+        self._flush()
+        return self.histograms.summary()
+
+    def _process(self, batch: List[Event]) -> None:
+        if not batch:
+            return
+        stamps = pd.to_datetime([e[0] for e in batch], format="ISO8601", utc=True, errors="coerce")
+        millis = stamps.as_unit("ms").asi8.astype(float)  # One vectorized parse per batch
+        for (_, referee_id, event_type, data), at, missing in zip(batch, millis, stamps.isna()):
+            if not missing:
+                self._on_event(referee_id, event_type, data, at)
+        self._flush()
+
+    def _on_event(self, referee_id: str, event_type: str, data: dict, at: float) -> None:
+        if event_type == PhaseEvent.MATCH_RESULT_BATCH_SENT:
+            for match_id in data.get("match_ids") or []:
+                self._on_event(referee_id, PhaseEvent.MATCH_RESULT_REPORT_SENT, {Field.MATCH_ID: match_id}, at)
+            return
+        key = (referee_id, str(data.get(Field.MATCH_ID)))
+        if event_type == PhaseEvent.STARTING_MATCH:
+            if key in self._open:  # Same match id restarted (a new league run)
+                self._close(*key, self._open.pop(key))
+            self._open[key] = {}
+        marks = self._open.get(key)
+        if marks is None:
+            return  # Its start is not in the logs (e.g. pruned segment)
+        marks[event_type] = at
+        if event_type in _PLAYER_PHASES and data.get(LATENCY_FIELD) is not None:
+            self._sample(_PLAYER_PHASES[event_type], key, float(data[LATENCY_FIELD]), data.get(Field.PLAYER_ID))
+        if event_type in _REPORTED:
+            self._close(*key, self._open.pop(key))
+
+    def _close(self, referee_id: str, match_id: str, marks: Dict[str, float]) -> None:
+        previous = marks.get(PhaseEvent.STARTING_MATCH)
+        for event, phase in _MARKS[1:]:
+            at = marks.get(event)
+            if at is not None and previous is not None:
+                self._sample(phase, (referee_id, match_id), at - previous)
+            previous = previous if at is None else at
+        reported = marks.get(PhaseEvent.MATCH_RESULT_REPORT_SENT)
+        if reported is not None and PhaseEvent.STARTING_MATCH in marks:
+            self._sample("match", (referee_id, match_id), reported - marks[PhaseEvent.STARTING_MATCH])
+
+    def _sample(self, phase: str, key: Tuple[str, str], ms: float, player_id: Optional[str] = None) -> None:
+        referee_id, match_id = key
+        found = _ROUND_PATTERN.match(match_id)
+        self._samples.extend([
+            (phase, "all", "all", ms),
+            (phase, "referee", referee_id, ms),
+            (phase, "round", found.group(1) if found else "unknown", ms),
+        ])
+        if player_id:
+            self._samples.append((phase, "player", player_id, ms))
+
+    def _flush(self) -> None:
+        self.histograms.add(pd.DataFrame(self._samples, columns=["phase", "dimension", "key", "ms"]))
+        self._samples = []
+
+
+def analyze_logs(log_dir: Path = DEFAULT_LOG_DIR, batch_events: int = BATCH_EVENTS) -> pd.DataFrame:
+    """Latency summary (see LatencyHistograms.summary) of every log in ``log_dir``."""
+    analyzer = PhaseLatencyAnalyzer(batch_events)
+    analyzer.feed(phase_events(log_files(log_dir)))
+    return analyzer.finish()
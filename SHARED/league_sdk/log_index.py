@@ -0,0 +1,125 @@
+"""On-disk index of agent logs by match, round and conversation.
+
+Maps every ``match_id``, ``round_id`` and ``conversation_id`` found in the
+agent logs (active files, rotated and gzipped segments) to the files and
+byte offsets of the entries that mention it, in a SQLite database. Updates
+are incremental: only bytes appended since the last update are scanned,
+rotated-away and deleted files are dropped, and new segments are indexed
+once. A timeline query then reads only the matching lines. Updates are
+serialized: within the process by a lock, across processes by taking the
+database's write lock before the files table is read.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from SHARED.constants import Field
+from SHARED.league_sdk.log_scan import KEY_KINDS, is_compressed, line_keys, log_files, open_log, read_entries, scan_lines
+
+DEFAULT_LOG_DIR = Path("SHARED/logs/agents")
+DEFAULT_INDEX_PATH = Path("SHARED/logs/log_index.sqlite3")
+_HEAD_BYTES = 256  # Start of a file, to notice it was replaced by rotation
+_update_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL,
+    indexed_bytes INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, head BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keys (
+    kind INTEGER NOT NULL, value TEXT NOT NULL, timestamp TEXT NOT NULL,
+    file_id INTEGER NOT NULL, offset INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS keys_by_value ON keys (kind, value, timestamp);
+CREATE INDEX IF NOT EXISTS keys_by_file ON keys (file_id);
+"""
+
+
+class LogIndex:
+    """Incrementally maintained index over every log file in a directory."""
+
+    def __init__(self, log_dir: Path = DEFAULT_LOG_DIR, index_path: Path = DEFAULT_INDEX_PATH):
+        self.log_dir = Path(log_dir)
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(index_path))
+        self._db.executescript(_SCHEMA)
+
+    def update(self) -> Dict[str, int]:
+        """Index new log data; returns counts of scanned files, lines and dropped files."""
+        stats = {"files": 0, "lines": 0, "dropped": 0}
+        with _update_lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")  # Another process updating: wait, then see its rows
+            present = {str(p): p for p in log_files(self.log_dir)}
+            for file_id, path in self._db.execute("SELECT id, path FROM files").fetchall():
+                if path not in present:
+                    self._drop(file_id)
+                    stats["dropped"] += 1
+            for path in present.values():
+                lines = self._index_file(path)
+                stats["files"] += lines > 0
+                stats["lines"] += lines
+        return stats
+
+    def timeline(self, match_id: Optional[str] = None, round_id: Optional[Any] = None,
+                 conversation_id: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Entries of every agent mentioning all the given keys, in time order."""
+        wanted = [(KEY_KINDS[name], str(value)) for name, value in (
+            (Field.MATCH_ID, match_id), (Field.ROUND_ID, round_id), (Field.CONVERSATION_ID, conversation_id),
+        ) if value is not None]
+        if not wanted:
+            raise ValueError("timeline() needs a match_id, round_id or conversation_id")
+        query = " INTERSECT ".join(
+            ["SELECT file_id, offset, timestamp FROM keys WHERE kind = ? AND value = ?"] * len(wanted)
+        ) + " ORDER BY timestamp, file_id, offset" + (f" LIMIT {int(limit)}" if limit else "")
+        rows = self._db.execute(query, [part for pair in wanted for part in pair]).fetchall()
+        by_file: Dict[int, List[int]] = {}
+        for file_id, offset, _ in rows:
+            by_file.setdefault(file_id, []).append(offset)
+        paths = dict(self._db.execute("SELECT id, path FROM files").fetchall())
+        entries = {}
+        for file_id, offsets in by_file.items():
+            for offset, entry in read_entries(Path(paths[file_id]), offsets):
+                entries[(file_id, offset)] = entry
+        return [entries[(file_id, offset)] for file_id, offset, _ in rows]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _index_file(self, path: Path) -> int:
+        stat = path.stat()
+        row = self._db.execute(
+            "SELECT id, indexed_bytes, mtime_ns, head FROM files WHERE path = ?", (str(path),)
+        ).fetchone()
+        with open_log(path) as handle:
+            head = handle.read(_HEAD_BYTES)
+            if row is not None:
+                file_id, offset, mtime_ns, old_head = row
+                if is_compressed(path) and mtime_ns == stat.st_mtime_ns:
+                    return 0  # Compressed segments never change
+                if not is_compressed(path) and (stat.st_size < offset or head[: len(old_head)] != old_head):
+                    self._drop(file_id)  # Replaced (e.g. rotated): index from scratch
+                    row = None
+            if row is None:
+                file_id = self._db.execute(
+                    "INSERT INTO files (path, indexed_bytes, mtime_ns, head) VALUES (?, 0, 0, ?)",
+                    (str(path), head),
+                ).lastrowid
+                offset = 0
+            rows, lines = [], 0
+            for line_offset, line in scan_lines(handle, offset):
+                timestamp, keys = line_keys(line)
+                rows.extend((kind, value, timestamp, file_id, line_offset) for kind, value in keys)
+                offset, lines = line_offset + len(line), lines + 1
+        self._db.executemany("INSERT INTO keys VALUES (?, ?, ?, ?, ?)", rows)
+        self._db.execute(
+            "UPDATE files SET indexed_bytes = ?, mtime_ns = ?, head = ? WHERE id = ?",
+            (offset, stat.st_mtime_ns, head, file_id),
+        )
+        return lines
+
+    def _drop(self, file_id: int) -> None:
+        self._db.execute("DELETE FROM keys WHERE file_id = ?", (file_id,))
+        self._db.execute("DELETE FROM files WHERE id = ?", (file_id,))
@@ -0,0 +1,141 @@
+"""Per-agent log filtering: level threshold, sampling and payload caps.
+
+Every LeagueLogger of an agent shares one LogPolicy, created from the
+``logging`` section of system.json (the agent's defaults file may override
+the level). Entries below the minimum level are dropped, event types can be
+sampled (e.g. only 10% of RECEIVED), and payloads larger than
+``max_payload_bytes`` are replaced by their size and hash, optionally with a
+truncated preview. Turning on ``debug_payloads`` - e.g. at runtime through
+the admin endpoint - logs every entry with its full payload again.
+"""
+
+import hashlib
+import json
+import random
+import threading
+from typing import Any, Dict, Optional
+
+from SHARED.constants import PayloadMode
+from SHARED.league_sdk.config_service import get_system_config
+
+_LEVEL_RANK = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+_PAYLOAD_KEYS = ("data", "details", "context")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_VALID = {  # Checked before any field changes, so a bad update never breaks logging
+    "min_level": lambda v: isinstance(v, str) and v in _LEVEL_RANK,
+    "sample_rates": lambda v: isinstance(v, dict) and all(
+        isinstance(k, str) and _is_number(r) and 0 <= r <= 1 for k, r in v.items()
+    ),
+    "max_payload_bytes": lambda v: v is None or (isinstance(v, int) and not isinstance(v, bool) and v >= 0),
+    "oversized_payloads": lambda v: v in (PayloadMode.TRUNCATE, PayloadMode.HASH),
+    "debug_payloads": lambda v: isinstance(v, bool),
+}
+
+
+class LogPolicy:
+    """Decides which entries an agent logs and how large their payloads may be."""
+
+    _FIELDS = ("min_level", "sample_rates", "max_payload_bytes", "oversized_payloads", "debug_payloads")
+
+    def __init__(
+        self, min_level: str = "INFO", sample_rates: Optional[Dict[str, float]] = None,
+        max_payload_bytes: Optional[int] = None, oversized_payloads: str = PayloadMode.TRUNCATE,
+        debug_payloads: bool = False, rng: Optional[random.Random] = None,
+    ):
+        self.configure(
+            min_level=min_level, sample_rates=sample_rates or {}, max_payload_bytes=max_payload_bytes,
+            oversized_payloads=oversized_payloads, debug_payloads=debug_payloads,
+        )
+        self._rng = rng or random.Random()
+
+    def configure(self, **settings: Any) -> None:
+        """Update policy fields; raises ValueError for unknown fields or invalid values."""
+        unknown = set(settings) - set(self._FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown logging settings: {sorted(unknown)}")
+        for name, value in settings.items():
+            if not _VALID[name](value):
+                raise ValueError(f"Invalid {name}: {value!r}")
+        for name, value in settings.items():
+            setattr(self, name, value)
+
+    def set_level(self, level: Optional[str]) -> None:
+        """Set the minimum level (None keeps the current one)."""
+        if level is not None:
+            self.configure(min_level=level)
+
+    def allows(self, level: str, event_type: str) -> bool:
+        """Whether an entry of this level and event type is logged."""
+        if _LEVEL_RANK.get(level, 0) < _LEVEL_RANK[self.min_level]:
+            return False
+        if self.debug_payloads or level == "ERROR":
+            return True
+        rate = self.sample_rates.get(event_type, 1.0)
+        return rate >= 1.0 or self._rng.random() < rate
+
+    def cap(self, entry: Dict[str, Any], line: str) -> str:
+        """Return the serialized entry, re-serialized with oversized payloads shrunk."""
+        limit = self.max_payload_bytes
+        if self.debug_payloads or not limit or len(line) <= limit:
+            return line
+        shrunk = dict(entry)
+        for key in _PAYLOAD_KEYS:
+            if key in entry:
+                payload = json.dumps(entry[key])
+                if len(payload) > limit:
+                    shrunk[key] = self._summarize(payload, limit)
+        return json.dumps(shrunk)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    def _summarize(self, payload: str, limit: int) -> Dict[str, Any]:
+        summary = {
+            "oversized": True,
+            "bytes": len(payload),
+            "sha256": hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+        }
+        if self.oversized_payloads == PayloadMode.TRUNCATE:
+            summary["preview"] = payload[:limit]
+        return summary
+
+
+_policies: Dict[str, LogPolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def logging_settings() -> Dict[str, Any]:
+    """The system.json logging section ({} if there is no usable system.json)."""
+    try:
+        return get_system_config().logging
+    except (OSError, KeyError, ValueError):
+        return {}
+
+
+def get_log_policy(agent_id: str) -> LogPolicy:
+    """Get the log policy shared by every logger of an agent."""
+    with _policies_lock:
+        policy = _policies.get(agent_id)
+        if policy is None:
+            settings = logging_settings()
+            policy = _policies[agent_id] = LogPolicy(
+                **{name: settings[name] for name in LogPolicy._FIELDS if name in settings}
+            )
+        return policy
+
+
+def log_policies() -> Dict[str, LogPolicy]:
+    """Policies of every agent that has logged in this process."""
+    with _policies_lock:
+        return dict(_policies)
+
+
+def reset_log_policies() -> None:
+    """Forget every policy (testing)."""
+    with _policies_lock:
+        _policies.clear()
@@ -0,0 +1,68 @@
+"""Compression and retention of rotated agent log segments.
+
+Rotated segments (see log_rotation) are gzipped on a background thread so
+the log writer never blocks on compression. Afterwards the oldest segments
+beyond ``max_segments``, or older than ``retention_days``, are deleted.
+"""
+
+import gzip
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from SHARED.league_sdk.log_rotation import (
+    GZIP_SUFFIX,
+    PARTIAL_SUFFIX,
+    RotationPolicy,
+    rotated_segments,
+    segment_start,
+)
+
+
+def compress_segment(segment: Path) -> Path:
+    """Gzip a rotated segment (written aside first, so a crash never leaves a partial .gz)."""
+    target = segment.with_name(segment.name + GZIP_SUFFIX)
+    partial = segment.with_name(target.name + PARTIAL_SUFFIX)
+    with open(segment, "rb") as src, gzip.open(partial, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.replace(partial, target)
+    segment.unlink()
+    return target
+
+
+class SegmentMaintainer:
+    """Compresses rotated segments and enforces retention on a background thread."""
+
+    def __init__(self, policy: RotationPolicy):
+        self.policy = policy
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, path: Path) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="league-log-maintenance")
+        try:
+            self._executor.submit(self.maintain, path)
+        except RuntimeError:  # Interpreter shutdown (atexit close): no new threads, so maintain inline
+            self.maintain(path)
+
+    def maintain(self, path: Path) -> None:
+        """Compress pending segments of a log, then delete the ones past retention."""
+        segments = rotated_segments(path)
+        if self.policy.compress:
+            segments = [p if p.name.endswith(GZIP_SUFFIX) else compress_segment(p) for p in segments]
+        expired = []
+        if self.policy.max_segments is not None:
+            expired += segments[: max(0, len(segments) - self.policy.max_segments)]
+        if self.policy.retention_days is not None:
+            cutoff = time.time() - self.policy.retention_days * 86400
+            expired += [p for p in segments if segment_start(p) < cutoff]
+        for segment in set(expired):
+            segment.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
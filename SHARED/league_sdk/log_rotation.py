@@ -0,0 +1,118 @@
+"""Size- and time-based rotation of JSONL agent logs.
+
+The active file keeps its name (``P01.log.jsonl``). Once it grows past
+``max_bytes`` or is older than ``max_age_s`` it is renamed after the UTC
+time of its first entry (``P01.20261019T164240627Z.log.jsonl``, so segment
+names sort by time) and a new file is started. Compression and retention of
+rotated segments live in log_retention.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_STAMP_FORMAT = "%Y%m%dT%H%M%S"
+GZIP_SUFFIX = ".gz"
+PARTIAL_SUFFIX = ".part"  # Compression in progress
+
+
+@dataclass
+class RotationPolicy:
+    """Rotation and retention settings (system.json logging.rotation); None disables a limit."""
+
+    max_bytes: Optional[int] = None
+    max_age_s: Optional[float] = None
+    compress: bool = True
+    max_segments: Optional[int] = None
+    retention_days: Optional[float] = None
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "RotationPolicy":
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in settings.items() if key in names})
+
+
+def _split_name(path: Path):
+    """'P01.log.jsonl' -> ('P01', '.log.jsonl')."""
+    base, _, suffix = path.name.partition(".")
+    return base, "." + suffix
+
+
+def segment_path(path: Path, started: float) -> Path:
+    """Name of the segment of ``path`` whose first entry was logged at ``started``."""
+    base, suffix = _split_name(path)
+    moment = datetime.fromtimestamp(started, timezone.utc)
+    stamp = moment.strftime(_STAMP_FORMAT) + f"{moment.microsecond // 1000:03d}Z"
+    return path.with_name(f"{base}.{stamp}{suffix}")
+
+
+def segment_start(segment: Path) -> Optional[float]:
+    """UTC start time encoded in a rotated segment's name (None if not a segment)."""
+    stamp = segment.name.split(".")[1] if segment.name.count(".") >= 3 else ""
+    try:
+        moment = datetime.strptime(stamp[:-4], _STAMP_FORMAT).replace(tzinfo=timezone.utc)
+        return moment.timestamp() + int(stamp[-4:-1]) / 1000
+    except ValueError:
+        return None
+
+
+def rotated_segments(path: Path) -> List[Path]:
+    """Rotated segments of an active log file, oldest first."""
+    base, suffix = _split_name(path)
+    candidates = path.parent.glob(f"{base}.*{suffix}*")
+    return sorted(
+        p for p in candidates if p != path and not p.name.endswith(PARTIAL_SUFFIX) and segment_start(p) is not None
+    )
+
+
+def _first_entry_time(path: Path) -> float:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            timestamp = json.loads(f.readline())["timestamp"]
+        return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc).timestamp()
+    except (OSError, ValueError, KeyError, TypeError):
+        return os.path.getmtime(path)
+
+
+class LogSegment:
+    """The active, append-mode file of one log."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = open(path, "a", encoding="utf-8")
+        self.size = self.handle.tell()
+        self.started = _first_entry_time(path) if self.size else time.time()
+
+    def write(self, line: str) -> None:
+        self.handle.write(line)
+        self.size += len(line)  # Entries are ASCII JSON: characters == bytes
+
+    def flush(self, fsync: bool = False) -> None:
+        self.handle.flush()
+        if fsync:
+            os.fsync(self.handle.fileno())
+
+    def due(self, policy: RotationPolicy) -> bool:
+        """Whether the segment has reached its size or age limit."""
+        too_big = policy.max_bytes is not None and self.size >= policy.max_bytes
+        too_old = policy.max_age_s is not None and time.time() - self.started >= policy.max_age_s
+        return self.size > 0 and (too_big or too_old)
+
+    def rotate(self) -> Path:
+        """Close the file and rename it to its time-stamped segment name."""
+        self.handle.close()
+        started = self.started
+        target = segment_path(self.path, started)
+        while target.exists() or target.with_name(target.name + GZIP_SUFFIX).exists():
+            started += 0.001
+            target = segment_path(self.path, started)
+        os.replace(self.path, target)
+        return target
+
+    def close(self) -> None:
+        self.handle.close()
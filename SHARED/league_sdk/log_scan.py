@@ -0,0 +1,78 @@
+"""Low-level reading of JSONL agent logs for the log index.
+
+Correlation keys are pulled out of each raw line with a regular expression
+instead of parsing the JSON, which keeps indexing multi-GB logs cheap. The
+keys are found at any nesting depth, e.g. inside a logged RECEIVED payload.
+Plain and gzip-compressed segments are read the same way; offsets always
+refer to the uncompressed stream. Reads from compressed segments resume from
+cached seek points (see gzip_seek) instead of decompressing from the start.
+"""
+
+import gzip
+import json
+import re
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+from SHARED.constants import Field
+from SHARED.league_sdk.gzip_seek import read_lines
+from SHARED.league_sdk.log_rotation import GZIP_SUFFIX, PARTIAL_SUFFIX
+
+# Kind codes stored in the index (compact integers instead of field names)
+KEY_KINDS = {Field.MATCH_ID: 0, Field.ROUND_ID: 1, Field.CONVERSATION_ID: 2}
+
+_KEY_PATTERN = re.compile(
+    rb'"(' + b"|".join(k.encode() for k in KEY_KINDS) + rb')": ("(?:[^"\\]|\\.)*"|-?\d+)'
+)
+_TIMESTAMP_PATTERN = re.compile(rb'"timestamp": "([^"]*)"')
+
+
+def is_compressed(path: Path) -> bool:
+    return path.name.endswith(GZIP_SUFFIX)
+
+
+def log_files(log_dir: Path) -> List[Path]:
+    """Every log file of a directory; an agent's segments sort before its active file."""
+    return sorted(p for p in Path(log_dir).glob("*.jsonl*") if not p.name.endswith(PARTIAL_SUFFIX))
+
+
+def open_log(path: Path) -> IO[bytes]:
+    """Open a plain or gzipped log segment for binary reading."""
+    return gzip.open(path, "rb") if is_compressed(path) else open(path, "rb")
+
+
+def line_keys(line: bytes) -> Tuple[str, Set[Tuple[int, str]]]:
+    """(timestamp, {(kind, value)}) of one raw log line."""
+    found = _TIMESTAMP_PATTERN.search(line)
+    timestamp = found.group(1).decode() if found else ""
+    keys = set()
+    for name, raw in _KEY_PATTERN.findall(line):
+        value = json.loads(raw)
+        keys.add((KEY_KINDS[name.decode()], str(value)))
+    return timestamp, keys
+
+
+def scan_lines(handle: IO[bytes], offset: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield (offset, line) for every complete line from ``offset`` on.
+
+    A trailing line without a newline is still being written and is left
+    for the next scan.
+    """
+    handle.seek(offset)
+    for line in handle:
+        if not line.endswith(b"\n"):
+            return
+        yield offset, line
+        offset += len(line)
+
+
+def read_entries(path: Path, offsets: Iterable[int]) -> List[Tuple[int, Dict[str, Any]]]:
+    """Parse the log entries at the given offsets of one file: [(offset, entry)]."""
+    if is_compressed(path):
+        return [(offset, json.loads(line)) for offset, line in read_lines(path, offsets)]
+    entries = []
+    with open(path, "rb") as handle:
+        for offset in sorted(offsets):
+            handle.seek(offset)
+            entries.append((offset, json.loads(handle.readline())))
+    return entries
@@ -0,0 +1,150 @@
+"""Background writer for JSONL agent logs.
+
+Loggers hand finished lines to one process-wide LogWriter instead of opening
+and closing their file per event: a daemon thread drains the queue into
+persistent append handles, so the event loop never blocks on file I/O.
+Files are rotated per ``logging.rotation`` in system.json (see log_rotation).
+"""
+
+import atexit
+import os
+import queue
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from SHARED.constants import FsyncPolicy
+from SHARED.league_sdk.log_policy import logging_settings
+from SHARED.league_sdk.log_retention import SegmentMaintainer
+from SHARED.league_sdk.log_rotation import LogSegment, RotationPolicy
+
+
+class LogWriter:
+    """Queue + writer thread shared by every LeagueLogger in the process."""
+
+    def __init__(self, buffered: bool = True, flush_interval_s: float = 0.2,
+                 fsync: str = FsyncPolicy.NEVER, max_queue_size: int = 10000,
+                 rotation: Optional[RotationPolicy] = None):
+        self.buffered, self.flush_interval_s, self.fsync = buffered, flush_interval_s, fsync
+        self.rotation = rotation or RotationPolicy()
+        self._maintainer = SegmentMaintainer(self.rotation)
+        self._queue: "queue.Queue" = queue.Queue(max_queue_size)
+        self._files: Dict[Path, LogSegment] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()  # Cuts the writer thread's batching wait short
+
+    def write(self, path: Path, line: str) -> None:
+        """Append one line to a log file (queued unless unbuffered)."""
+        if not self.buffered or self.fsync == FsyncPolicy.ALWAYS:
+            with self._lock:
+                self._write_batch([(path, line)])
+            return
+        self._ensure_thread()
+        self._queue.put((path, line))  # Blocks only when the queue is full (backpressure)
+
+    @property
+    def backlog(self) -> int:  # Lines queued but not yet picked up by the writer thread
+        return self._queue.qsize()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Block until every line queued so far is written and flushed."""
+        if self._thread is not None and self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            self._wake.set()
+            done.wait(timeout)
+
+    def close(self) -> None:
+        """Flush pending lines, stop the writer thread and close every file."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._wake.set()
+            self._thread.join(timeout=5.0)
+        self._thread = None
+        with self._lock:
+            for segment in self._files.values():
+                segment.close()
+            self._files.clear()
+        self._maintainer.shutdown()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="league-log-writer", daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        items = []
+        while None not in items:  # None is close()'s stop marker
+            items = [self._queue.get()]
+            self._wake.wait(self.flush_interval_s)  # Let the batch build up
+            self._wake.clear()
+            while not self._queue.empty():  # Only this thread consumes the queue
+                items.append(self._queue.get_nowait())
+            try:
+                with self._lock:
+                    self._write_batch([item for item in items if isinstance(item, tuple)])
+            except Exception as e:  # Keep consuming: a dead writer thread would block every logger
+                print(f"league-log-writer: dropped a batch of log lines: {e!r}", file=sys.stderr)
+            finally:
+                for marker in (item for item in items if isinstance(item, threading.Event)):
+                    marker.set()
+
+    def _write_batch(self, batch) -> None:
+        touched = set()
+        for path, line in batch:
+            segment = self._files.get(path)
+            if segment is None:
+                segment = self._files[path] = LogSegment(path)
+            segment.write(line)
+            touched.add(path)
+        for path in touched:
+            segment = self._files[path]
+            segment.flush(fsync=self.fsync != FsyncPolicy.NEVER)
+            if segment.due(self.rotation):
+                self._files.pop(path).rotate()
+                self._maintainer.submit(path)  # Compress and prune in the background
+
+
+_writer: Optional[LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    """Get the process-wide log writer (created from system.json on first use)."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                settings = logging_settings()
+                _writer = LogWriter(
+                    settings.get("buffered", True), settings.get("flush_interval_ms", 200) / 1000,
+                    settings.get("fsync", FsyncPolicy.NEVER), settings.get("max_queue_size", 10000),
+                    RotationPolicy.from_settings(settings.get("rotation", {})))
+                atexit.register(_writer.close)
+    return _writer
+
+
+def flush_logs() -> None:
+    """Write out every pending log line."""
+    if _writer is not None:
+        _writer.flush()
+
+
+def reset_log_writer() -> None:
+    """Close the process-wide writer (testing; the next log creates a new one)."""
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+            atexit.unregister(_writer.close)
+        _writer = None
+
+
+def exit_after_flush(code: int = 0) -> None:
+    """Flush pending log lines, then hard-exit (os._exit skips atexit handlers)."""
+    flush_logs()
+    os._exit(code)
@@ -6,6 +6,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from SHARED.league_sdk.log_policy import get_log_policy
+from SHARED.league_sdk.log_writer import get_log_writer
+
 
 class LogLevel(Enum):
     """Log levels for the league system."""
@@ -17,7 +20,11 @@ class LogLevel(Enum):
 
 
 class LeagueLogger:
-    """JSONL logger for league events."""
+    """JSONL logger for league events.
+
+    Entries are filtered and capped by the agent's LogPolicy and written by
+    the background log writer.
+    """
 
     def __init__(self, agent_id: str, log_dir: Path = None):
         """Initialize logger for specific agent."""
@@ -27,6 +34,7 @@ class LeagueLogger:
         self.log_file = log_dir / f"{agent_id}.log.jsonl"
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         self.agent_id = agent_id
+        self.policy = get_log_policy(agent_id)
 
     def log_message(
         self,
@@ -35,6 +43,8 @@ class LeagueLogger:
         level: LogLevel = LogLevel.INFO,
     ) -> None:
         """Log a message event."""
+        if not self.policy.allows(level.value, event_type):
+            return
         log_entry = {
             "timestamp": self._get_timestamp(),
             "level": level.value,
@@ -81,6 +91,8 @@ class LeagueLogger:
         context: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Log a state transition event."""
+        if not self.policy.allows(LogLevel.INFO.value, "STATE_CHANGE"):
+            return
         log_entry = {
             "timestamp": self._get_timestamp(),
             "level": LogLevel.INFO.value,
@@ -96,7 +108,11 @@ class LeagueLogger:
         """Get current UTC timestamp in ISO-8601 format with Z."""
         return datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
 
+    def flush(self) -> None:
+        """Block until every entry logged so far is on file."""
+        get_log_writer().flush()
+
     def _write_log(self, log_entry: Dict[str, Any]) -> None:
-        """Write log entry to JSONL file."""
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        """Queue log entry for the JSONL file (serialized now, so later mutation is not logged)."""
+        line = self.policy.cap(log_entry, json.dumps(log_entry))
+        get_log_writer().write(self.log_file, line + "\n")
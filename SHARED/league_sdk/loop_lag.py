@@ -0,0 +1,69 @@
+"""Event loop lag: how late a periodic wakeup runs on the agent's loop.
+
+A monitor task sleeps for a fixed interval and measures how much longer the
+sleep actually took; the overshoot is time the loop spent running other
+callbacks (or blocked). The latest lag is a gauge, all samples go into a
+histogram. One monitor runs per event loop; given a blocking-call watchdog
+(see loop_watchdog), it beats at the watchdog's finer interval and hands it
+every lag.
+"""
+
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from SHARED.league_sdk.config_service import get_system_config
+from SHARED.league_sdk.loop_watchdog import BlockingWatchdog
+from SHARED.league_sdk.metrics import get_metrics_registry
+
+DEFAULT_INTERVAL_S = 0.25
+
+_registry = get_metrics_registry()
+lag_last = _registry.gauge("event_loop_lag_last_seconds", "Lag of the latest loop wakeup")
+lag_seconds = _registry.histogram("event_loop_lag_seconds", "Lag of periodic loop wakeups")
+
+_monitors: Dict[asyncio.AbstractEventLoop, Tuple[asyncio.Task, Optional[BlockingWatchdog]]] = {}
+
+
+def configured_interval_s() -> float:
+    """Monitor interval from system.json ``metrics.loop_lag_interval_ms``."""
+    return get_system_config().metrics.get("loop_lag_interval_ms", DEFAULT_INTERVAL_S * 1000) / 1000
+
+
+async def _monitor(interval_s: float, watchdog: Optional[BlockingWatchdog]) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval_s)
+        lag = max(0.0, loop.time() - start - interval_s)
+        lag_last.set((), lag)
+        lag_seconds.observe((), lag)
+        if watchdog is not None:
+            watchdog.beat(lag)
+
+
+def ensure_loop_lag_monitor(
+    interval_s: float = DEFAULT_INTERVAL_S, watchdog: Optional[BlockingWatchdog] = None
+) -> None:
+    """Start the monitor (and watchdog) on the running loop unless it already has one."""
+    loop = asyncio.get_running_loop()
+    task, _ = _monitors.get(loop, (None, None))
+    if task is None or task.done():
+        for stale in [other for other in _monitors if other.is_closed()]:
+            _stop(*_monitors.pop(stale))
+        if watchdog is not None:
+            interval_s = min(interval_s, watchdog.interval_s)
+            watchdog.attach()
+        task = loop.create_task(_monitor(interval_s, watchdog), name="loop-lag-monitor")
+        _monitors[loop] = (task, watchdog)
+
+
+def stop_loop_lag_monitor() -> None:
+    """Cancel the running loop's monitor and watchdog (on app shutdown)."""
+    _stop(*_monitors.pop(asyncio.get_running_loop(), (None, None)))
+
+
+def _stop(task: Optional[asyncio.Task], watchdog: Optional[BlockingWatchdog]) -> None:
+    if task is not None:
+        task.cancel()
+    if watchdog is not None:
+        watchdog.stop()
@@ -0,0 +1,85 @@
+"""Blocking-call watchdog: catches callbacks that hold the event loop too long.
+
+The loop lag monitor beats on the loop every ``interval_ms``; a daemon
+thread watches those beats. Once a beat is more than ``threshold_ms``
+overdue, the thread samples the loop thread's stack - at that moment still
+inside the blocking call. When the loop gets to run again, the beat reports
+the stall on the loop thread: a LOOP_BLOCKED warning with the blocked time
+and the captured stack, and the ``event_loop_blocked_total`` and
+``event_loop_block_seconds`` metrics. Opt-in through ``metrics.blocking_watchdog``
+in system.json.
+"""
+
+import sys
+import threading
+import time
+import traceback
+from typing import List, Optional
+
+from SHARED.constants import LogEvent
+from SHARED.league_sdk.config_service import get_system_config
+from SHARED.league_sdk.logger import LeagueLogger
+from SHARED.league_sdk.metrics import get_metrics_registry
+
+_registry = get_metrics_registry()
+blocked_total = _registry.counter("event_loop_blocked_total", "Loop stalls past the threshold", ("agent_id",))
+block_seconds = _registry.histogram("event_loop_block_seconds", "Duration of loop stalls", ("agent_id",))
+
+
+class BlockingWatchdog:
+    """Stall detector for one event loop, reporting under one agent's log."""
+
+    def __init__(self, logger, threshold_s: float = 0.1, interval_s: float = 0.02, stack_depth: int = 30):
+        self.logger, self.threshold_s, self.interval_s = logger, threshold_s, interval_s
+        self.stack_depth = stack_depth
+        self._loop_thread: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._stack: Optional[List[str]] = None
+        self._stop = threading.Event()
+
+    def attach(self) -> None:
+        """Watch the calling thread (the loop's) from a daemon thread."""
+        self._loop_thread, self._last_beat = threading.get_ident(), time.monotonic()
+        self._stop.clear()
+        threading.Thread(target=self._watch, name="loop-watchdog", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def beat(self, lag_s: float) -> None:
+        """Called on the loop after each monitor wakeup, with how late it ran."""
+        stack, self._stack = self._stack, None
+        self._last_beat = time.monotonic()
+        if lag_s >= self.threshold_s:
+            labels = (self.logger.agent_id,)
+            blocked_total.inc(labels)
+            block_seconds.observe(labels, lag_s)
+            self.logger.warn(LogEvent.LOOP_BLOCKED, {
+                "blocked_ms": round(lag_s * 1000, 1), "threshold_ms": self.threshold_s * 1000,
+                "stack": stack or [],
+            })
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            overdue = time.monotonic() - self._last_beat - self.interval_s
+            if self._stack is None and overdue > self.threshold_s:
+                self._stack = self._sample()
+
+    def _sample(self) -> List[str]:
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return []
+        return [line.rstrip() for line in traceback.format_stack(frame, limit=self.stack_depth)]
+
+
+def create_watchdog(agent_id: str) -> Optional[BlockingWatchdog]:
+    """Watchdog from system.json ``metrics.blocking_watchdog``, or None unless enabled."""
+    settings = get_system_config().metrics.get("blocking_watchdog", {})
+    if not settings.get("enabled", False):
+        return None
+    return BlockingWatchdog(
+        LeagueLogger(agent_id),
+        threshold_s=settings.get("threshold_ms", 100) / 1000,
+        interval_s=settings.get("interval_ms", 20) / 1000,
+        stack_depth=settings.get("stack_depth", 30),
+    )
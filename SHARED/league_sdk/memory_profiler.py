@@ -0,0 +1,83 @@
+"""tracemalloc snapshots and diffs of a running agent process.
+
+Start tracing, take a snapshot, let the league run, take another: each
+snapshot is dumped to a ``.tracemalloc`` file (``tracemalloc.Snapshot.load``
+reads it back for offline analysis) and compared with the previous one, so
+the response lists the source lines whose allocations grew the most. Only
+the last few snapshots are kept in memory.
+"""
+
+import tracemalloc
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from SHARED.league_sdk.profile_output import ProfilingError, profile_path, profiling_settings
+
+KEPT_SNAPSHOTS = 5
+_IGNORED = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"))
+
+
+class MemoryTracker:
+    """The process's tracemalloc session and its recent snapshots."""
+
+    def __init__(self):
+        self._snapshots: "OrderedDict[str, tracemalloc.Snapshot]" = OrderedDict()
+
+    def status(self) -> Dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": tracemalloc.is_tracing(), "traced_bytes": current, "peak_bytes": peak,
+            "snapshots": list(self._snapshots),
+        }
+
+    def start(self, frames: Optional[int] = None) -> Dict[str, Any]:
+        if tracemalloc.is_tracing():
+            raise ProfilingError("tracemalloc is already tracing")
+        tracemalloc.start(frames or profiling_settings().get("tracemalloc_frames", 10))
+        return self.status()
+
+    def snapshot(self, compare_to: Optional[str] = None, top: Optional[int] = None) -> Dict[str, Any]:
+        """Take and dump a snapshot; diff it against ``compare_to`` (default: the previous one)."""
+        if not tracemalloc.is_tracing():
+            raise ProfilingError("tracemalloc is not tracing; start it first")
+        if compare_to is not None and compare_to not in self._snapshots:
+            raise ProfilingError(f"Unknown snapshot: {compare_to}")
+        top = top or profiling_settings().get("top", 25)
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        path = profile_path("memory", ".tracemalloc")
+        snapshot.dump(str(path))
+        base_name = compare_to or next(reversed(self._snapshots), None)
+        if base_name is None:
+            top_rows = _rows(snapshot.statistics("lineno")[:top])
+        else:
+            top_rows = _rows(snapshot.compare_to(self._snapshots[base_name], "lineno")[:top])
+        self._snapshots[path.stem] = snapshot
+        while len(self._snapshots) > KEPT_SNAPSHOTS:
+            self._snapshots.popitem(last=False)
+        return {"snapshot": path.stem, "file": str(path), "compared_to": base_name, **self.status(), "top": top_rows}
+
+    def stop(self) -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            raise ProfilingError("tracemalloc is not tracing")
+        tracemalloc.stop()
+        self._snapshots.clear()
+        return self.status()
+
+
+def _rows(stats: List[Any]) -> List[Dict[str, Any]]:
+    rows = []
+    for stat in stats:
+        frame = stat.traceback[0]
+        row = {"location": f"{frame.filename}:{frame.lineno}", "size_bytes": stat.size, "count": stat.count}
+        if isinstance(stat, tracemalloc.StatisticDiff):
+            row.update(size_diff_bytes=stat.size_diff, count_diff=stat.count_diff)
+        rows.append(row)
+    return rows
+
+
+_tracker = MemoryTracker()
+
+
+def get_memory_tracker() -> MemoryTracker:
+    """The process-wide tracemalloc session."""
+    return _tracker
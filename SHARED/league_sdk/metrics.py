@@ -0,0 +1,131 @@
+"""Process-wide metrics: counters, gauges and HDR-style histograms.
+
+Every sample is keyed by a tuple of label values, given in the order of the
+metric's ``labelnames``: ``attempts.inc((endpoint, message_type))``. Updates
+are single dict operations, made on the agent's event loop thread, so the
+hot path takes no lock and allocates nothing once a label set exists.
+Histograms record microseconds into sparse log-linear buckets (see
+hdr_histogram).
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from SHARED.league_sdk.hdr_histogram import HdrCounts
+
+Labels = Tuple[str, ...]
+
+
+class Counter:
+    """Monotonic count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name, self.help, self.labelnames = name, help_text, tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Dict[Labels, Any]:
+        return dict(self._values)
+
+    def reset(self) -> None:
+        self._values.clear()
+
+
+class Gauge(Counter):
+    """Current value per label set, set directly or read from a function at collection."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._functions: Dict[Labels, Callable[[], float]] = {}
+
+    def set(self, labels: Labels, value: float) -> None:
+        self._values[labels] = value
+
+    def set_function(self, labels: Labels, function: Callable[[], float]) -> None:
+        """Report function() for a label set whenever the metrics are read (replaces any earlier one)."""
+        self._functions[labels] = function
+
+    def samples(self) -> Dict[Labels, Any]:
+        samples = dict(self._values)
+        for labels, function in list(self._functions.items()):
+            try:
+                samples[labels] = function()
+            except Exception:  # A failing probe must not break collection
+                continue
+        return samples
+
+
+class Histogram(Counter):
+    """Distribution of durations per label set, observed in seconds."""
+
+    kind = "histogram"
+
+    def observe(self, labels: Labels, seconds: float) -> None:
+        counts = self._values.get(labels)
+        if counts is None:
+            counts = self._values[labels] = HdrCounts()
+        counts.record(int(seconds * 1_000_000))
+
+
+class MetricsRegistry:
+    """Named metrics of one process; asking again for a name returns the same metric."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Counter] = {}
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Histogram:
+        return self._get(Histogram, name, help_text, labelnames)
+
+    def metrics(self) -> List[Counter]:
+        return list(self._metrics.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready view: histograms as count, mean and p50/p90/p99/max in milliseconds."""
+        view = {}
+        for metric in self.metrics():
+            samples = []
+            for labels, value in metric.samples().items():
+                sample: Dict[str, Any] = {"labels": dict(zip(metric.labelnames, labels))}
+                if isinstance(value, HdrCounts):
+                    sample.update(count=value.count, mean_ms=value.total / value.count / 1000, max_ms=value.max / 1000)
+                    sample.update({f"p{q}_ms": value.percentile(q / 100) / 1000 for q in (50, 90, 99)})
+                else:
+                    sample["value"] = value
+                samples.append(sample)
+            view[metric.name] = {"type": metric.kind, "help": metric.help, "samples": samples}
+        return view
+
+    def reset(self) -> None:
+        """Clear every set sample, keeping the metrics and gauge functions (testing)."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def _get(self, cls: type, name: str, help_text: str, labelnames: Sequence[str]) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help_text, labelnames)
+        elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered as a different {metric.kind}")
+        return metric
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """The process-wide metrics registry."""
+    return _registry
@@ -0,0 +1,27 @@
+"""Shared pieces of the profiling tools: settings, output files and errors."""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict
+
+from SHARED.league_sdk.config_service import get_system_config
+
+DEFAULT_OUTPUT_DIR = "SHARED/logs/profiles"
+
+
+class ProfilingError(Exception):
+    """A profiling session cannot be started or stopped in the current state."""
+
+
+def profiling_settings() -> Dict[str, Any]:
+    """The system.json profiling section."""
+    return get_system_config().profiling
+
+
+def profile_path(kind: str, suffix: str) -> Path:
+    """Output file for a session: ``<output_dir>/<kind>-<pid>-<UTC time><suffix>``."""
+    directory = Path(profiling_settings().get("output_dir", DEFAULT_OUTPUT_DIR))
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    return directory / f"{kind}-{os.getpid()}-{stamp}{suffix}"
@@ -0,0 +1,58 @@
+"""Prometheus text exposition (format 0.0.4) of a metrics registry.
+
+Counters and gauges are written as-is. Histograms are written as cumulative
+``_bucket`` series at fixed boundaries in seconds, plus ``_sum`` and
+``_count``; each boundary count is read off the HDR buckets, so it is exact
+up to the HDR bucket width (~3%).
+"""
+
+from typing import Dict, Iterable, List, Sequence
+
+from SHARED.league_sdk.hdr_histogram import HdrCounts
+from SHARED.league_sdk.metrics import MetricsRegistry, get_metrics_registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+BUCKETS_S = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Iterable[str], extra: Dict[str, str] = None) -> str:
+    pairs = list(zip(names, values)) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _histogram_lines(name: str, names: Sequence[str], labels: Sequence[str], counts: HdrCounts) -> List[str]:
+    lines, cumulative = [], list(counts.cumulative())
+    index, below = 0, 0
+    for bound in BUCKETS_S:
+        while index < len(cumulative) and cumulative[index][0] <= bound * 1_000_000:
+            below = cumulative[index][1]
+            index += 1
+        lines.append(f"{name}_bucket{_labels(names, labels, {'le': _number(bound)})} {below}")
+    lines.append(f"{name}_bucket{_labels(names, labels, {'le': '+Inf'})} {counts.count}")
+    lines.append(f"{name}_sum{_labels(names, labels)} {_number(counts.total / 1_000_000)}")
+    lines.append(f"{name}_count{_labels(names, labels)} {counts.count}")
+    return lines
+
+
+def render(registry: MetricsRegistry = None) -> str:
+    """Every metric of the registry (default: the process-wide one) as exposition text."""
+    lines = []
+    for metric in (registry or get_metrics_registry()).metrics():
+        lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for labels, value in sorted(metric.samples().items()):
+            if isinstance(value, HdrCounts):
+                lines.extend(_histogram_lines(metric.name, metric.labelnames, labels, value))
+            else:
+                lines.append(f"{metric.name}{_labels(metric.labelnames, labels)} {_number(value)}")
+    return "\n".join(lines) + "\n"
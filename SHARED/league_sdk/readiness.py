@@ -0,0 +1,69 @@
+"""Agent readiness probes.
+
+Every agent serves ``GET /health`` as soon as its server is listening.
+Instead of sleeping a fixed time, launchers and agents poll that endpoint
+with a short, fast-growing backoff and proceed the moment the peer answers.
+In-process agents are probed through the transport instead of HTTP.
+"""
+
+import asyncio
+import time
+from typing import Dict, Iterable
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+
+from SHARED.constants import HEALTH_PATH, Field, Status
+from SHARED.league_sdk.agent_comm import get_transport
+
+_INITIAL_DELAY_S = 0.02
+_MAX_DELAY_S = 0.5
+_PROBE_TIMEOUT_S = 1.0
+
+
+def health_url(endpoint: str) -> str:
+    """Health URL of the server behind an MCP endpoint (shared by pooled agents)."""
+    parts = urlsplit(endpoint)
+    return urlunsplit((parts.scheme, parts.netloc, HEALTH_PATH, "", ""))
+
+
+def health_response(agent_id: str) -> Dict[str, str]:
+    """Body served by an agent's /health endpoint."""
+    return {Field.STATUS: Status.OK, "agent_id": agent_id}
+
+
+async def probe(endpoint: str, timeout: float = _PROBE_TIMEOUT_S) -> bool:
+    """Return True if the agent behind the endpoint is accepting messages."""
+    transport_probe = getattr(get_transport(), "probe", None)
+    if transport_probe is not None:  # e.g. in-process transport
+        return await transport_probe(endpoint)
+    try:
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            response = await client.get(health_url(endpoint))
+            return response.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+async def wait_until_ready(
+    endpoint: str, timeout: float = 10.0,
+    initial_delay: float = _INITIAL_DELAY_S, max_delay: float = _MAX_DELAY_S,
+) -> bool:
+    """Poll an agent until it answers its health probe; False if the timeout elapses."""
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        if await probe(endpoint):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+async def wait_for_all(endpoints: Iterable[str], timeout: float = 10.0) -> Dict[str, bool]:
+    """Wait for several agents concurrently; returns endpoint -> ready."""
+    endpoints = list(endpoints)
+    results = await asyncio.gather(*(wait_until_ready(e, timeout) for e in endpoints))
+    return dict(zip(endpoints, results))
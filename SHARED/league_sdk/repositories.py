@@ -113,3 +113,32 @@ class PlayerHistoryRepository:
         history = self.load_history()
         history[Field.MATCHES].append(match_data)
         self.save_history(history)
+
+    def append_matches(self, matches: List[Dict[str, Any]]) -> None:
+        """Append several matches to player history with a single write."""
+        history = self.load_history()
+        history[Field.MATCHES].extend(matches)
+        self.save_history(history)
+
+
+class OpponentChoicesRepository:
+    """Repository for a player's per-opponent choice history."""
+
+    def __init__(self, player_id: str, data_dir: Path = None):
+        """Initialize opponent choices repository."""
+        if data_dir is None:
+            data_dir = Path("SHARED/data/players")
+        self.choices_file = data_dir / player_id / "opponent_choices.json"
+        self.choices_file.parent.mkdir(parents=True, exist_ok=True)
+
+    def load(self) -> Dict[str, List[str]]:
+        """Load opponent_id -> choices mapping (oldest first)."""
+        if not self.choices_file.exists():
+            return {}
+        with open(self.choices_file, "r", encoding="utf-8") as f:
+            return json.load(f).get(Field.OPPONENT_CHOICES, {})
+
+    def save(self, choices: Dict[str, List[str]]) -> None:
+        """Save opponent_id -> choices mapping."""
+        with open(self.choices_file, "w", encoding="utf-8") as f:
+            json.dump({Field.OPPONENT_CHOICES: choices}, f)
@@ -0,0 +1,62 @@
+"""Deterministic seed derivation for reproducible league runs.
+
+A league has a single master seed. Every match (and every player) derives
+its own independent random stream from that seed and a spawn key, in the
+spirit of NumPy's ``SeedSequence.spawn``: streams do not depend on the order
+in which matches run, so a seeded league always produces the same outcomes.
+"""
+
+import hashlib
+import random
+import secrets
+from typing import Optional, Union
+
+SpawnKey = Union[int, str]
+
+# Seeds are kept to 63 bits so they survive JSON and signed-int consumers
+_SEED_BITS = 63
+
+
+def generate_master_seed() -> int:
+    """Generate a fresh random master seed."""
+    return secrets.randbits(_SEED_BITS)
+
+
+def resolve_master_seed(configured_seed: Optional[int] = None) -> int:
+    """Return the configured master seed, or generate one if not configured."""
+    if configured_seed is None:
+        return generate_master_seed()
+    return int(configured_seed)
+
+
+def derive_seed(master_seed: int, *spawn_key: SpawnKey) -> int:
+    """Derive a child seed from a master seed and a spawn key.
+
+    Args:
+        master_seed: Parent seed
+        *spawn_key: Path identifying the child stream (e.g. "match", "R1M1")
+
+    Returns:
+        Child seed, stable across processes and Python versions
+    """
+    digest = hashlib.blake2b(str(master_seed).encode("utf-8"), digest_size=8)
+    for part in spawn_key:
+        digest.update(b"\x1f" + str(part).encode("utf-8"))
+    return int.from_bytes(digest.digest(), "big") >> (64 - _SEED_BITS)
+
+
+def spawn_rng(master_seed: Optional[int], *spawn_key: SpawnKey) -> random.Random:
+    """Create a random stream for a spawn key (unseeded if no master seed)."""
+    if master_seed is None:
+        return random.Random()
+    return random.Random(derive_seed(master_seed, *spawn_key))
+
+
+def match_seed(master_seed: int, match_id: str) -> int:
+    """Derive the seed for a single match."""
+    return derive_seed(master_seed, "match", match_id)
+
+
+def player_seed(master_seed: int, player_id: str) -> int:
+    """Derive the seed handed to a player at registration."""
+    return derive_seed(master_seed, "player", player_id)
@@ -119,6 +119,7 @@ class SessionManager:
                     "auth_token": s.auth_token,
                     "endpoint": s.endpoint,
                     "registered_at": s.created_at,
+                    "metadata": s.metadata,
                 }
         return result
 
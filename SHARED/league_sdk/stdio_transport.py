@@ -0,0 +1,38 @@
+"""STDIO transport: one JSON message per line over stdout/stdin (MCP compatibility)."""
+
+import asyncio
+import json
+import sys
+from typing import Any, Dict, Optional
+
+from SHARED.league_sdk.transport import BaseTransport, TransportType, register_transport
+
+
+class STDIOTransport(BaseTransport):
+    """STDIO transport for MCP compatibility."""
+
+    async def send(self, endpoint: str, message: Dict[str, Any]) -> Optional[Dict]:
+        """Send via stdout/stdin."""
+        try:
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            return json.loads(line.strip()) if line else None
+        except (json.JSONDecodeError, IOError):
+            return None
+
+    async def send_with_retry(
+        self, endpoint: str, message: Dict[str, Any],
+        max_retries: int = 3, retry_delay: float = 1.0, use_circuit_breaker: bool = False
+    ) -> Optional[Dict]:
+        """Send with retry (no circuit breaker for STDIO)."""
+        for attempt in range(max_retries):
+            result = await self.send(endpoint, message)
+            if result is not None:
+                return result
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay * (attempt + 1))
+        return None
+
+
+register_transport(TransportType.STDIO, STDIOTransport)
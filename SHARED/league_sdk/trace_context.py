@@ -0,0 +1,96 @@
+"""Trace context shared by the agents of one league.
+
+The active span of the running task is kept in a context variable, so it
+follows ``await`` and is inherited by tasks created under it. Between agents
+it travels inside protocol messages as a W3C ``traceparent`` field
+(``00-<trace_id>-<span_id>-01``), which works for every transport.
+"""
+
+import contextvars
+import re
+import secrets
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+from SHARED.protocol_fields import Field
+
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Identity of a span; ``agent_id`` is local and not propagated."""
+
+    trace_id: str
+    span_id: str
+    agent_id: str = ""
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+_current: "contextvars.ContextVar[Optional[SpanContext]]" = contextvars.ContextVar("league_span", default=None)
+
+
+def current_span() -> Optional[SpanContext]:
+    """The span active in the running task, if any."""
+    return _current.get()
+
+
+@contextmanager
+def activated(context: Optional[SpanContext]) -> Iterator[Optional[SpanContext]]:
+    """Make ``context`` the active span for the duration of a block."""
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+def parse_traceparent(value: Any) -> Optional[SpanContext]:
+    """SpanContext of a traceparent string; None if absent or malformed."""
+    found = _TRACEPARENT_PATTERN.match(value) if isinstance(value, str) else None
+    return SpanContext(found.group(1), found.group(2)) if found else None
+
+
+def message_body(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Protocol fields of a message: the params of a JSON-RPC envelope, or the message itself."""
+    params = message.get("params")
+    return params if "jsonrpc" in message and isinstance(params, dict) else message
+
+
+def message_context(message: Dict[str, Any]) -> Optional[SpanContext]:
+    """Trace context a received message carries."""
+    return parse_traceparent(message_body(message).get(Field.TRACEPARENT))
+
+
+def with_traceparent(message: Dict[str, Any], context: SpanContext) -> Dict[str, Any]:
+    """Copy of a message carrying ``context`` (the caller's message is not changed)."""
+    if message_body(message) is message:
+        return {**message, Field.TRACEPARENT: context.traceparent}
+    return {**message, "params": {**message["params"], Field.TRACEPARENT: context.traceparent}}
+
+
+def bind(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Wrap a coroutine function to run under the span active now.
+
+    For work scheduled to run later, e.g. FastAPI background tasks, which
+    start after the request's span has ended.
+    """
+    parent = _current.get()
+
+    async def run(*args: Any, **kwargs: Any) -> Any:
+        with activated(parent):
+            return await func(*args, **kwargs)
+
+    return run
@@ -0,0 +1,65 @@
+"""Read exported trace spans back and lay them out as a waterfall.
+
+Span files hold one OTLP/JSON ``resourceSpans`` request per line (see
+tracing). They are streamed twice: once to find the root span (a match or a
+round), and once to collect that root's trace; only the one trace is held
+in memory.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from SHARED.league_sdk.log_scan import log_files, open_log
+from SHARED.league_sdk.tracing import DEFAULT_TRACE_DIR
+
+_VALUE_KEYS = ("stringValue", "intValue", "doubleValue", "boolValue")
+
+
+def _value(value: Dict[str, Any]) -> Any:
+    return next((value[key] for key in _VALUE_KEYS if key in value), None)
+
+
+def read_spans(trace_dir: Path = Path(DEFAULT_TRACE_DIR)) -> Iterator[Dict[str, Any]]:
+    """Every exported span as a flat dict (ids, name, agent_id, start/end ns, attributes, error)."""
+    for path in log_files(trace_dir):
+        with open_log(path) as handle:
+            for line in handle:
+                for resource_spans in json.loads(line)["resourceSpans"]:
+                    resource = {a["key"]: _value(a["value"]) for a in resource_spans["resource"]["attributes"]}
+                    for scope in resource_spans["scopeSpans"]:
+                        for otlp in scope["spans"]:
+                            yield {
+                                "trace_id": otlp["traceId"], "span_id": otlp["spanId"],
+                                "parent_id": otlp.get("parentSpanId") or None, "name": otlp["name"],
+                                "agent_id": resource.get("service.name", ""),
+                                "start_ns": int(otlp["startTimeUnixNano"]), "end_ns": int(otlp["endTimeUnixNano"]),
+                                "attributes": {a["key"]: _value(a["value"]) for a in otlp.get("attributes", [])},
+                                "error": otlp.get("status", {}).get("message"),
+                            }
+
+
+def find_root(trace_dir: Path, name: str, **attributes: Any) -> Optional[Dict[str, Any]]:
+    """Latest span called ``name`` whose attributes include ``attributes`` (compared as strings)."""
+    found = None
+    for span in read_spans(trace_dir):
+        tags = span["attributes"]
+        if span["name"] == name and all(str(tags.get(k)) == str(v) for k, v in attributes.items()):
+            if found is None or span["start_ns"] > found["start_ns"]:
+                found = span
+    return found
+
+
+def waterfall(trace_dir: Path, root: Dict[str, Any]) -> List[Tuple[int, Dict[str, Any]]]:
+    """(depth, span) of the root and all its descendants, depth-first in start order."""
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for span in read_spans(trace_dir):
+        if span["trace_id"] == root["trace_id"] and span["parent_id"]:
+            children.setdefault(span["parent_id"], []).append(span)
+    rows, stack = [], [(0, root)]
+    while stack:
+        depth, span = stack.pop()
+        rows.append((depth, span))
+        below = sorted(children.get(span["span_id"], []), key=lambda s: s["start_ns"], reverse=True)
+        stack.extend((depth + 1, child) for child in below)
+    return rows
@@ -0,0 +1,140 @@
+"""Timed spans around message handling and outbound sends.
+
+``span`` times a block of work as a child of the active span (or as the
+root of a new trace). ``server_span`` continues the trace a received message
+carries; ``client_span`` times a send and stamps the message with its own
+context, so the receiver's spans nest under it. Finished spans are queued
+to the background log writer as OTLP/JSON lines (one ``resourceSpans``
+request per span, readable by an OpenTelemetry collector's file receiver),
+one file per agent in ``tracing.export_dir`` of system.json.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from SHARED.constants import Field, SpanKind
+from SHARED.league_sdk.config_service import get_system_config
+from SHARED.league_sdk.log_writer import get_log_writer
+from SHARED.league_sdk.trace_context import (
+    SpanContext, activated, current_span, message_body, message_context, new_span_id, new_trace_id, with_traceparent,
+)
+
+DEFAULT_TRACE_DIR = "SHARED/logs/traces"
+SPAN_FILE_SUFFIX = ".spans.jsonl"
+_STATUS_ERROR = 2  # OTLP Status.code
+_TAGGED_FIELDS = (Field.MESSAGE_TYPE, Field.MATCH_ID, Field.ROUND_ID)
+
+_settings: Optional[Dict[str, Any]] = None
+_settings_lock = threading.Lock()
+
+
+def tracing_settings() -> Dict[str, Any]:
+    """The system.json tracing section, read once ({} if there is no usable system.json)."""
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            try:
+                _settings = dict(get_system_config().tracing)
+            except (OSError, KeyError, ValueError):
+                _settings = {}
+    return _settings
+
+
+def configure_tracing(**settings: Any) -> None:
+    """Override tracing settings, e.g. ``enabled`` or ``export_dir``."""
+    tracing_settings().update(settings)
+
+
+def reset_tracing() -> None:
+    """Forget the settings (testing; they are read again on next use)."""
+    global _settings
+    _settings = None
+
+
+@contextmanager
+def span(name: str, agent_id: str = "", kind: int = SpanKind.INTERNAL, parent: Optional[SpanContext] = None,
+         new_trace: bool = False, **attributes: Any) -> Iterator[Optional[Dict[str, Any]]]:
+    """Time a block as a span; yields its attributes (add to them freely), None if tracing is off.
+
+    The parent is ``parent``, else the active span; ``new_trace`` starts a
+    new trace regardless.
+    """
+    if not tracing_settings().get("enabled", False):
+        yield None
+        return
+    parent = None if new_trace else parent or current_span()
+    context = SpanContext(
+        parent.trace_id if parent else new_trace_id(), new_span_id(),
+        agent_id or (parent.agent_id if parent else ""),
+    )
+    start, error = time.time_ns(), None
+    try:
+        with activated(context):
+            yield attributes
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _export(context, parent, name, kind, start, time.time_ns(), attributes, error)
+
+
+@contextmanager
+def server_span(agent_id: str, message: Dict[str, Any]) -> Iterator[Optional[Dict[str, Any]]]:
+    """Span for handling a received message, continuing the sender's trace."""
+    attributes = _tags(message)
+    name = f"handle {attributes.get(Field.MESSAGE_TYPE, 'message')}"
+    with span(name, agent_id, SpanKind.SERVER, message_context(message), **attributes) as tags:
+        yield tags
+
+
+@contextmanager
+def client_span(endpoint: str, message: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Span for one send; yields (message carrying the span's context, attributes)."""
+    attributes = _tags(message)
+    sender = str(attributes.pop("sender", ""))  # e.g. referee:REF01, or league_manager
+    current = current_span()
+    agent_id = sender.partition(":")[2] or (current.agent_id if current else "") or sender
+    name = f"send {attributes.get(Field.MESSAGE_TYPE, 'message')}"
+    with span(name, agent_id, SpanKind.CLIENT, endpoint=endpoint, **attributes) as tags:
+        traced = with_traceparent(message, current_span()) if tags is not None else message
+        yield traced, (tags if tags is not None else {})
+
+
+def _tags(message: Dict[str, Any]) -> Dict[str, Any]:
+    body = message_body(message)
+    tags = {key: body[key] for key in _TAGGED_FIELDS if body.get(key) is not None}
+    if body.get(Field.SENDER):
+        tags["sender"] = body[Field.SENDER]
+    return tags
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _export(context: SpanContext, parent: Optional[SpanContext], name: str, kind: int,
+            start: int, end: int, attributes: Dict[str, Any], error: Optional[str]) -> None:
+    otlp_span = {
+        "traceId": context.trace_id, "spanId": context.span_id,
+        "parentSpanId": parent.span_id if parent else "", "name": name, "kind": kind,
+        "startTimeUnixNano": str(start), "endTimeUnixNano": str(end),
+        "attributes": [_attribute(key, value) for key, value in attributes.items()],
+        "status": {"code": _STATUS_ERROR, "message": error} if error else {},
+    }
+    agent_id = context.agent_id or "unknown"
+    request = {"resourceSpans": [{
+        "resource": {"attributes": [_attribute("service.name", agent_id)]},
+        "scopeSpans": [{"scope": {"name": "league_sdk"}, "spans": [otlp_span]}],
+    }]}
+    path = Path(tracing_settings().get("export_dir", DEFAULT_TRACE_DIR)) / f"{agent_id}{SPAN_FILE_SUFFIX}"
+    get_log_writer().write(path, json.dumps(request) + "\n")
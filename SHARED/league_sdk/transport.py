@@ -1,15 +1,20 @@
-"""Transport abstraction layer with circuit breaker support."""
+"""Transport abstraction layer with circuit breaker support and per-attempt metrics."""
 
 import asyncio
 import json
 import random
-import sys
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
 import httpx
 
 from SHARED.league_sdk.circuit_breaker import get_circuit_breaker_registry
+from SHARED.league_sdk.transport_metrics import (
+    OK, error_kind, record_attempt, record_circuit_transition, record_rejection, record_retry,
+)
+
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
 class CircuitOpenError(Exception):
@@ -35,21 +40,51 @@ class BaseTransport(ABC):
 
 
 class HTTPTransport(BaseTransport):
-    """HTTP transport with circuit breaker."""
+    """HTTP transport with circuit breaker; one pooled AsyncClient per event loop."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self, timeout: int = 30, max_connections: int = 100,
+        max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0,
+    ):
         self.timeout = timeout
         self._cb = get_circuit_breaker_registry()
+        self._cb.add_listener(record_circuit_transition)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, recreating it for a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self._limits)
+            self._client_loop = loop
+        return self._client
 
     async def send(self, endpoint: str, message: Dict[str, Any]) -> Optional[Dict]:
-        """Send HTTP POST."""
+        """Send HTTP POST, recording the attempt's latency, outcome and bytes."""
+        body = json.dumps(message).encode()
+        outcome, received, start = OK, 0, time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.post(endpoint, json=message)
-                resp.raise_for_status()
-                return resp.json()
-        except (httpx.TimeoutException, httpx.HTTPError):
+            resp = await self._get_client().post(endpoint, content=body, headers=_JSON_HEADERS)
+            received = len(resp.content)
+            resp.raise_for_status()
+            return resp.json()
+        except (httpx.TimeoutException, httpx.HTTPError) as e:
+            outcome = error_kind(e)
             return None
+        finally:
+            record_attempt(endpoint, message, time.perf_counter() - start, outcome, len(body), received)
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send_with_retry(
         self, endpoint: str, message: Dict[str, Any],
@@ -57,9 +92,12 @@ class HTTPTransport(BaseTransport):
     ) -> Optional[Dict]:
         """Send with exponential backoff and circuit breaker."""
         if use_circuit_breaker and not self._cb.can_execute(endpoint):
+            record_rejection(endpoint)
             raise CircuitOpenError(endpoint)
 
         for attempt in range(max_retries):
+            if attempt:
+                record_retry(endpoint, message)
             result = await self.send(endpoint, message)
             if result is not None:
                 if use_circuit_breaker:
@@ -73,40 +111,14 @@ class HTTPTransport(BaseTransport):
         return None
 
 
-class STDIOTransport(BaseTransport):
-    """STDIO transport for MCP compatibility."""
-
-    async def send(self, endpoint: str, message: Dict[str, Any]) -> Optional[Dict]:
-        """Send via stdout/stdin."""
-        try:
-            sys.stdout.write(json.dumps(message) + "\n")
-            sys.stdout.flush()
-            line = sys.stdin.readline()
-            return json.loads(line.strip()) if line else None
-        except (json.JSONDecodeError, IOError):
-            return None
-
-    async def send_with_retry(
-        self, endpoint: str, message: Dict[str, Any],
-        max_retries: int = 3, retry_delay: float = 1.0, use_circuit_breaker: bool = False
-    ) -> Optional[Dict]:
-        """Send with retry (no circuit breaker for STDIO)."""
-        for attempt in range(max_retries):
-            result = await self.send(endpoint, message)
-            if result is not None:
-                return result
-            if attempt < max_retries - 1:
-                await asyncio.sleep(retry_delay * (attempt + 1))
-        return None
-
-
 class TransportType:
     """Transport type constants."""
     HTTP = "http"
     STDIO = "stdio"
+    IN_PROCESS = "in_process"
 
 
-_REGISTRY = {TransportType.HTTP: HTTPTransport, TransportType.STDIO: STDIOTransport}
+_REGISTRY = {TransportType.HTTP: HTTPTransport}  # stdio and in_process register themselves
 
 
 def create_transport(transport_type: str = TransportType.HTTP, **kwargs) -> BaseTransport:
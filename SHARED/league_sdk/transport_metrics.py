@@ -0,0 +1,101 @@
+"""Transport metrics: what every send costs and how it ended.
+
+Each attempt is counted per endpoint and message type, with its latency in an
+HDR histogram and its outcome as a success, a timeout or an error (HTTP
+status or exception name). Retries, circuit-open rejections and breaker
+transitions are counted too, and the bytes on the wire per endpoint. All
+metrics live in the process-wide registry (see metrics).
+"""
+
+from typing import Any, Dict
+
+import httpx
+
+from SHARED.league_sdk.circuit_breaker import CircuitState, get_circuit_breaker_registry
+from SHARED.league_sdk.metrics import get_metrics_registry
+from SHARED.league_sdk.trace_context import message_body
+
+OK = "ok"
+TIMEOUT = "timeout"
+NO_HANDLER = "no_handler"
+
+_CALL = ("endpoint", "message_type")
+_registry = get_metrics_registry()
+attempts = _registry.counter("transport_attempts_total", "Send attempts", _CALL)
+successes = _registry.counter("transport_successes_total", "Attempts answered", _CALL)
+timeouts = _registry.counter("transport_timeouts_total", "Attempts that timed out", _CALL)
+errors = _registry.counter("transport_errors_total", "Failed attempts by error", _CALL + ("error",))
+retries = _registry.counter("transport_retries_total", "Attempts after the first", _CALL)
+latency = _registry.histogram("transport_request_seconds", "Attempt latency", _CALL)
+rejections = _registry.counter(
+    "transport_circuit_rejections_total", "Sends refused by an open circuit", ("endpoint",)
+)
+transitions = _registry.counter(
+    "transport_circuit_transitions_total", "Circuit breaker state changes",
+    ("endpoint", "from_state", "to_state"),
+)
+circuit_state = _registry.gauge(
+    "transport_circuit_state", "Breaker state: 0 closed, 1 half open, 2 open", ("endpoint",)
+)
+bytes_sent = _registry.counter("transport_bytes_sent_total", "Request body bytes", ("endpoint",))
+bytes_received = _registry.counter("transport_bytes_received_total", "Response body bytes", ("endpoint",))
+
+_STATE_VALUE = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+def message_type(message: Dict[str, Any]) -> str:
+    """message_type of a (possibly JSON-RPC wrapped) message, or ``unknown``."""
+    return str(message_body(message).get("message_type", "unknown"))
+
+
+def error_kind(exc: BaseException) -> str:
+    """Outcome label of a failed attempt: timeout, http_<status> or the exception name."""
+    if isinstance(exc, httpx.TimeoutException):
+        return TIMEOUT
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"http_{exc.response.status_code}"
+    return type(exc).__name__
+
+
+def record_attempt(
+    endpoint: str, message: Dict[str, Any], seconds: float, outcome: str, sent: int = 0, received: int = 0
+) -> None:
+    """Count one attempt, its latency, its outcome and its bytes."""
+    labels = (endpoint, message_type(message))
+    attempts.inc(labels)
+    latency.observe(labels, seconds)
+    if outcome == OK:
+        successes.inc(labels)
+    elif outcome == TIMEOUT:
+        timeouts.inc(labels)
+    else:
+        errors.inc(labels + (outcome,))
+    if sent:
+        bytes_sent.inc((endpoint,), sent)
+    if received:
+        bytes_received.inc((endpoint,), received)
+
+
+def record_retry(endpoint: str, message: Dict[str, Any]) -> None:
+    retries.inc((endpoint, message_type(message)))
+
+
+def record_rejection(endpoint: str) -> None:
+    rejections.inc((endpoint,))
+
+
+def record_circuit_transition(endpoint: str, old: CircuitState, new: CircuitState) -> None:
+    """Circuit breaker listener: count the transition and track the current state."""
+    transitions.inc((endpoint, old.value, new.value))
+    circuit_state.set((endpoint,), _STATE_VALUE[new])
+
+
+def transport_status() -> Dict[str, Any]:
+    """Transport metrics and the state of every circuit breaker."""
+    names = {m.name for m in (attempts, successes, timeouts, errors, retries, latency, rejections,
+                              transitions, circuit_state, bytes_sent, bytes_received)}
+    snapshot = _registry.snapshot()
+    return {
+        "metrics": {name: view for name, view in snapshot.items() if name in names},
+        "circuit_breakers": get_circuit_breaker_registry().get_all_status(),
+    }
@@ -0,0 +1,45 @@
+"""Logging configuration constants (values of the system.json logging section)."""
+
+ADMIN_LOGGING_PATH = "/admin/logging"
+ADMIN_TRANSPORT_PATH = "/admin/transport"
+ADMIN_PROFILE_PATH = "/admin/profile"
+ADMIN_MEMORY_PATH = "/admin/memory"
+ADMIN_TOKEN_ENV = "LEAGUE_ADMIN_TOKEN"  # Bearer token admitting non-local profiling requests
+
+
+class FsyncPolicy:
+    """When flushed log data is also forced to disk (logging.fsync)."""
+
+    NEVER = "never"
+    INTERVAL = "interval"  # After each periodic flush
+    ALWAYS = "always"  # Every entry, written synchronously
+
+
+class PayloadMode:
+    """How payloads above logging.max_payload_bytes are logged (logging.oversized_payloads)."""
+
+    TRUNCATE = "truncate"  # Size, hash and a truncated preview
+    HASH = "hash"  # Size and hash only
+
+
+class SpanKind:
+    """OTLP span kinds of exported trace spans."""
+
+    INTERNAL = 1
+    SERVER = 2  # Handling a received message
+    CLIENT = 3  # Sending a message
+
+
+class PhaseEvent:
+    """Referee log events that mark the phases of a match (latency analysis)."""
+
+    STARTING_MATCH = "STARTING_MATCH"
+    PLAYER_JOINED = "PLAYER_JOINED"
+    CHOICE_RECEIVED = "CHOICE_RECEIVED"
+    WINNER_DETERMINED = "WINNER_DETERMINED"
+    GAME_OVER_SENT = "GAME_OVER_SENT"
+    MATCH_RESULT_REPORT_SENT = "MATCH_RESULT_REPORT_SENT"
+    MATCH_RESULT_BATCH_SENT = "MATCH_RESULT_BATCH_SENT"
+
+
+LATENCY_FIELD = "latency_ms"  # Round trip of the request behind PLAYER_JOINED / CHOICE_RECEIVED
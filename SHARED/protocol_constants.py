@@ -12,12 +12,15 @@ from typing import Dict
 # Protocol version
 PROTOCOL_VERSION = "league.v2"
 MCP_PATH = "/mcp"
+HEALTH_PATH = "/health"
+METRICS_PATH = "/metrics"
 LOCALHOST = "localhost"
 SERVER_HOST = "0.0.0.0"
 HTTP_PROTOCOL = "http"
 
 # JSON-RPC 2.0 constants
 JSONRPC_VERSION = "2.0"
+DECISION_DEADLINE_ERROR = -32001  # Server-error code: no parity choice within the player's deadline
 
 
 class JSONRPCMethod(str, Enum):
@@ -36,6 +39,8 @@ class JSONRPCMethod(str, Enum):
     GAME_OVER = "game_over"
     MATCH_RESULT_REPORT = "match_result_report"
     MATCH_RESULT_ACK = "match_result_ack"
+    MATCH_RESULT_BATCH = "match_result_batch"
+    MATCH_RESULT_BATCH_ACK = "match_result_batch_ack"
     GAME_ERROR = "game_error"
     # Match control
     RUN_MATCH = "run_match"
@@ -78,7 +83,7 @@ def reset_request_id_counter(agent_id: str = None) -> None:
 
 
 # Re-export from split modules
-from .protocol_types import MessageType, Status, Timeout
+from .protocol_types import Capability, MessageType, QueryType, StandingsMode, Status, Timeout
 from .protocol_fields import Field
 
 
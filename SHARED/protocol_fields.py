@@ -11,8 +11,10 @@ class Field:
     PROTOCOL = "protocol"
     MESSAGE_TYPE = "message_type"
     SENDER = "sender"
+    RECIPIENT = "recipient"
     TIMESTAMP = "timestamp"
     CONVERSATION_ID = "conversation_id"
+    TRACEPARENT = "traceparent"  # W3C trace context (optional)
 
     # Identifiers
     LEAGUE_ID = "league_id"
@@ -34,6 +36,7 @@ class Field:
     ARRIVAL_TIMESTAMP = "arrival_timestamp"
     ACCEPT = "accept"
     PLAYER_META = "player_meta"
+    CAPABILITIES = "capabilities"
 
     # Referee fields
     REFEREE_META = "referee_meta"
@@ -48,6 +51,8 @@ class Field:
     RESULT = "result"
     SCORE = "score"
     DETAILS = "details"
+    REPORTS = "reports"
+    MATCH_IDS = "match_ids"
 
     # Match fields
     PLAYER_A_ID = "player_A_id"
@@ -59,6 +64,9 @@ class Field:
     # Round/League lifecycle
     MATCHES = "matches"
     STANDINGS = "standings"
+    STANDINGS_VERSION = "standings_version"
+    BASE_VERSION = "base_version"
+    UPDATE_MODE = "update_mode"
     MATCHES_COMPLETED = "matches_completed"
     NEXT_ROUND_ID = "next_round_id"
     SUMMARY = "summary"
@@ -92,6 +100,10 @@ class Field:
     CONTACT_ENDPOINT = "contact_endpoint"
     MAX_CONCURRENT_MATCHES = "max_concurrent_matches"
 
+    # Reproducibility
+    SEED = "seed"
+    MATCH_SEED = "match_seed"
+
     # DEPRECATED aliases
     CHOICE = "parity_choice"
     PLAYER_A = "player_A_id"
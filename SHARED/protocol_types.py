@@ -32,6 +32,8 @@ class MessageType:
     # Result reporting (Referee → LM)
     MATCH_RESULT_REPORT = "MATCH_RESULT_REPORT"
     MATCH_RESULT_ACK = "MATCH_RESULT_ACK"
+    MATCH_RESULT_BATCH = "MATCH_RESULT_BATCH"
+    MATCH_RESULT_BATCH_ACK = "MATCH_RESULT_BATCH_ACK"
     # Query messages
     LEAGUE_QUERY = "LEAGUE_QUERY"
     LEAGUE_QUERY_RESPONSE = "LEAGUE_QUERY_RESPONSE"
@@ -62,6 +64,28 @@ class Status:
     REGISTERED = "ACCEPTED"
 
 
+class QueryType:
+    """LEAGUE_QUERY query types."""
+
+    GET_NEXT_MATCH = "GET_NEXT_MATCH"
+    GET_STANDINGS = "GET_STANDINGS"
+    GET_PLAYER_STATS = "GET_PLAYER_STATS"
+    GET_SCHEDULE = "GET_SCHEDULE"
+
+
+class StandingsMode:
+    """LEAGUE_STANDINGS_UPDATE encodings."""
+
+    FULL = "full"
+    DELTA = "delta"
+
+
+class Capability:
+    """Optional protocol features an agent can advertise at registration."""
+
+    STANDINGS_DELTA = "standings_delta"
+
+
 class Timeout:
     """Timeout keys for configuration lookup."""
 
@@ -0,0 +1,37 @@
+"""Agent state gauges, read when ``/metrics`` is scraped.
+
+Each agent registers functions over its own state, labelled with its ID, so
+nothing is updated on the message path: active matches and result reports
+waiting to be batched per referee, queued strategy calls per player, and
+matches still without a result in the League Manager's running rounds.
+"""
+
+from agents.league_manager.round_tracker import get_round_tracker
+from SHARED.league_sdk.metrics import get_metrics_registry
+
+_registry = get_metrics_registry()
+active_matches = _registry.gauge("referee_active_matches", "Matches the referee is running", ("referee_id",))
+result_batch_pending = _registry.gauge(
+    "referee_result_batch_pending", "Result reports waiting to be batched", ("referee_id",)
+)
+strategy_queue_depth = _registry.gauge(
+    "player_strategy_queue_depth", "Strategy calls queued or running off the loop", ("player_id",)
+)
+round_pending_matches = _registry.gauge(
+    "league_round_pending_matches", "Matches of running rounds without a result"
+)
+
+
+def track_referee(referee) -> None:
+    labels = (referee.referee_id,)
+    active_matches.set_function(labels, lambda: len(referee.active_matches))
+    batcher = referee.result_batcher
+    result_batch_pending.set_function(labels, lambda: batcher.pending_count if batcher else 0)
+
+
+def track_player(player) -> None:
+    strategy_queue_depth.set_function((player.player_id,), lambda: player.strategy_runner.queue_depth)
+
+
+def track_league_manager() -> None:
+    round_pending_matches.set_function((), lambda: get_round_tracker().pending_total)
@@ -6,107 +6,102 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import argparse
 import asyncio
+from typing import Callable, Optional
 
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from agents.agent_metrics import track_player
+from agents.player_decision_cache import create_decision_cache
 from agents.player_message_handlers import handle_mcp_message
-from agents.player_strategies import STRATEGIES, RandomStrategy
+from agents.player_opponent_history import OpponentHistoryCache
+from agents.player_standings import StandingsView
+from agents.player_strategies import create_strategy
+from agents.player_strategy_runner import create_strategy_runner
+from agents.player_registration import register_with_league_manager
 from SHARED.constants import (
-    AGENT_VERSION,
-    HTTP_PROTOCOL,
-    LOCALHOST,
-    MCP_PATH,
-    SERVER_HOST,
-    Field,
-    GameID,
-    LogEvent,
-    Status,
-    StrategyType,
+    HEALTH_PATH, HTTP_PROTOCOL, LOCALHOST, MCP_PATH, SERVER_HOST, Field, LogEvent, StrategyType,
 )
-from SHARED.contracts import build_league_register_request
-from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_response
-from SHARED.league_sdk.agent_comm import send_with_retry
-from SHARED.league_sdk.config_loader import load_agent_config, load_system_config
+from SHARED.league_sdk.admin_routes import add_admin_routes
+from SHARED.league_sdk.http_metrics import add_metrics
+from SHARED.league_sdk.config_service import get_agent_defaults
+from SHARED.league_sdk.log_policy import get_log_policy
+from SHARED.league_sdk.log_writer import exit_after_flush
 from SHARED.league_sdk.logger import LeagueLogger
+from SHARED.league_sdk.readiness import health_response
 
-_system_config = load_system_config()
-_agents_config = load_agent_config()
-_lm_endpoint = _agents_config["league_manager"]["endpoint"]
+
+def _exit_process() -> None:
+    exit_after_flush(0)
 
 
 class GenericPlayer:
-    """Generic player that can use any strategy."""
+    """Generic player that can use any strategy.
+
+    With ``serve=False`` (hosted by a pool or the in-process league, which
+    dispatch to it directly) no FastAPI app of its own is built.
+    """
 
-    def __init__(self, player_id: str, strategy_name: str, port: int):
+    def __init__(self, player_id: str, strategy_name: str, port: int, seed: Optional[int] = None,
+                 endpoint: Optional[str] = None, serve: bool = True):
         self.player_id, self.port = player_id, port
-        self.endpoint = f"{HTTP_PROTOCOL}://{LOCALHOST}:{port}{MCP_PATH}"
+        self.endpoint = endpoint or f"{HTTP_PROTOCOL}://{LOCALHOST}:{port}{MCP_PATH}"
+        # Called once the player has shut down; a pooled host replaces it
+        self.on_shutdown: Callable[[], None] = _exit_process
         self.logger = LeagueLogger(player_id)
-        self.strategy = STRATEGIES.get(strategy_name, RandomStrategy)()
+        # Explicit seed wins; otherwise config, then the seed assigned by the LM
+        defaults = get_agent_defaults("player")
+        get_log_policy(player_id).set_level(defaults.get("logging_level"))
+        settings = defaults.get("strategy_settings", {})
+        self.strategy = create_strategy(strategy_name, settings.get(strategy_name))
+        self.seed = seed if seed is not None else settings.get(strategy_name, {}).get(Field.SEED)
         self.auth_token = None
-        self.app = FastAPI(title=f"Player {player_id}")
-        self._setup_routes()
+        self.standings = StandingsView()
+        self.opponent_history = OpponentHistoryCache(player_id, **defaults.get("opponent_history", {}))
+        self.opponent_history.load()
+        execution = defaults.get("strategy_execution", {})
+        self.strategy_runner = create_strategy_runner(execution)
+        self.strategy_runner.prime(self.strategy, self.opponent_history.items())
+        self.decisions = create_decision_cache(
+            execution, self.strategy, self.strategy_runner, self.opponent_history
+        )
+        self.app: Optional[FastAPI] = None
+        if serve:
+            self.app = FastAPI(title=f"Player {player_id}")
+            self._setup_routes()
+            add_admin_routes(self.app)
+            add_metrics(self.app, player_id)
+        track_player(self)
 
     def _setup_routes(self):
         @self.app.post("/mcp")
         async def mcp_endpoint(request: Request) -> JSONResponse:
             return await handle_mcp_message(self, request)
 
+        @self.app.get(HEALTH_PATH)
+        async def health() -> dict:
+            return health_response(self.player_id)
+
         @self.app.on_event("startup")
         async def startup():
             self.logger.log_message(
                 LogEvent.STARTUP, {Field.PLAYER_ID: self.player_id, "port": self.port}
             )
-            asyncio.create_task(self._register_with_lm())
-
-    async def _register_with_lm(self):
-        try:
-            await asyncio.sleep(2)
-            msg = build_league_register_request(
-                player_id=self.player_id,
-                display_name=f"Player {self.player_id}",
-                version=AGENT_VERSION,
-                contact_endpoint=self.endpoint,
-                game_types=[GameID.EVEN_ODD],
-            )
-            self.logger.log_message("REGISTERING", {"endpoint": _lm_endpoint})
-            resp = await send_with_retry(
-                _lm_endpoint,
-                msg,
-                max_retries=_system_config.retry_policy["max_retries"],
-                timeout=_system_config.timeouts["http_request"],
-                retry_delay=_system_config.retry_policy["retry_delay"],
-            )
-            # Extract content from JSON-RPC response (result or params)
-            if resp:
-                if is_jsonrpc_response(resp):
-                    inner = resp.get("result", {})
-                else:
-                    inner = extract_jsonrpc_params(resp)
-                status = inner.get(Field.STATUS)
-                if status in (Status.ACCEPTED, Status.REGISTERED):
-                    self.auth_token = inner.get(Field.AUTH_TOKEN)
-                    self.logger.log_message(LogEvent.PLAYER_REGISTERED, {Field.PLAYER_ID: self.player_id})
-                else:
-                    self.logger.log_error(LogEvent.ERROR, f"Registration failed: {resp}")
-            else:
-                self.logger.log_error(LogEvent.ERROR, "Registration failed: No response")
-        except Exception as e:
-            self.logger.log_error("REGISTRATION_EXCEPTION", f"{type(e).__name__}: {e}")
+            asyncio.create_task(register_with_league_manager(self))
 
     async def _shutdown_gracefully(self):
         await asyncio.sleep(1)
         self.logger.log_message("SHUTDOWN_INITIATED", {Field.PLAYER_ID: self.player_id})
-        import os
-        os._exit(0)
+        self.opponent_history.persist()
+        self.on_shutdown()
 
     def run(self):
         uvicorn.run(self.app, host=SERVER_HOST, port=self.port)
 
 
-def create_app(player_id: str, port: int, strategy_name: str) -> FastAPI:
-    return GenericPlayer(player_id, strategy_name, port).app
+def create_app(player_id: str, port: int, strategy_name: str, seed: Optional[int] = None) -> FastAPI:
+    return GenericPlayer(player_id, strategy_name, port, seed).app
 
 
 def main():
@@ -115,8 +110,9 @@ def main():
     all_strategies = [StrategyType.RANDOM, StrategyType.FREQUENCY, StrategyType.PATTERN, StrategyType.TIMEOUT]
     parser.add_argument("--strategy", required=True, choices=all_strategies)
     parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=None)
     args = parser.parse_args()
-    GenericPlayer(args.player_id, args.strategy, args.port).run()
+    GenericPlayer(args.player_id, args.strategy, args.port, args.seed).run()
 
 
 if __name__ == "__main__":
@@ -2,80 +2,61 @@
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-import argparse, asyncio, os
+import argparse, asyncio
+from typing import Callable, Optional
 import uvicorn
 from fastapi import BackgroundTasks, FastAPI, Request
 from fastapi.responses import JSONResponse
+from agents.agent_metrics import track_referee
 from agents.referee_game_logic import get_game_rules
-from agents.referee_http_handlers import (
-    handle_broadcast_message, handle_game_join_ack, handle_parity_choice, handle_round_announcement)
+from agents.referee_dispatch import handle_referee_request
 from agents.referee_match_runner import run_match_phases
+from agents.referee_result_batcher import create_result_batcher
 from SHARED.constants import (
     AGENT_VERSION, HTTP_PROTOCOL, LOCALHOST, MCP_PATH, SERVER_HOST,
-    Field, GameID, LogEvent, MessageType, Status)
+    HEALTH_PATH, Field, GameID, LogEvent, Status, Timeout)
 from SHARED.contracts import build_referee_register_request
-from SHARED.contracts.jsonrpc_helpers import (
-    extract_jsonrpc_params,
-    get_jsonrpc_id,
-    is_jsonrpc_request,
-    is_jsonrpc_response,
-    wrap_jsonrpc_response,
-)
+from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_response
 from SHARED.league_sdk.agent_comm import send_with_retry
-from SHARED.league_sdk.config_loader import load_agent_config, load_system_config
+from SHARED.league_sdk.admin_routes import add_admin_routes
+from SHARED.league_sdk.http_metrics import add_metrics
+from SHARED.league_sdk.config_service import get_agent_defaults, get_lm_endpoint, get_system_config
+from SHARED.league_sdk.log_policy import get_log_policy
+from SHARED.league_sdk.endpoint_cache import EndpointCache
 from SHARED.league_sdk.logger import LeagueLogger
-
-_system_config = load_system_config()
-_agents_config = load_agent_config()
-_lm_endpoint = _agents_config["league_manager"]["endpoint"]
+from SHARED.league_sdk.tracing import span
+from SHARED.league_sdk.log_writer import exit_after_flush
+from SHARED.league_sdk.readiness import health_response, wait_until_ready
 
 
 class GenericReferee:
     """Generic referee that can manage any game type."""
 
-    def __init__(self, referee_id: str, port: int, game_type: str = GameID.EVEN_ODD):
+    def __init__(self, referee_id: str, port: int, game_type: str = GameID.EVEN_ODD,
+                 endpoint: Optional[str] = None):
         self.referee_id, self.port, self.game_type = referee_id, port, game_type
-        self.endpoint = f"{HTTP_PROTOCOL}://{LOCALHOST}:{port}{MCP_PATH}"
+        self.endpoint = endpoint or f"{HTTP_PROTOCOL}://{LOCALHOST}:{port}{MCP_PATH}"
+        self.on_shutdown: Callable[[], None] = exit_after_flush  # Replaced when pooled
         self.logger = LeagueLogger(referee_id)
+        get_log_policy(referee_id).set_level(get_agent_defaults("referee").get("logging_level"))
         self.game_rules = get_game_rules(game_type)
         self.active_matches, self.auth_token = {}, None
+        self.player_endpoints = EndpointCache()  # Pushed by the LM in round announcements
+        self.result_batcher = create_result_batcher(referee_id, get_lm_endpoint(), self.logger)
         self.app = FastAPI(title=f"Referee {referee_id}")
         self.setup_routes()
+        add_admin_routes(self.app)
+        add_metrics(self.app, referee_id)
+        track_referee(self)
 
     def setup_routes(self):
         @self.app.post(MCP_PATH)
         async def mcp_endpoint(request: Request, background_tasks: BackgroundTasks) -> JSONResponse:
-            try:
-                raw = await request.json()
-                self.logger.log_message(LogEvent.RECEIVED, raw)
-                message = extract_jsonrpc_params(raw) if is_jsonrpc_request(raw) else raw
-                request_id = get_jsonrpc_id(raw) if is_jsonrpc_request(raw) else None
-                msg_type = message.get(Field.MESSAGE_TYPE)
-                if msg_type == MessageType.ROUND_ANNOUNCEMENT:
-                    response = handle_round_announcement(message, self, background_tasks, request_id)
-                elif msg_type == MessageType.GAME_JOIN_ACK:
-                    response = handle_game_join_ack(message, self, request_id)
-                elif msg_type == MessageType.PARITY_CHOICE:
-                    response = handle_parity_choice(message, self, request_id)
-                elif msg_type in (MessageType.ROUND_COMPLETED, MessageType.LEAGUE_STANDINGS_UPDATE,
-                                  MessageType.LEAGUE_COMPLETED):
-                    response = handle_broadcast_message(message, self, request_id)
-                    if msg_type == MessageType.LEAGUE_COMPLETED:
-                        asyncio.create_task(self._shutdown_gracefully())
-                elif msg_type == MessageType.SHUTDOWN_COMMAND:
-                    self.logger.log_message("SHUTDOWN_RECEIVED", {})
-                    result = {Field.STATUS: Status.ACKNOWLEDGED}
-                    response = wrap_jsonrpc_response(result, request_id) if request_id else result
-                    asyncio.create_task(self._shutdown_gracefully())
-                else:
-                    response = {Field.STATUS: Status.ERROR, "message": "Unknown message type"}
-                self.logger.log_message(LogEvent.SENT, response)
-                return JSONResponse(content=response)
-            except Exception as e:
-                self.logger.log_error(LogEvent.REQUEST_ERROR, str(e))
-                return JSONResponse(
-                    content={Field.STATUS: Status.ERROR, "message": str(e)}, status_code=500
-                )
+            return await handle_referee_request(self, request, background_tasks)
+
+        @self.app.get(HEALTH_PATH)
+        async def health() -> dict:
+            return health_response(self.referee_id)
 
         @self.app.on_event("startup")
         async def startup():
@@ -85,8 +66,9 @@ class GenericReferee:
             asyncio.create_task(self.register_with_league_manager())
 
     async def register_with_league_manager(self):
-        try:
-            await asyncio.sleep(2)
+        try:  # Register the moment the League Manager answers its health probe
+            config = get_system_config()
+            await wait_until_ready(get_lm_endpoint(), config.timeouts[Timeout.AGENT_STARTUP])
             register_msg = build_referee_register_request(
                 referee_id=self.referee_id,
                 display_name=f"Referee {self.referee_id}",
@@ -94,13 +76,13 @@ class GenericReferee:
                 contact_endpoint=self.endpoint,
                 game_types=[self.game_type],
             )
-            self.logger.log_message("REGISTERING", {"endpoint": _lm_endpoint})
+            self.logger.log_message("REGISTERING", {"endpoint": get_lm_endpoint()})
             response = await send_with_retry(
-                _lm_endpoint,
+                get_lm_endpoint(),
                 register_msg,
-                max_retries=_system_config.retry_policy["max_retries"],
-                timeout=_system_config.timeouts["http_request"],
-                retry_delay=_system_config.retry_policy["retry_delay"],
+                max_retries=config.retry_policy["max_retries"],
+                timeout=config.timeouts["http_request"],
+                retry_delay=config.retry_policy["retry_delay"],
             )
             # Extract content from JSON-RPC response (result or params)
             if response:
@@ -121,13 +103,16 @@ class GenericReferee:
         except Exception as e:
             self.logger.log_error("REGISTRATION_EXCEPTION", f"{type(e).__name__}: {e}")
 
-    async def run_match(self, league_id, round_id, match_id, player_a, player_b, ep_a, ep_b):
-        await run_match_phases(self, league_id, round_id, match_id, player_a, player_b, ep_a, ep_b)
+    async def run_match(self, league_id, round_id, match_id, player_a, player_b, ep_a, ep_b, seed=None):
+        with span("match", self.referee_id, match_id=match_id, round_id=round_id):
+            await run_match_phases(self, league_id, round_id, match_id, player_a, player_b, ep_a, ep_b, seed)
 
     async def _shutdown_gracefully(self):
         await asyncio.sleep(1)
         self.logger.log_message("SHUTDOWN_INITIATED", {Field.REFEREE_ID: self.referee_id})
-        os._exit(0)
+        if self.result_batcher is not None:
+            await self.result_batcher.flush()  # Deliver results still lingering
+        self.on_shutdown()
 
     def run(self):
         uvicorn.run(self.app, host=SERVER_HOST, port=self.port)
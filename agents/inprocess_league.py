@@ -0,0 +1,110 @@
+"""All-in-one league: League Manager, referees and players in one event loop.
+
+Every agent is wired to an InProcessTransport instead of an HTTP server, so
+messages go straight to the same handlers the HTTP endpoints use - the exact
+protocol logic, without sockets, JSON encoding or process startup. Intended
+for benchmarking, CI and simulation. The loop lag monitor (and blocking-call
+watchdog, if enabled) watches the shared loop, reporting under the League
+Manager.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import BackgroundTasks
+
+from agents.generic_player import GenericPlayer
+from agents.generic_referee import GenericReferee
+from agents.player_message_handlers import handle_raw_message
+from agents.player_registration import register_with_league_manager
+from agents.referee_dispatch import handle_raw_referee_message
+from SHARED.league_sdk.agent_comm import set_transport
+from SHARED.league_sdk.config_service import get_agent_config, get_lm_endpoint
+from SHARED.constants import AgentID
+from SHARED.league_sdk.inprocess_transport import InProcessTransport
+from SHARED.league_sdk.loop_lag import configured_interval_s, ensure_loop_lag_monitor, stop_loop_lag_monitor
+from SHARED.league_sdk.loop_watchdog import create_watchdog
+from SHARED.league_sdk.repositories import StandingsRepository
+
+PlayerSpec = Tuple[str, str, Optional[int]]  # (player_id, strategy_name, seed)
+
+
+def inprocess_endpoint(agent_id: str) -> str:
+    """Contact endpoint of an agent hosted in-process."""
+    return f"inproc://{agent_id}/mcp"
+
+
+def _with_background_tasks(handle: Callable[[Dict[str, Any], BackgroundTasks], Any]):
+    """Adapt a (message, background_tasks) handler; tasks run after the reply, as over HTTP."""
+    async def handler(message: Dict[str, Any]) -> Dict[str, Any]:
+        tasks = BackgroundTasks()
+        response = handle(message, tasks)
+        if asyncio.iscoroutine(response):
+            response = await response
+        asyncio.ensure_future(tasks())
+        return response
+    return handler
+
+
+def _configured_players() -> List[PlayerSpec]:
+    players = get_agent_config()["players"]
+    return [(p["player_id"], p["strategy"], None) for p in players if p.get("active", True)]
+
+
+def _configured_referees() -> List[str]:
+    return [r["referee_id"] for r in get_agent_config()["referees"] if r.get("active", True)]
+
+
+async def run_league_in_process(
+    players: Optional[Iterable[PlayerSpec]] = None, referee_ids: Optional[Iterable[str]] = None,
+    debug: bool = False, inter_round_delay_s: float = 0.0, timeout: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Run a whole league in this event loop and return the final standings.
+
+    Args:
+        players: (player_id, strategy, seed) specs; defaults to agents_config.json
+        referee_ids: Referee IDs; defaults to agents_config.json
+        debug: Round-trip every message through JSON (serialization checks)
+        inter_round_delay_s: Pause between rounds (the HTTP league waits 2s)
+        timeout: Give up after this many seconds (None waits for completion)
+    """
+    from agents.league_manager import league_completion
+    from agents.league_manager import main as league_manager
+
+    players = list(players) if players is not None else _configured_players()
+    referee_ids = list(referee_ids) if referee_ids is not None else _configured_referees()
+    transport = InProcessTransport(debug=debug)
+    set_transport(transport)
+
+    done = asyncio.Event()
+    league_completion.set_exit_handler(done.set)
+    league_manager.league_config.inter_round_delay_s = inter_round_delay_s
+    league_manager.league_config.completion_grace_s = 0
+    league_manager.set_expected_agents(len(players), len(referee_ids))
+    transport.register_endpoint(get_lm_endpoint(), _with_background_tasks(league_manager.handle_raw_message))
+
+    referees = []
+    for referee_id in referee_ids:
+        referee = GenericReferee(referee_id, 0, endpoint=inprocess_endpoint(referee_id))
+        referee.on_shutdown = lambda: None
+        transport.register_endpoint(
+            referee.endpoint,
+            _with_background_tasks(lambda msg, tasks, r=referee: handle_raw_referee_message(r, msg, tasks)),
+        )
+        referees.append(referee)
+    hosted = []
+    for player_id, strategy_name, seed in players:
+        player = GenericPlayer(player_id, strategy_name, 0, seed, inprocess_endpoint(player_id), serve=False)
+        player.on_shutdown = lambda: None
+        transport.register_endpoint(player.endpoint, lambda msg, p=player: handle_raw_message(p, msg))
+        hosted.append(player)
+
+    ensure_loop_lag_monitor(configured_interval_s(), create_watchdog(AgentID.LEAGUE_MANAGER))
+    try:
+        await asyncio.gather(*(referee.register_with_league_manager() for referee in referees))
+        await asyncio.gather(*(register_with_league_manager(player) for player in hosted))
+        await asyncio.wait_for(done.wait(), timeout=timeout)
+    finally:
+        stop_loop_lag_monitor()
+    standings = StandingsRepository(league_manager.league_config.league_id).load()
+    return standings.get("standings", [])
@@ -0,0 +1,48 @@
+"""Launch many players in one process behind a single port.
+
+By default hosts every active player from agents_config.json. With --count,
+hosts N synthetic players (P0001, P0002, ...) instead, cycling through the
+given strategies - useful for large leagues on one machine.
+
+Usage:
+    python agents/launch_player_pool.py --port 8100
+    python agents/launch_player_pool.py --port 8100 --count 1000 --strategies random frequency
+"""
+
+import argparse
+import itertools
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.player_pool import PlayerPool
+from SHARED.constants import StrategyType
+from SHARED.league_sdk.config_service import get_agent_config
+
+
+def _configured_players():
+    players = get_agent_config()["players"]
+    return [(p["player_id"], p["strategy"], None) for p in players if p.get("active", True)]
+
+
+def _synthetic_players(count, strategies):
+    cycle = itertools.cycle(strategies)
+    return [(f"P{i:04d}", next(cycle), None) for i in range(1, count + 1)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--count", type=int, default=None)
+    parser.add_argument(
+        "--strategies", nargs="+", default=[StrategyType.RANDOM],
+        choices=[StrategyType.RANDOM, StrategyType.FREQUENCY, StrategyType.PATTERN],
+    )
+    parser.add_argument("--registration-stagger-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    specs = _synthetic_players(args.count, args.strategies) if args.count else _configured_players()
+    print(f"Starting player pool with {len(specs)} players on port {args.port}...")
+    PlayerPool(args.port, specs, args.registration_stagger_ms / 1000).run()
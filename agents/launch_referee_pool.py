@@ -0,0 +1,38 @@
+"""Launch several logical referees in one process behind a single port.
+
+By default hosts every active referee from agents_config.json. With --count,
+hosts K referees (REF001, REF002, ...) instead. Each referee registers with
+the League Manager separately; all of them share one HTTP connection pool.
+
+Usage:
+    python agents/launch_referee_pool.py --port 8010
+    python agents/launch_referee_pool.py --port 8010 --count 16
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.referee_pool import RefereePool
+from SHARED.constants import GameID
+from SHARED.league_sdk.config_service import get_agent_config
+
+
+def _configured_referees():
+    referees = get_agent_config()["referees"]
+    return [r["referee_id"] for r in referees if r.get("active", True)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--count", type=int, default=None)
+    parser.add_argument("--game-type", default=GameID.EVEN_ODD)
+    args = parser.parse_args()
+
+    ids = [f"REF{i:03d}" for i in range(1, args.count + 1)] if args.count else _configured_referees()
+    print(f"Starting referee pool with {len(ids)} referees on port {args.port}...")
+    RefereePool(args.port, ids, args.game_type).run()
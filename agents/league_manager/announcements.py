@@ -0,0 +1,61 @@
+"""League Manager - Targeted round announcements.
+
+Instead of broadcasting the full round schedule to every agent, each referee
+receives only the matches it runs and each player only its own fixtures.
+Every message carries total_matches so recipients still see the round size.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from SHARED.constants import Field, LogEvent
+from SHARED.contracts import build_round_announcement
+from SHARED.league_sdk.agent_comm import send
+
+
+def split_assignments(
+    assignments: List[Dict[str, Any]],
+    registered_players: Dict[str, Any],
+    registered_referees: Dict[str, Any],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Map each registered agent endpoint to the assignments it should receive."""
+    # Agents without matches this round still get the round header
+    per_endpoint: Dict[str, List[Dict[str, Any]]] = {
+        info[Field.ENDPOINT]: []
+        for info in list(registered_players.values()) + list(registered_referees.values())
+    }
+    for assignment in assignments:
+        per_endpoint.setdefault(assignment[Field.REFEREE_ENDPOINT], []).append(assignment)
+        for player_key in (Field.PLAYER_A_ID, Field.PLAYER_B_ID):
+            player = registered_players.get(assignment[player_key])
+            if player:
+                per_endpoint.setdefault(player[Field.ENDPOINT], []).append(assignment)
+    return per_endpoint
+
+
+async def send_round_announcements(
+    league_id: str,
+    round_id: int,
+    assignments: List[Dict[str, Any]],
+    registered_players: Dict[str, Any],
+    registered_referees: Dict[str, Any],
+    logger,
+) -> None:
+    """Send each agent its own ROUND_ANNOUNCEMENT concurrently."""
+    per_endpoint = split_assignments(assignments, registered_players, registered_referees)
+    endpoints = list(per_endpoint)
+    results = await asyncio.gather(
+        *(
+            send(
+                endpoint,
+                build_round_announcement(
+                    league_id, round_id, per_endpoint[endpoint], total_matches=len(assignments)
+                ),
+            )
+            for endpoint in endpoints
+        ),
+        return_exceptions=True,
+    )
+    for endpoint, result in zip(endpoints, results):
+        if isinstance(result, Exception):
+            logger.log_error(LogEvent.ERROR, f"Round announcement failed to {endpoint}: {result}")
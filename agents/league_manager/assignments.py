@@ -0,0 +1,41 @@
+"""League Manager - Match assignment building.
+
+Assignments carry everything a referee needs to run a match, including the
+player endpoints taken from the live session registry, so referees never
+resolve endpoints from config.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from SHARED.constants import Field, GameID
+from SHARED.league_sdk.seeding import match_seed
+
+
+def build_match_assignments(
+    round_matches: List[Dict[str, Any]],
+    registered_players: Dict[str, Any],
+    registered_referees: Dict[str, Any],
+    master_seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Assign a round's matches to referees and attach resolved endpoints.
+
+    Referees are assigned round-robin in ID order so runs are reproducible.
+    """
+    referee_list = sorted(registered_referees.items())
+    assignments = []
+    for i, match in enumerate(round_matches):
+        _, ref_info = referee_list[i % len(referee_list)]
+        player_a, player_b = match["player_a"], match["player_b"]
+        assignment = {
+            "match_id": match["match_id"],
+            "player_A_id": player_a,
+            "player_B_id": player_b,
+            "game_type": GameID.EVEN_ODD,
+            "referee_endpoint": ref_info.get("endpoint", ""),
+            Field.PLAYER_A_ENDPOINT: registered_players.get(player_a, {}).get("endpoint"),
+            Field.PLAYER_B_ENDPOINT: registered_players.get(player_b, {}).get("endpoint"),
+        }
+        if master_seed is not None:
+            assignment[Field.MATCH_SEED] = match_seed(master_seed, match["match_id"])
+        assignments.append(assignment)
+    return assignments
@@ -1,24 +1,20 @@
 """League Manager message handlers."""
 
-import asyncio
 from typing import Any, Dict, Optional
 
-from agents.league_manager.ranking import update_standings
-from agents.league_manager.round_tracker import get_round_tracker
+from agents.league_manager.result_recording import parse_match_result, record_results
 
 from SHARED.constants import Field, LogEvent, Status
 from SHARED.contracts import (
     build_league_register_response,
     build_match_result_ack,
+    build_match_result_batch_ack,
     build_referee_register_response,
 )
 from SHARED.league_sdk.config_models import LeagueConfig
 from SHARED.league_sdk.logger import LeagueLogger
-from SHARED.league_sdk.repositories import (
-    MatchRepository,
-    PlayerHistoryRepository,
-    StandingsRepository,
-)
+from SHARED.league_sdk.repositories import StandingsRepository
+from SHARED.league_sdk.seeding import player_seed
 from SHARED.league_sdk.session_manager import AgentType, get_session_manager
 
 
@@ -43,9 +39,12 @@ def handle_referee_register(
 
 def handle_league_register(
     message: Dict[str, Any], league_config: LeagueConfig, logger: LeagueLogger,
-    request_id: Optional[int] = None,
+    request_id: Optional[int] = None, master_seed: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Handle player registration request - delegates to SessionManager."""
+    """Handle player registration request - delegates to SessionManager.
+
+    When a league master seed is set, the player receives its derived seed.
+    """
     sender = message.get(Field.SENDER, "")
     player_id = sender.split(":")[-1] if ":" in sender else sender
     player_meta = message.get(Field.PLAYER_META, {})
@@ -66,9 +65,15 @@ def handle_league_register(
         logger.log_error(LogEvent.DUPLICATE_REGISTRATION, f"Player {player_id}")
         return {Status.ERROR: "Already registered"}
 
-    session_mgr.create_session(player_id, AgentType.PLAYER, endpoint)
+    session_mgr.create_session(
+        player_id, AgentType.PLAYER, endpoint,
+        metadata={Field.CAPABILITIES: player_meta.get(Field.CAPABILITIES, [])},
+    )
     logger.log_message(LogEvent.PLAYER_REGISTERED, {Field.PLAYER_ID: player_id})
-    return build_league_register_response(player_id, Status.ACCEPTED, request_id=request_id)
+    seed = player_seed(master_seed, player_id) if master_seed is not None else None
+    return build_league_register_response(
+        player_id, Status.ACCEPTED, request_id=request_id, seed=seed
+    )
 
 
 def handle_match_result_report(
@@ -78,53 +83,23 @@ def handle_match_result_report(
     request_id: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Handle match result report from referee."""
-    match_id = message.get(Field.MATCH_ID)
-    round_id = message.get(Field.ROUND_ID)
-    # Protocol v2: result is a nested object
-    result = message.get(Field.RESULT, {})
-    winner = result.get("winner")
-
-    # Extract player IDs from the result's score keys or from sender context
-    score = result.get("score", {})
-    player_ids = list(score.keys())
-    player_a = player_ids[0] if len(player_ids) > 0 else None
-    player_b = player_ids[1] if len(player_ids) > 1 else None
+    match_data = parse_match_result(message)
+    record_results([match_data], league_config, logger)
+    return build_match_result_ack(match_data[Field.MATCH_ID], request_id=request_id)
+
 
+def handle_match_result_batch(
+    message: Dict[str, Any],
+    league_config: LeagueConfig,
+    logger: LeagueLogger,
+    request_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Handle a MATCH_RESULT_BATCH: all results are applied in one standings update."""
+    matches = [parse_match_result(report) for report in message.get(Field.REPORTS, [])]
     logger.log_message(
-        LogEvent.MATCH_RESULT,
-        {Field.MATCH_ID: match_id, Field.ROUND_ID: round_id, Field.WINNER: winner},
+        LogEvent.MATCH_RESULT_BATCH, {Field.SENDER: message.get(Field.SENDER), "count": len(matches)}
     )
-
-    # Save match data
-    match_repo = MatchRepository(league_config.league_id)
-    match_data = {
-        Field.MATCH_ID: match_id,
-        Field.PLAYER_A_ID: player_a,
-        Field.PLAYER_B_ID: player_b,
-        Field.WINNER: winner,
-        Field.ROUND_ID: round_id,
-        "timestamp": message.get("timestamp"),
-    }
-    match_repo.save_match(match_id, match_data)
-
-    # Save match to player histories
-    for player_id in [player_a, player_b]:
-        if player_id:
-            history_repo = PlayerHistoryRepository(player_id)
-            history_repo.append_match(match_data)
-
-    # Update standings
-    if player_a and player_b:
-        update_standings(player_a, player_b, winner, league_config)
-
-    # Record result in round tracker (for round completion detection)
-    tracker = get_round_tracker()
-    asyncio.create_task(
-        tracker.record_result(
-            round_id,
-            match_id,
-            {"match_id": match_id, "winner": winner, "player_a": player_a, "player_b": player_b},
-        )
+    record_results(matches, league_config, logger)
+    return build_match_result_batch_ack(
+        [m[Field.MATCH_ID] for m in matches], request_id=request_id
     )
-
-    return build_match_result_ack(match_id, request_id=request_id)
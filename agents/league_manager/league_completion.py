@@ -1,15 +1,23 @@
 """League completion logic for League Manager."""
 
 import asyncio
-import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from agents.league_manager.broadcast import broadcast_to_agents
 
 from SHARED.constants import Field
 from SHARED.contracts import build_league_completed
+from SHARED.league_sdk.log_writer import exit_after_flush
 from SHARED.league_sdk.repositories import StandingsRepository
 
+_exit_handler: Callable[[], None] = exit_after_flush
+
+
+def set_exit_handler(handler: Callable[[], None]) -> None:
+    """Replace what the League Manager does once the league is over (default: exit the process)."""
+    global _exit_handler
+    _exit_handler = handler
+
 
 async def send_league_completed(
     league_config, registered_players, registered_referees, logger, state
@@ -37,6 +45,6 @@ async def send_league_completed(
     )
     await broadcast_to_agents(msg, registered_players, registered_referees, logger)
     logger.log_message("LEAGUE_COMPLETED_SENT", {"standings": final_list})
-    await asyncio.sleep(3)
+    await asyncio.sleep(league_config.completion_grace_s)
     logger.log_message("SHUTDOWN_INITIATED", {"league_id": league_config.league_id})
-    os._exit(0)
+    _exit_handler()
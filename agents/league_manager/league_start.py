@@ -0,0 +1,66 @@
+"""League Manager - Auto-start once all expected agents are registered."""
+
+from typing import Any, Dict
+
+from fastapi import BackgroundTasks
+
+from agents.league_manager.match_orchestration import run_league_matches
+from agents.league_manager.standings_versions import get_versioned_standings
+from SHARED.league_sdk.config_models import LeagueConfig
+from SHARED.league_sdk.logger import LeagueLogger
+from SHARED.league_sdk.repositories import StandingsRepository
+from SHARED.league_sdk.session_manager import AgentType, get_session_manager
+
+
+def reset_standings(league_id: str) -> None:
+    """Zero all standings rows for a fresh league start."""
+    standings_repo = StandingsRepository(league_id)
+    standings = standings_repo.load()
+    for player in standings.get("standings", []):
+        player["wins"] = 0
+        player["losses"] = 0
+        player["draws"] = 0
+        player["points"] = 0
+        player["games_played"] = 0
+        player["rank"] = 0
+    standings_repo.save(standings)
+
+
+async def maybe_start_league(
+    background_tasks: BackgroundTasks,
+    league_config: LeagueConfig,
+    league_state: Dict[str, Any],
+    logger: LeagueLogger,
+    expected_players: int,
+    expected_referees: int,
+) -> None:
+    """Auto-start league if all expected agents are registered."""
+    if league_state["league_started"]:
+        return  # Already started
+
+    session_manager = get_session_manager()
+    registered_players = session_manager.get_registered_agents_data(AgentType.PLAYER)
+    registered_referees = session_manager.get_registered_agents_data(AgentType.REFEREE)
+
+    if len(registered_players) >= expected_players and len(registered_referees) >= expected_referees:
+        league_state["league_started"] = True
+
+        reset_standings(league_config.league_id)
+        get_versioned_standings().reset()
+        league_state["matches_completed"] = 0
+        league_state["current_round"] = 0
+
+        logger.log_message("ALL_AGENTS_REGISTERED", {
+            "players": len(registered_players),
+            "referees": len(registered_referees),
+        })
+
+        # Start league in background
+        background_tasks.add_task(
+            run_league_matches,
+            league_config,
+            registered_players,
+            registered_referees,
+            logger,
+            league_state,
+        )
@@ -5,22 +5,33 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 import uvicorn
 from fastapi import BackgroundTasks, FastAPI, Request
 from fastapi.responses import JSONResponse
-from agents.league_manager.handlers import handle_league_register, handle_match_result_report, handle_referee_register
-from agents.league_manager.match_orchestration import run_league_matches
-from SHARED.constants import MCP_PATH, AgentID, Field, GameStatus, LogEvent, MessageType, Status
+from agents.league_manager.handlers import (
+    handle_league_register, handle_match_result_batch, handle_match_result_report, handle_referee_register)
+from agents.agent_metrics import track_league_manager
+from agents.league_manager.league_start import maybe_start_league
+from agents.league_manager.query_handlers import handle_league_query
+from SHARED.constants import HEALTH_PATH, MCP_PATH, AgentID, Field, GameStatus, LogEvent, MessageType, Status
 from SHARED.contracts import build_league_status
 from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, get_jsonrpc_id, is_jsonrpc_request
-from SHARED.league_sdk.config_loader import load_agent_config, load_league_config, load_system_config
+from SHARED.league_sdk.admin_routes import add_admin_routes
+from SHARED.league_sdk.http_metrics import add_metrics
+from SHARED.league_sdk.config_loader import load_league_config
+from SHARED.league_sdk.config_service import get_agent_config, get_system_config
 from SHARED.league_sdk.logger import LeagueLogger
-from SHARED.league_sdk.repositories import StandingsRepository
-from SHARED.league_sdk.session_manager import AgentType, get_session_manager
+from SHARED.league_sdk.readiness import health_response
+from SHARED.league_sdk.seeding import resolve_master_seed
+from SHARED.league_sdk.session_manager import get_session_manager
+from SHARED.league_sdk.tracing import server_span
 
 app = FastAPI(title="League Manager")
+add_admin_routes(app)
+add_metrics(app, AgentID.LEAGUE_MANAGER)
+track_league_manager()
 logger = LeagueLogger(AgentID.LEAGUE_MANAGER)
-system_config = load_system_config()
+system_config = get_system_config()
 active_league_id = system_config.active_league_id
-league_config = load_league_config(active_league_id)
-agents_config = load_agent_config()
+league_config = load_league_config(active_league_id)  # Own copy: league settings are mutable at runtime
+agents_config = get_agent_config()
 
 # Session manager handles all agent registrations
 session_manager = get_session_manager()
@@ -31,6 +42,7 @@ league_state = {
     "current_round": 0,
     "matches_completed": 0,
     "league_started": False,  # Track if league has auto-started
+    "master_seed": resolve_master_seed(league_config.seed),  # Reproducible runs
 }
 
 # Expected counts from agents config
@@ -38,63 +50,48 @@ _expected_players = len(agents_config.get("players", []))
 _expected_referees = len(agents_config.get("referees", []))
 
 
+def set_expected_agents(players: int, referees: int) -> None:
+    """Override how many registrations auto-start the league (default: agents_config)."""
+    global _expected_players, _expected_referees
+    _expected_players, _expected_referees = players, referees
+
+
 async def _maybe_start_league(background_tasks: BackgroundTasks) -> None:
     """Auto-start league if all expected agents are registered."""
-    if league_state["league_started"]:
-        return  # Already started
-    
-    registered_players = session_manager.get_registered_agents_data(AgentType.PLAYER)
-    registered_referees = session_manager.get_registered_agents_data(AgentType.REFEREE)
-    
-    if len(registered_players) >= _expected_players and len(registered_referees) >= _expected_referees:
-        league_state["league_started"] = True
-        
-        # Reset standings for fresh league start
-        standings_repo = StandingsRepository(league_config.league_id)
-        standings = standings_repo.load()
-        for player in standings.get("standings", []):
-            player["wins"] = 0
-            player["losses"] = 0
-            player["draws"] = 0
-            player["points"] = 0
-            player["games_played"] = 0
-            player["rank"] = 0
-        standings_repo.save(standings)
-        league_state["matches_completed"] = 0
-        league_state["current_round"] = 0
-
-        logger.log_message("ALL_AGENTS_REGISTERED", {
-            "players": len(registered_players),
-            "referees": len(registered_referees),
-        })
-        
-        # Start league in background
-        background_tasks.add_task(
-            run_league_matches,
-            league_config,
-            registered_players,
-            registered_referees,
-            logger,
-            league_state,
-        )
+    await maybe_start_league(
+        background_tasks, league_config, league_state, logger, _expected_players, _expected_referees
+    )
 
 
 @app.post(MCP_PATH)
 async def mcp_endpoint(request: Request, background_tasks: BackgroundTasks) -> JSONResponse:
     """Handle all MCP protocol messages."""
     try:
-        raw = await request.json()
-        logger.log_message(LogEvent.RECEIVED, raw)
-        message = extract_jsonrpc_params(raw) if is_jsonrpc_request(raw) else raw
-        request_id = get_jsonrpc_id(raw)  # Extract JSON-RPC request ID for responses
-        msg_type = message.get(Field.MESSAGE_TYPE)
+        response = await handle_raw_message(await request.json(), background_tasks)
+        return JSONResponse(content=response)
+    except Exception as e:
+        logger.log_error(LogEvent.REQUEST_ERROR, str(e))
+        return JSONResponse(
+            content={Field.STATUS: Status.ERROR, "message": str(e)}, status_code=500
+        )
+
 
+async def handle_raw_message(raw: dict, background_tasks: BackgroundTasks) -> dict:
+    """Handle one decoded message (HTTP body or in-process delivery)."""
+    logger.log_message(LogEvent.RECEIVED, raw)
+    message = extract_jsonrpc_params(raw) if is_jsonrpc_request(raw) else raw
+    request_id = get_jsonrpc_id(raw)  # Extract JSON-RPC request ID for responses
+    msg_type = message.get(Field.MESSAGE_TYPE)
+
+    with server_span(logger.agent_id, raw):
         if msg_type == MessageType.REFEREE_REGISTER_REQUEST:
             response = handle_referee_register(message, logger, request_id=request_id)
             # Check if all agents are now registered and auto-start league
             await _maybe_start_league(background_tasks)
         elif msg_type == MessageType.LEAGUE_REGISTER_REQUEST:
-            response = handle_league_register(message, league_config, logger, request_id=request_id)
+            response = handle_league_register(
+                message, league_config, logger, request_id, league_state["master_seed"]
+            )
             # Check if all agents are now registered and auto-start league
             await _maybe_start_league(background_tasks)
         elif msg_type == MessageType.LEAGUE_STATUS:
@@ -108,16 +105,21 @@ async def mcp_endpoint(request: Request, background_tasks: BackgroundTasks) -> J
             )
         elif msg_type == MessageType.MATCH_RESULT_REPORT:
             response = handle_match_result_report(message, league_config, logger, request_id=request_id)
+        elif msg_type == MessageType.MATCH_RESULT_BATCH:
+            response = handle_match_result_batch(message, league_config, logger, request_id=request_id)
+        elif msg_type == MessageType.LEAGUE_QUERY:
+            response = handle_league_query(message, logger, request_id=request_id)
         else:
             response = {Field.STATUS: Status.ERROR, "message": "Unknown message type"}
 
-        logger.log_message(LogEvent.SENT, response)
-        return JSONResponse(content=response)
-    except Exception as e:
-        logger.log_error(LogEvent.REQUEST_ERROR, str(e))
-        return JSONResponse(
-            content={Field.STATUS: Status.ERROR, "message": str(e)}, status_code=500
-        )
+    logger.log_message(LogEvent.SENT, response)
+    return response
+
+
+@app.get(HEALTH_PATH)
+async def health() -> dict:
+    """Readiness probe: answers as soon as the server is listening."""
+    return health_response(AgentID.LEAGUE_MANAGER)
 
 
 @app.on_event("startup")
@@ -13,6 +13,7 @@ from agents.league_manager.round_execution import execute_round, send_round_comp
 from agents.league_manager.scheduler import get_match_schedule
 
 from SHARED.constants import Field, GameStatus
+from SHARED.league_sdk.seeding import resolve_master_seed
 
 
 async def run_league_matches(
@@ -33,7 +34,14 @@ async def run_league_matches(
             },
         )
         state["league_status"] = GameStatus.ACTIVE
-        schedule = get_match_schedule()
+        master_seed = state.get("master_seed")
+        if master_seed is None:
+            master_seed = state["master_seed"] = resolve_master_seed(league_config.seed)
+        logger.log_message(
+            "LEAGUE_SEED", {Field.LEAGUE_ID: league_config.league_id, Field.SEED: master_seed}
+        )
+        # Schedule the agents that actually registered (not the static config)
+        schedule = get_match_schedule(sorted(registered_players), sorted(registered_referees))
         total_rounds = len(schedule)
         logger.log_message(
             "SCHEDULE_LOADED",
@@ -56,7 +64,7 @@ async def run_league_matches(
                 state,
             )
             round_results.extend(current_round_results)
-            await asyncio.sleep(2)
+            await asyncio.sleep(league_config.inter_round_delay_s)
         state["league_status"] = GameStatus.COMPLETED
         await send_league_completed(
             league_config, registered_players, registered_referees, logger, state
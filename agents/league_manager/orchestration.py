@@ -1,43 +1,49 @@
 """League orchestration helper functions."""
 
 import asyncio
-import subprocess
+from typing import List, Optional
+
+from agents.league_manager.process_supervisor import AgentProcess, ProcessSupervisor
 
 from SHARED.constants import AGENT_VERSION, AgentType, Field, GameID, LogEvent
 from SHARED.league_sdk.agent_comm import send
-from SHARED.league_sdk.config_loader import load_agent_config
+from SHARED.league_sdk.config_service import get_agent_config, get_lm_endpoint
 from SHARED.league_sdk.logger import LeagueLogger
-
-# Load config once at module level
-_agents_config = load_agent_config()
-_lm_endpoint = _agents_config["league_manager"]["endpoint"]
+from SHARED.league_sdk.readiness import wait_for_all
 
 
-async def start_agent(agent_type: str, agent_id: str, port: int, logger: LeagueLogger):
-    """Start an agent process."""
+def agent_script(agent_type: str, agent_id: str) -> str:
+    """Launch script for an agent."""
     if agent_type == AgentType.LEAGUE_MANAGER:
-        script = "agents/league_manager/main.py"
-    elif agent_type == AgentType.REFEREE:
-        script = f"agents/launch_referee_{agent_id[-2:]}.py"
-    else:  # player
-        script = f"agents/launch_player_{agent_id[-2:]}.py"
-
-    # Use CREATE_NEW_PROCESS_GROUP to prevent signals from propagating
-    proc = subprocess.Popen(
-        ["python", script],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-    )
-
+        return "agents/league_manager/main.py"
+    if agent_type == AgentType.REFEREE:
+        return f"agents/launch_referee_{agent_id[-2:]}.py"
+    return f"agents/launch_player_{agent_id[-2:]}.py"
+
+
+async def start_agent(
+    agent_type: str, agent_id: str, port: int, logger: LeagueLogger,
+    supervisor: Optional[ProcessSupervisor] = None, restart: bool = False,
+) -> AgentProcess:
+    """Start an agent process under a supervisor (own session/process group)."""
+    supervisor = supervisor or ProcessSupervisor(logger)
+    agent = await supervisor.start(agent_id, agent_script(agent_type, agent_id), restart=restart)
     logger.log_message(LogEvent.STARTUP, {"agent_id": agent_id, "port": port})
-    return proc
+    return agent
 
 
-async def wait_for_agents(timeout: int, logger: LeagueLogger):
-    """Wait for all agents to be ready."""
+async def wait_for_agents(timeout: int, logger: LeagueLogger, endpoints: Optional[List[str]] = None):
+    """Wait until every agent answers its health probe (or the timeout elapses)."""
+    if endpoints is None:
+        agents_config = get_agent_config()
+        endpoints = [get_lm_endpoint()]
+        endpoints += [a["endpoint"] for a in agents_config["referees"] + agents_config["players"]]
     logger.log_message(LogEvent.STARTUP, {"timeout": timeout, "status": "waiting"})
-    await asyncio.sleep(timeout)
+    ready = await wait_for_all(endpoints, timeout)
+    not_ready = [endpoint for endpoint, ok in ready.items() if not ok]
+    logger.log_message(
+        LogEvent.STARTUP, {"status": "ready" if not not_ready else "timeout", "not_ready": not_ready}
+    )
 
 
 async def register_referee(referee_id: str, endpoint: str, logger: LeagueLogger):
@@ -51,7 +57,7 @@ async def register_referee(referee_id: str, endpoint: str, logger: LeagueLogger)
         contact_endpoint=endpoint,
         game_types=[GameID.EVEN_ODD],
     )
-    response = await send(_lm_endpoint, message)
+    response = await send(get_lm_endpoint(), message)
     logger.log_message(
         LogEvent.REFEREE_REGISTERED,
         {Field.REFEREE_ID: referee_id, "response": str(response)},
@@ -69,39 +75,27 @@ async def register_player(player_id: str, endpoint: str, logger: LeagueLogger):
         contact_endpoint=endpoint,
         game_types=[GameID.EVEN_ODD],
     )
-    response = await send(_lm_endpoint, message)
+    response = await send(get_lm_endpoint(), message)
     logger.log_message(
         LogEvent.PLAYER_REGISTERED,
         {Field.PLAYER_ID: player_id, "response": str(response)},
     )
 
 
-async def start_all_agents(agents_config: dict, logger: LeagueLogger):
-    """Start all agents (league manager, referees, players)."""
-    processes = []
-
-    # Start League Manager using config port
+async def start_all_agents(
+    agents_config: dict, logger: LeagueLogger, restart: bool = False, max_restarts: int = 3
+) -> ProcessSupervisor:
+    """Start all agents (league manager, referees, players) in parallel."""
+    supervisor = ProcessSupervisor(logger, max_restarts=max_restarts)
     lm_config = agents_config["league_manager"]
-    lm_proc = await start_agent(
-        AgentType.LEAGUE_MANAGER, lm_config["agent_id"], lm_config["port"], logger
-    )
-    processes.append(lm_proc)
-
-    # Start Referees
-    for referee in agents_config["referees"]:
-        ref_proc = await start_agent(
-            AgentType.REFEREE, referee["referee_id"], referee["port"], logger
-        )
-        processes.append(ref_proc)
-
-    # Start Players
-    for player in agents_config["players"]:
-        player_proc = await start_agent(
-            AgentType.PLAYER, player["player_id"], player["port"], logger
-        )
-        processes.append(player_proc)
-
-    return processes
+    agents = [(AgentType.LEAGUE_MANAGER, lm_config["agent_id"], lm_config["port"])]
+    agents += [(AgentType.REFEREE, r["referee_id"], r["port"]) for r in agents_config["referees"]]
+    agents += [(AgentType.PLAYER, p["player_id"], p["port"]) for p in agents_config["players"]]
+    await asyncio.gather(*(
+        start_agent(agent_type, agent_id, port, logger, supervisor, restart)
+        for agent_type, agent_id, port in agents
+    ))
+    return supervisor
 
 
 async def register_all_agents(agents_config: dict, logger: LeagueLogger):
@@ -0,0 +1,129 @@
+"""Cross-platform supervisor for agent processes.
+
+Agents are started in parallel with ``asyncio.create_subprocess_exec`` and
+the current interpreter (``sys.executable``). Each agent gets its own session
+(POSIX) or process group (Windows), so launcher signals do not propagate and
+the whole group can be stopped together. Output goes to one log file per agent.
+A non-zero exit counts as a crash; with ``restart=True`` the agent is started
+again, up to ``max_restarts`` times.
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from SHARED.constants import LogEvent
+from SHARED.league_sdk.logger import LeagueLogger
+
+_IS_WINDOWS = sys.platform == "win32"
+
+
+@dataclass
+class AgentProcess:
+    """One supervised agent and its current OS process."""
+
+    agent_id: str
+    args: List[str]
+    restart: bool = False
+    restarts: int = 0
+    process: Optional[asyncio.subprocess.Process] = None
+    exit_codes: List[int] = field(default_factory=list)
+
+
+class ProcessSupervisor:
+    """Starts, watches, restarts and stops agent processes."""
+
+    def __init__(self, logger: LeagueLogger, log_dir: Path = Path("SHARED/logs/processes"),
+                 max_restarts: int = 3, restart_delay_s: float = 1.0):
+        self.logger = logger
+        self.log_dir = log_dir
+        self.max_restarts = max_restarts
+        self.restart_delay_s = restart_delay_s
+        self.agents: Dict[str, AgentProcess] = {}
+        self._watchers: List[asyncio.Task] = []
+        self._stopping = False
+
+    async def start(self, agent_id: str, script: str, *args: str, restart: bool = False) -> AgentProcess:
+        """Start one agent script and begin watching it."""
+        agent = AgentProcess(agent_id, [sys.executable, script, *args], restart)
+        self.agents[agent_id] = agent
+        await self._spawn(agent)
+        self._watchers.append(asyncio.create_task(self._watch(agent)))
+        return agent
+
+    async def start_all(self, specs: List[tuple], restart: bool = False) -> List[AgentProcess]:
+        """Start (agent_id, script, *args) specs in parallel."""
+        return list(await asyncio.gather(*(self.start(*spec, restart=restart) for spec in specs)))
+
+    async def wait(self) -> Dict[str, int]:
+        """Block until every agent has exited for good; returns agent_id -> last exit code."""
+        await asyncio.gather(*self._watchers)
+        return {agent_id: agent.process.returncode for agent_id, agent in self.agents.items()}
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Terminate every agent's process group, killing any that outlive the timeout."""
+        self._stopping = True
+        running = [a.process for a in self.agents.values() if a.process and a.process.returncode is None]
+        for process in running:
+            _signal_group(process, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(asyncio.gather(*(p.wait() for p in running)), timeout)
+        except asyncio.TimeoutError:
+            for process in running:
+                if process.returncode is None:
+                    _signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    async def _spawn(self, agent: AgentProcess) -> None:
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.log_dir / f"{agent.agent_id}.out.log", "ab") as log_file:
+            agent.process = await asyncio.create_subprocess_exec(
+                *agent.args, stdin=subprocess.DEVNULL, stdout=log_file, stderr=subprocess.STDOUT,
+                **_isolation_kwargs(),
+            )
+        self.logger.log_message(
+            LogEvent.STARTUP, {"agent_id": agent.agent_id, "pid": agent.process.pid}
+        )
+
+    async def _watch(self, agent: AgentProcess) -> None:
+        while True:
+            code = await agent.process.wait()
+            agent.exit_codes.append(code)
+            if code == 0 or self._stopping:
+                self.logger.log_message(LogEvent.AGENT_EXITED, {"agent_id": agent.agent_id, "code": code})
+                return
+            self.logger.log_error(
+                LogEvent.AGENT_CRASHED, f"{agent.agent_id} exited with {code}",
+                {"agent_id": agent.agent_id, "code": code, "restarts": agent.restarts},
+            )
+            if not agent.restart or agent.restarts >= self.max_restarts:
+                return
+            await asyncio.sleep(self.restart_delay_s)
+            if self._stopping:
+                return
+            agent.restarts += 1
+            await self._spawn(agent)
+            self.logger.log_message(
+                LogEvent.AGENT_RESTARTED, {"agent_id": agent.agent_id, "restarts": agent.restarts}
+            )
+
+
+def _isolation_kwargs() -> dict:
+    """Own session (POSIX) or process group (Windows) per agent."""
+    if _IS_WINDOWS:
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _signal_group(process: asyncio.subprocess.Process, sig: int) -> None:
+    try:
+        if _IS_WINDOWS:
+            process.terminate()
+        else:
+            os.killpg(process.pid, sig)  # Session leader: pgid == pid
+    except ProcessLookupError:
+        pass
@@ -0,0 +1,41 @@
+"""League Manager - LEAGUE_QUERY handling."""
+
+from typing import Any, Dict, Optional
+
+from agents.league_manager.standings_versions import get_versioned_standings
+
+from SHARED.constants import Field, LogEvent, QueryType, StandingsMode
+from SHARED.contracts import build_league_query_response
+from SHARED.league_sdk.logger import LeagueLogger
+from SHARED.league_sdk.session_manager import get_session_manager
+
+
+def handle_league_query(
+    message: Dict[str, Any], logger: LeagueLogger, request_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Answer a player's LEAGUE_QUERY.
+
+    GET_STANDINGS returns a full snapshot of the last broadcast standings with
+    its version, letting delta subscribers resynchronise after a gap.
+    """
+    sender = message.get(Field.SENDER, "")
+    player_id = sender.split(":")[-1] if ":" in sender else sender
+    query_type = message.get(Field.QUERY_TYPE)
+
+    if not get_session_manager().validate_token(player_id, message.get(Field.AUTH_TOKEN)):
+        logger.log_error(LogEvent.ERROR, f"LEAGUE_QUERY with invalid token from {player_id}")
+        return build_league_query_response(
+            query_type, False, {"error": "Invalid auth token"}, request_id=request_id
+        )
+    if query_type != QueryType.GET_STANDINGS:
+        return build_league_query_response(
+            query_type, False, {"error": f"Unsupported query type: {query_type}"}, request_id=request_id
+        )
+
+    versioned = get_versioned_standings()
+    data = {
+        Field.STANDINGS: versioned.snapshot(),
+        Field.STANDINGS_VERSION: versioned.version,
+        Field.UPDATE_MODE: StandingsMode.FULL,
+    }
+    return build_league_query_response(query_type, True, data, request_id=request_id)
@@ -1,6 +1,6 @@
 """League Manager - Ranking and standings service."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from SHARED.constants import Winner
 from SHARED.league_sdk.config_models import LeagueConfig
@@ -21,55 +21,58 @@ def calculate_rankings(standings_data: List[Dict[str, Any]]) -> List[Dict[str, A
     return sorted_standings
 
 
-def update_standings(
-    player_a: str, player_b: str, winner: str, league_config: LeagueConfig
+def apply_match_result(
+    standings_data: List[Dict[str, Any]],
+    player_a: str,
+    player_b: str,
+    winner: Optional[str],
+    scoring: Dict[str, int],
 ) -> None:
-    """Update standings based on match result."""
-    standings_repo = StandingsRepository(league_config.league_id)
-    standings = standings_repo.load()
-
-    scoring = league_config.scoring
-
-    # Normalize winner value - could be Winner.PLAYER_A, Winner.PLAYER_B, Winner.DRAW, 
-    # or an actual player ID (like "P01", "P02")
+    """Apply a single match result to in-memory standings rows."""
+    # Normalize winner value - could be Winner.PLAYER_A, Winner.PLAYER_B, Winner.DRAW,
+    # or an actual player ID (like "P01", "P02"); unknown values count as a draw
     if winner == player_a or winner == Winner.PLAYER_A:
         winner_normalized = Winner.PLAYER_A
     elif winner == player_b or winner == Winner.PLAYER_B:
         winner_normalized = Winner.PLAYER_B
-    elif winner == Winner.DRAW or winner is None:
-        winner_normalized = Winner.DRAW
     else:
-        # Unknown winner value, treat as draw
         winner_normalized = Winner.DRAW
 
-    # Update player statistics
-    for player in standings["standings"]:
-        if player["player_id"] == player_a:
-            if winner_normalized == Winner.PLAYER_A:
-                player["wins"] += 1
-                player["points"] += scoring["win_points"]
-            elif winner_normalized == Winner.DRAW:
-                player["draws"] += 1
-                player["points"] += scoring["draw_points"]
-            else:
-                player["losses"] += 1
-            player["games_played"] += 1
-
-        elif player["player_id"] == player_b:
-            if winner_normalized == Winner.PLAYER_B:
-                player["wins"] += 1
-                player["points"] += scoring["win_points"]
-            elif winner_normalized == Winner.DRAW:
-                player["draws"] += 1
-                player["points"] += scoring["draw_points"]
-            else:
-                player["losses"] += 1
-            player["games_played"] += 1
-
-    # Recalculate rankings
-    standings["standings"] = calculate_rankings(standings["standings"])
+    sides = {player_a: Winner.PLAYER_A, player_b: Winner.PLAYER_B}
+    for player in standings_data:
+        side = sides.get(player["player_id"])
+        if side is None:
+            continue
+        if winner_normalized == side:
+            player["wins"] += 1
+            player["points"] += scoring["win_points"]
+        elif winner_normalized == Winner.DRAW:
+            player["draws"] += 1
+            player["points"] += scoring["draw_points"]
+        else:
+            player["losses"] += 1
+        player["games_played"] += 1
+
 
-    # Save updated standings
+def update_standings(
+    player_a: str, player_b: str, winner: str, league_config: LeagueConfig
+) -> None:
+    """Update standings based on match result."""
+    update_standings_batch([(player_a, player_b, winner)], league_config)
+
+
+def update_standings_batch(
+    results: Iterable[Tuple[str, str, Optional[str]]], league_config: LeagueConfig
+) -> None:
+    """Apply several (player_a, player_b, winner) results in one load/save cycle."""
+    standings_repo = StandingsRepository(league_config.league_id)
+    standings = standings_repo.load()
+    for player_a, player_b, winner in results:
+        apply_match_result(
+            standings["standings"], player_a, player_b, winner, league_config.scoring
+        )
+    # Recalculate rankings once for the whole batch
+    standings["standings"] = calculate_rankings(standings["standings"])
     standings_repo.save(standings)
 
 
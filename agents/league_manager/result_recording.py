@@ -0,0 +1,77 @@
+"""League Manager - Match result recording.
+
+Shared by single MATCH_RESULT_REPORT and batched MATCH_RESULT_BATCH handling:
+a batch is applied with one standings load/save and one history write per player.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from agents.league_manager.ranking import update_standings_batch
+from agents.league_manager.round_tracker import get_round_tracker
+
+from SHARED.constants import Field, LogEvent
+from SHARED.league_sdk.config_models import LeagueConfig
+from SHARED.league_sdk.logger import LeagueLogger
+from SHARED.league_sdk.repositories import MatchRepository, PlayerHistoryRepository
+
+
+def parse_match_result(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the stored match record from a MATCH_RESULT_REPORT body."""
+    # Protocol v2: result is a nested object
+    result = message.get(Field.RESULT, {})
+    # Player IDs come from the result's score keys
+    player_ids = list(result.get("score", {}).keys())
+    return {
+        Field.MATCH_ID: message.get(Field.MATCH_ID),
+        Field.PLAYER_A_ID: player_ids[0] if len(player_ids) > 0 else None,
+        Field.PLAYER_B_ID: player_ids[1] if len(player_ids) > 1 else None,
+        Field.WINNER: result.get("winner"),
+        Field.ROUND_ID: message.get(Field.ROUND_ID),
+        Field.MATCH_SEED: result.get(Field.DETAILS, {}).get(Field.MATCH_SEED),
+        "timestamp": message.get("timestamp"),
+    }
+
+
+def record_results(
+    matches: List[Dict[str, Any]], league_config: LeagueConfig, logger: LeagueLogger
+) -> None:
+    """Persist match records, player histories and standings for a set of results."""
+    match_repo = MatchRepository(league_config.league_id)
+    histories: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    standings_updates = []
+    for match in matches:
+        match_id, winner = match[Field.MATCH_ID], match[Field.WINNER]
+        player_a, player_b = match[Field.PLAYER_A_ID], match[Field.PLAYER_B_ID]
+        logger.log_message(
+            LogEvent.MATCH_RESULT,
+            {Field.MATCH_ID: match_id, Field.ROUND_ID: match[Field.ROUND_ID], Field.WINNER: winner},
+        )
+        match_repo.save_match(match_id, match)
+        for player_id in (player_a, player_b):
+            if player_id:
+                histories[player_id].append(match)
+        if player_a and player_b:
+            standings_updates.append((player_a, player_b, winner))
+
+    for player_id, player_matches in histories.items():
+        PlayerHistoryRepository(player_id).append_matches(player_matches)
+    if standings_updates:
+        update_standings_batch(standings_updates, league_config)
+
+    # Record results in round tracker (for round completion detection)
+    tracker = get_round_tracker()
+    for match in matches:
+        asyncio.create_task(
+            tracker.record_result(
+                match[Field.ROUND_ID],
+                match[Field.MATCH_ID],
+                {
+                    "match_id": match[Field.MATCH_ID],
+                    "winner": match[Field.WINNER],
+                    "player_a": match[Field.PLAYER_A_ID],
+                    "player_b": match[Field.PLAYER_B_ID],
+                },
+            )
+        )
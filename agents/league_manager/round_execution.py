@@ -3,17 +3,15 @@
 import asyncio
 from typing import Any, Dict, List
 
+from agents.league_manager.announcements import send_round_announcements
+from agents.league_manager.assignments import build_match_assignments
 from agents.league_manager.broadcast import broadcast_to_agents
 from agents.league_manager.round_tracker import get_round_tracker
-from agents.league_manager.scheduler import get_match_schedule
+from agents.league_manager.standings_broadcast import send_standings_update
 
-from SHARED.constants import Field, GameID, Winner
-from SHARED.contracts import (
-    build_round_announcement,
-    build_round_completed,
-    build_league_standings_update,
-)
-from SHARED.league_sdk.repositories import StandingsRepository
+from SHARED.constants import Winner
+from SHARED.contracts import build_round_completed
+from SHARED.league_sdk.tracing import span
 
 
 async def execute_round(
@@ -29,38 +27,34 @@ async def execute_round(
     """Execute a single round of matches.
 
     New flow (per CONTRACTS.md):
-    1. Send ROUND_ANNOUNCEMENT to all agents (referees identify their matches)
-    2. Referees self-start matches based on referee_endpoint
+    1. Send targeted ROUND_ANNOUNCEMENTs (each agent gets only its own matches)
+    2. Referees self-start the matches they received
     3. Wait for MATCH_RESULT_REPORT from referees (tracked via round_tracker)
     4. Send ROUND_COMPLETED when all matches done
     """
-    # Assign matches to referees (round-robin)
-    referee_list = list(registered_referees.items())
-    matches_with_referees = []
-    for i, match in enumerate(round_matches):
-        ref_id, ref_info = referee_list[i % len(referee_list)]
-        referee_endpoint = ref_info.get("endpoint", "")
-        matches_with_referees.append({
-            "match_id": match["match_id"],
-            "player_A_id": match["player_a"],
-            "player_B_id": match["player_b"],
-            "game_type": GameID.EVEN_ODD,
-            "referee_endpoint": referee_endpoint,
-        })
+    with span("round", logger.agent_id, new_trace=True, round_id=round_num):  # One trace per round
+        return await _execute_round(
+            round_num, total_rounds, round_matches, league_config,
+            registered_players, registered_referees, logger, state,
+        )
+
+
+async def _execute_round(
+    round_num, total_rounds, round_matches, league_config, registered_players, registered_referees, logger, state,
+) -> List[Dict[str, Any]]:
+    matches_with_referees = build_match_assignments(
+        round_matches, registered_players, registered_referees, state.get("master_seed")
+    )
 
     # Register expected matches with round tracker
     tracker = get_round_tracker()
     match_ids = [m["match_id"] for m in matches_with_referees]
     await tracker.start_round(round_num, match_ids)
 
-    # Build and send ROUND_ANNOUNCEMENT
-    announcement = build_round_announcement(
-        league_id=league_config.league_id,
-        round_id=round_num,
-        matches=matches_with_referees,
-    )
-    await broadcast_to_agents(
-        announcement, registered_players, registered_referees, logger
+    # Send each agent only its own matches
+    await send_round_announcements(
+        league_config.league_id, round_num, matches_with_referees,
+        registered_players, registered_referees, logger,
     )
     logger.log_message("ROUND_ANNOUNCEMENT_SENT", {"round": round_num, "matches": len(match_ids)})
 
@@ -123,18 +117,8 @@ async def send_round_completed(
             completed_msg, registered_players, registered_referees, logger
         )
         logger.log_message("ROUND_COMPLETED_SENT", {"round": round_num})
-        standings_repo = StandingsRepository(league_config.league_id)
-        standings_data = standings_repo.load()
-        standings_list = standings_data.get("standings", [])
-        standings_list.sort(key=lambda x: (-x.get("points", 0), -x.get("wins", 0)))
-        standings_update = build_league_standings_update(
-            league_id=league_config.league_id,
-            round_id=round_num,
-            standings=standings_list,
-        )
-        await broadcast_to_agents(
-            standings_update, registered_players, registered_referees, logger
+        await send_standings_update(
+            round_num, league_config, registered_players, registered_referees, logger
         )
-        logger.log_message("STANDINGS_UPDATE_SENT", {"round": round_num})
     except Exception as e:
         logger.log_error("SEND_ROUND_COMPLETED_ERROR", f"{type(e).__name__}: {e}")
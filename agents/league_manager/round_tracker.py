@@ -82,6 +82,11 @@ class RoundTracker:
         async with self._lock:
             return len(self._pending_matches.get(round_id, set()))
 
+    @property
+    def pending_total(self) -> int:
+        """Matches without a result across every tracked round."""
+        return sum(len(pending) for pending in self._pending_matches.values())
+
     async def cleanup_round(self, round_id: int) -> None:
         """Clean up tracking data for a completed round."""
         async with self._lock:
@@ -0,0 +1,66 @@
+"""League Manager - LEAGUE_STANDINGS_UPDATE delivery (full or delta).
+
+Players that advertised Capability.STANDINGS_DELTA at registration receive only
+the rows changed since the previous version; everyone else receives the full
+table. Every standings_snapshot_interval rounds all agents get a full snapshot.
+"""
+
+from typing import Any, Dict
+
+from agents.league_manager.broadcast import broadcast_to_agents
+from agents.league_manager.standings_versions import get_versioned_standings
+
+from SHARED.constants import Capability, Field, StandingsMode
+from SHARED.contracts import build_league_standings_update
+from SHARED.league_sdk.repositories import StandingsRepository
+
+
+def supports_delta(agent_info: Dict[str, Any]) -> bool:
+    """Whether a registered agent negotiated delta standings updates."""
+    capabilities = agent_info.get("metadata", {}).get(Field.CAPABILITIES, [])
+    return Capability.STANDINGS_DELTA in capabilities
+
+
+def is_snapshot_round(round_num: int, interval: int) -> bool:
+    """Full snapshots go out every `interval` rounds (never if interval <= 0)."""
+    return interval > 0 and round_num % interval == 0
+
+
+async def send_standings_update(
+    round_num: int, league_config, registered_players, registered_referees, logger
+) -> None:
+    """Commit the current standings as a new version and broadcast it."""
+    standings_list = StandingsRepository(league_config.league_id).load().get("standings", [])
+    standings_list.sort(key=lambda x: (-x.get("points", 0), -x.get("wins", 0)))
+    versioned = get_versioned_standings()
+    base_version = versioned.version
+    changed = versioned.commit(standings_list)
+
+    delta_players = {}
+    if not is_snapshot_round(round_num, league_config.standings_snapshot_interval):
+        delta_players = {pid: info for pid, info in registered_players.items() if supports_delta(info)}
+    full_players = {pid: info for pid, info in registered_players.items() if pid not in delta_players}
+
+    full_update = build_league_standings_update(
+        league_id=league_config.league_id,
+        round_id=round_num,
+        standings=standings_list,
+        update_mode=StandingsMode.FULL,
+        standings_version=versioned.version,
+    )
+    await broadcast_to_agents(full_update, full_players, registered_referees, logger)
+    if delta_players:
+        delta_update = build_league_standings_update(
+            league_id=league_config.league_id,
+            round_id=round_num,
+            standings=changed,
+            update_mode=StandingsMode.DELTA,
+            standings_version=versioned.version,
+            base_version=base_version,
+        )
+        await broadcast_to_agents(delta_update, delta_players, {}, logger)
+    logger.log_message(
+        "STANDINGS_UPDATE_SENT",
+        {"round": round_num, Field.STANDINGS_VERSION: versioned.version,
+         "full": len(full_players), "delta": len(delta_players), "changed_rows": len(changed)},
+    )
@@ -0,0 +1,45 @@
+"""League Manager - Versioned standings model for delta broadcasts.
+
+Keeps the last broadcast standings rows keyed by player, with a version that
+increases every time a commit changes at least one row.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from SHARED.constants import Field
+
+
+class VersionedStandings:
+    """Last broadcast standings plus a monotonically increasing version."""
+
+    def __init__(self):
+        self.version = 0
+        self._rows: Dict[str, Dict[str, Any]] = {}
+
+    def commit(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Record new standings rows and return the ones that changed."""
+        changed = [dict(row) for row in rows if self._rows.get(row[Field.PLAYER_ID]) != row]
+        if changed:
+            self.version += 1
+            for row in changed:
+                self._rows[row[Field.PLAYER_ID]] = row
+        return changed
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Full standings at the current version, sorted by rank."""
+        return sorted((dict(r) for r in self._rows.values()), key=lambda r: r.get("rank", 0))
+
+    def reset(self) -> None:
+        self.version = 0
+        self._rows.clear()
+
+
+_versioned_standings: Optional[VersionedStandings] = None
+
+
+def get_versioned_standings() -> VersionedStandings:
+    """Get the versioned standings singleton."""
+    global _versioned_standings
+    if _versioned_standings is None:
+        _versioned_standings = VersionedStandings()
+    return _versioned_standings
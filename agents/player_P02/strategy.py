@@ -9,7 +9,7 @@ import time
 from collections import Counter
 
 from SHARED.constants import ParityChoice
-from SHARED.league_sdk.config_loader import load_system_config
+from SHARED.league_sdk.config_service import get_system_config
 
 
 class RandomStrategy:
@@ -64,8 +64,7 @@ class TimeoutStrategy:
 
     def __init__(self):
         """Initialize with system config timeout values."""
-        self._system_config = load_system_config()
-        self._timeout = self._system_config.timeouts.get("parity_choice", 30)
+        self._timeout = get_system_config().timeouts.get("parity_choice", 30)
 
     def choose_parity(self, opponent_history: list) -> str:
         """Sleep longer than timeout, then return a choice (which will be too late)."""
@@ -0,0 +1,117 @@
+"""Speculative parity decisions for player agents.
+
+A GAME_INVITATION already names the match and the opponent, so the decision
+is started as soon as the invitation arrives and cached per match_id. The
+CHOOSE_PARITY_CALL is then answered from memory. A cached decision is only
+used if nothing new was learned about the opponent in between (tracked by
+the opponent history version) and the seed is unchanged; otherwise it is
+dropped and the decision is recomputed. The deadline of a speculative
+decision runs from the invitation, so speculation never gives a strategy
+more time than the call itself would (a deliberately slow strategy such as
+TimeoutStrategy still misses the parity deadline).
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from agents.player_opponent_history import OpponentHistoryCache
+from agents.player_strategy_runner import StrategyRunner
+from SHARED.league_sdk.seeding import spawn_rng
+
+
+@dataclass
+class _Speculation:
+    opponent_id: Optional[str]
+    version: int
+    seed: Optional[int]
+    task: "asyncio.Future"
+    started: float  # Event loop time of the invitation; the deadline runs from here
+
+
+class DecisionCache:
+    """match_id -> in-flight or finished speculative decision."""
+
+    def __init__(self, strategy, runner: StrategyRunner, opponent_history: OpponentHistoryCache,
+                 max_entries: int = 64):
+        self.strategy = strategy
+        self.runner = runner
+        self.opponent_history = opponent_history
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, _Speculation]" = OrderedDict()
+
+    def speculate(self, match_id: str, opponent_id: Optional[str], seed: Optional[int] = None) -> None:
+        """Start computing the decision for a match in the background."""
+        self.discard(match_id)
+        decision = self.runner.start(
+            self.strategy, self.opponent_history.get(opponent_id), self._rng(match_id, seed), opponent_id
+        )
+        task = asyncio.ensure_future(decision)
+        task.add_done_callback(_consume_exception)
+        self._entries[match_id] = _Speculation(
+            opponent_id, self.opponent_history.version(opponent_id), seed, task, asyncio.get_running_loop().time()
+        )
+        while len(self._entries) > self.max_entries:  # Invitations whose call never came
+            _, stale = self._entries.popitem(last=False)
+            stale.task.cancel()
+
+    async def decide(self, match_id: str, opponent_id: Optional[str], seed: Optional[int] = None) -> str:
+        """Answer from the cached decision if still valid, else compute it now.
+
+        Raises asyncio.TimeoutError if no choice is ready within the deadline.
+        """
+        entry = self._entries.pop(match_id, None)
+        if entry is not None and self._is_valid(entry, opponent_id, seed):
+            remaining = entry.started + self.runner.deadline_s - asyncio.get_running_loop().time()
+            try:
+                return await asyncio.wait_for(asyncio.shield(entry.task), timeout=max(0.0, remaining))
+            except asyncio.TimeoutError:
+                entry.task.cancel()
+                self.runner.abandon_worker()
+                raise
+            except Exception:  # Speculation failed: fall back to a fresh decision
+                pass
+        elif entry is not None:
+            entry.task.cancel()
+        return await self.runner.choose(
+            self.strategy, self.opponent_history.get(opponent_id), self._rng(match_id, seed), opponent_id
+        )
+
+    def discard(self, match_id: str) -> None:
+        """Drop a match's speculative decision, if any."""
+        entry = self._entries.pop(match_id, None)
+        if entry is not None:
+            entry.task.cancel()
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self._entries
+
+    def _is_valid(self, entry: _Speculation, opponent_id: Optional[str], seed: Optional[int]) -> bool:
+        return (
+            entry.opponent_id == opponent_id
+            and entry.seed == seed
+            and entry.version == self.opponent_history.version(opponent_id)
+            and not entry.task.cancelled()
+        )
+
+    @staticmethod
+    def _rng(match_id: str, seed: Optional[int]):
+        return spawn_rng(seed, match_id) if seed is not None else None
+
+
+def _consume_exception(task: "asyncio.Future") -> None:
+    """Mark a failed speculation as handled; decide() recomputes instead."""
+    if not task.cancelled():
+        task.exception()
+
+
+def create_decision_cache(
+    settings: Optional[Dict[str, Any]], strategy, runner: StrategyRunner,
+    opponent_history: OpponentHistoryCache,
+) -> Optional[DecisionCache]:
+    """Create a decision cache from player.json strategy_execution settings (None if disabled)."""
+    settings = settings or {}
+    if not settings.get("speculative_decisions", True):
+        return None
+    return DecisionCache(strategy, runner, opponent_history, settings.get("max_speculative_decisions", 64))
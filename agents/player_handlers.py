@@ -1,12 +1,22 @@
 """Player message handlers - extracted for line count compliance."""
 
-from SHARED.constants import Field, LogEvent, MessageType, Status
+import asyncio
+from typing import Optional
+
+from agents.player_decision_cache import DecisionCache
+from agents.player_opponent_history import OpponentHistoryCache
+from agents.player_strategy_runner import StrategyRunner, get_strategy_runner
+from SHARED.constants import DECISION_DEADLINE_ERROR, Field, LogEvent
 from SHARED.contracts import build_choose_parity_response, build_game_join_ack
-from SHARED.league_sdk.repositories import PlayerHistoryRepository
+from SHARED.contracts.jsonrpc_helpers import wrap_jsonrpc_error
+from SHARED.league_sdk.seeding import spawn_rng
 
 
-def handle_invitation(player_id: str, msg: dict, logger, conversation_id: str) -> dict:
-    """Handle GAME_INVITATION message."""
+def handle_invitation(
+    player_id: str, msg: dict, logger, conversation_id: str,
+    decisions: Optional[DecisionCache] = None, seed: Optional[int] = None,
+) -> dict:
+    """Handle GAME_INVITATION message, starting the parity decision speculatively."""
     logger.log_message(
         LogEvent.GAME_INVITATION_RECEIVED,
         {
@@ -14,6 +24,8 @@ def handle_invitation(player_id: str, msg: dict, logger, conversation_id: str) -
             Field.OPPONENT_ID: msg.get(Field.OPPONENT_ID),
         },
     )
+    if decisions is not None:
+        decisions.speculate(msg.get(Field.MATCH_ID), msg.get(Field.OPPONENT_ID), seed)
     return build_game_join_ack(
         match_id=msg.get(Field.MATCH_ID),
         player_id=player_id,
@@ -22,10 +34,35 @@ def handle_invitation(player_id: str, msg: dict, logger, conversation_id: str) -
     )
 
 
-def handle_parity_call(player_id: str, msg: dict, strategy, logger) -> dict:
-    """Handle CHOOSE_PARITY_CALL message."""
-    history = PlayerHistoryRepository(player_id).load_history().get(Field.OPPONENT_CHOICES, [])
-    choice = strategy.choose_parity(history)
+async def handle_parity_call(
+    player_id: str, msg: dict, strategy, logger, seed: Optional[int] = None,
+    opponent_history: Optional[OpponentHistoryCache] = None,
+    runner: Optional[StrategyRunner] = None, decisions: Optional[DecisionCache] = None,
+    request_id: Optional[int] = None,
+) -> dict:
+    """Handle CHOOSE_PARITY_CALL message.
+
+    The opponent's past choices come from the resident in-memory cache. With a
+    player seed, the choice comes from the match's derived random stream. The
+    decision runs off the event loop (or was precomputed on the invitation);
+    past the deadline the reply is a JSON-RPC DECISION_DEADLINE_ERROR with no
+    choice, which the referee treats as a timeout (technical loss).
+    """
+    opponent_id = msg.get(Field.CONTEXT, {}).get(Field.OPPONENT_ID)
+    try:
+        if decisions is not None:
+            choice = await decisions.decide(msg.get(Field.MATCH_ID), opponent_id, seed)
+        else:
+            history = opponent_history.get(opponent_id) if opponent_history is not None else []
+            rng = spawn_rng(seed, msg.get(Field.MATCH_ID)) if seed is not None else None
+            runner = runner or get_strategy_runner()
+            choice = await runner.choose(strategy, history, rng, opponent_id=opponent_id)
+    except asyncio.TimeoutError:
+        logger.log_error(LogEvent.TIMEOUT, "Strategy missed decision deadline", {Field.MATCH_ID: msg.get(Field.MATCH_ID)})
+        return wrap_jsonrpc_error(
+            DECISION_DEADLINE_ERROR, "Decision deadline exceeded", request_id,
+            {Field.MATCH_ID: msg.get(Field.MATCH_ID), Field.PLAYER_ID: player_id},
+        )
     logger.log_message(
         LogEvent.PARITY_CHOICE_MADE,
         {Field.MATCH_ID: msg.get(Field.MATCH_ID), Field.PARITY_CHOICE: choice},
@@ -38,9 +75,16 @@ def handle_parity_call(player_id: str, msg: dict, strategy, logger) -> dict:
     )
 
 
-def handle_game_over(msg: dict, logger):
-    """Handle GAME_OVER message."""
+def handle_game_over(
+    msg: dict, logger, opponent_history: Optional[OpponentHistoryCache] = None, strategy=None,
+    runner: Optional[StrategyRunner] = None,
+):
+    """Handle GAME_OVER message, learning the opponent's choice."""
     game_result = msg.get(Field.GAME_RESULT, {})
+    if opponent_history is not None:
+        runner = runner or get_strategy_runner()
+        for opponent_id, choice in opponent_history.record_game_over(msg):
+            runner.observe(strategy, opponent_id, choice)
     logger.log_message(
         LogEvent.GAME_OVER_RECEIVED,
         {
@@ -10,6 +10,7 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from agents.player_handlers import handle_game_over, handle_invitation, handle_parity_call
+from agents.player_standings import request_standings_snapshot
 from SHARED.constants import Field, LogEvent, MessageType, Status
 from SHARED.contracts.jsonrpc_helpers import (
     extract_jsonrpc_params,
@@ -17,6 +18,7 @@ from SHARED.contracts.jsonrpc_helpers import (
     is_jsonrpc_request,
     wrap_jsonrpc_response,
 )
+from SHARED.league_sdk.tracing import server_span
 
 if TYPE_CHECKING:
     from agents.generic_player import GenericPlayer
@@ -33,38 +35,50 @@ async def handle_mcp_message(player: "GenericPlayer", request: Request) -> JSONR
         JSONResponse with the appropriate response
     """
     try:
-        raw_message = await request.json()
-        player.logger.log_message(LogEvent.RECEIVED, raw_message)
-        # Extract params from JSON-RPC envelope if present
-        message = extract_jsonrpc_params(raw_message) if is_jsonrpc_request(raw_message) else raw_message
-        request_id = get_jsonrpc_id(raw_message) if is_jsonrpc_request(raw_message) else None
-        msg_type = message.get(Field.MESSAGE_TYPE)
-
-        response = _dispatch_message(player, message, msg_type, request_id)
-        player.logger.log_message(LogEvent.SENT, response)
+        response = await handle_raw_message(player, await request.json())
         return JSONResponse(content=response)
-
     except Exception as e:
         player.logger.log_error(LogEvent.REQUEST_ERROR, str(e))
         return JSONResponse(content={Field.STATUS: Status.ERROR}, status_code=500)
 
 
-def _dispatch_message(
+async def handle_raw_message(player: "GenericPlayer", raw_message: Dict[str, Any]) -> Dict[str, Any]:
+    """Handle one decoded message (HTTP body or in-process delivery)."""
+    player.logger.log_message(LogEvent.RECEIVED, raw_message)
+    # Extract params from JSON-RPC envelope if present
+    message = extract_jsonrpc_params(raw_message) if is_jsonrpc_request(raw_message) else raw_message
+    request_id = get_jsonrpc_id(raw_message) if is_jsonrpc_request(raw_message) else None
+    msg_type = message.get(Field.MESSAGE_TYPE)
+
+    with server_span(player.player_id, raw_message):
+        response = await _dispatch_message(player, message, msg_type, request_id)
+    player.logger.log_message(LogEvent.SENT, response)
+    return response
+
+
+async def _dispatch_message(
     player: "GenericPlayer", message: Dict[str, Any], msg_type: str, request_id: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Dispatch message to appropriate handler."""
     if msg_type == MessageType.GAME_INVITATION:
         return handle_invitation(
-            player.player_id, message, player.logger, message.get(Field.CONVERSATION_ID)
+            player.player_id, message, player.logger, message.get(Field.CONVERSATION_ID),
+            player.decisions, player.seed,
         )
     if msg_type == MessageType.CHOOSE_PARITY_CALL:
-        return handle_parity_call(player.player_id, message, player.strategy, player.logger)
+        return await handle_parity_call(
+            player.player_id, message, player.strategy, player.logger, player.seed,
+            player.opponent_history, player.strategy_runner, player.decisions, request_id,
+        )
     if msg_type == MessageType.GAME_OVER:
-        handle_game_over(message, player.logger)
+        handle_game_over(
+            message, player.logger, player.opponent_history, player.strategy, player.strategy_runner
+        )
         return _wrap_ack(request_id)
     if msg_type == MessageType.ROUND_ANNOUNCEMENT:
         player.logger.log_message(
-            "ROUND_ANNOUNCEMENT_RECEIVED", {"round_id": message.get(Field.ROUND_ID)}
+            "ROUND_ANNOUNCEMENT_RECEIVED",
+            {"round_id": message.get(Field.ROUND_ID), "my_matches": len(message.get(Field.MATCHES, []))},
         )
         return _wrap_ack(request_id)
     if msg_type == MessageType.ROUND_COMPLETED:
@@ -73,9 +87,13 @@ def _dispatch_message(
         )
         return _wrap_ack(request_id)
     if msg_type == MessageType.LEAGUE_STANDINGS_UPDATE:
+        applied = player.standings.apply(message)
         player.logger.log_message(
-            "STANDINGS_UPDATE_RECEIVED", {"round_id": message.get(Field.ROUND_ID)}
+            "STANDINGS_UPDATE_RECEIVED",
+            {"round_id": message.get(Field.ROUND_ID), Field.STANDINGS_VERSION: player.standings.version},
         )
+        if not applied:  # Missed a delta: fetch a full snapshot
+            asyncio.create_task(request_standings_snapshot(player, message.get(Field.LEAGUE_ID)))
         return _wrap_ack(request_id)
     if msg_type == MessageType.LEAGUE_COMPLETED:
         player.logger.log_message(
@@ -0,0 +1,46 @@
+"""Incremental variable-order n-gram (Markov) predictor for opponent choices.
+
+Count tables are updated in O(order) per observed choice and queried in
+O(order) per prediction, independent of how long the history is. Prediction
+backs off from the longest context to shorter ones until a context has
+enough evidence to clear the confidence threshold.
+"""
+
+from collections import Counter, deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+
+class NGramPredictor:
+    """Predicts the next symbol from the last `order` observed symbols."""
+
+    def __init__(self, order: int = 3):
+        self.order = max(1, order)
+        self._counts: Dict[Tuple[str, ...], Counter] = {}
+        self._recent: Deque[str] = deque(maxlen=self.order)
+
+    def observe(self, symbol: str) -> None:
+        """Record that `symbol` followed the current context (all suffix orders)."""
+        context = tuple(self._recent)
+        for k in range(1, len(context) + 1):
+            key = context[-k:]
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = Counter()
+            counts[symbol] += 1
+        self._recent.append(symbol)
+
+    def observe_all(self, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            self.observe(symbol)
+
+    def predict(self, min_confidence: float = 0.0) -> Optional[str]:
+        """Most likely next symbol, or None if no context is confident enough."""
+        context = tuple(self._recent)
+        for k in range(len(context), 0, -1):
+            counts = self._counts.get(context[-k:])
+            if not counts:
+                continue
+            symbol, hits = counts.most_common(1)[0]
+            if hits / sum(counts.values()) >= min_confidence:
+                return symbol
+        return None
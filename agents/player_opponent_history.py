@@ -0,0 +1,106 @@
+"""Resident per-opponent choice history for player agents.
+
+Choices are learned from GAME_OVER messages and kept in bounded ring buffers
+so parity decisions never touch disk. Every few updates a snapshot is written
+on a background thread (shared by all players in the process, so writes stay
+ordered), keeping serialization and file I/O off the event loop; on shutdown
+the cache is written synchronously after any pending background write.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from SHARED.constants import Field, ParityChoice
+from SHARED.league_sdk.repositories import OpponentChoicesRepository
+
+_VALID_CHOICES = (ParityChoice.EVEN, ParityChoice.ODD)
+_writer: Optional[ThreadPoolExecutor] = None
+
+
+def _background_writer() -> ThreadPoolExecutor:
+    global _writer
+    if _writer is None:
+        _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="opponent-history-writer")
+    return _writer
+
+
+class OpponentHistoryCache:
+    """In-memory opponent_id -> recent choices, capped per opponent."""
+
+    def __init__(self, player_id: str, max_choices_per_opponent: int = 200,
+                 persist_every: int = 10, repository: Optional[OpponentChoicesRepository] = None):
+        self.player_id = player_id
+        self.max_choices = max(1, max_choices_per_opponent)
+        self.persist_every = persist_every
+        self._repository = repository or OpponentChoicesRepository(player_id)
+        self._history: Dict[str, Deque[str]] = {}
+        self._versions: Dict[str, int] = {}
+        self._unsaved = 0
+        self._pending_save: Optional[Future] = None
+
+    def load(self) -> None:
+        """Warm the cache from the last persisted snapshot."""
+        for opponent_id, choices in self._repository.load().items():
+            self._history[opponent_id] = deque(choices, maxlen=self.max_choices)
+
+    def get(self, opponent_id: Optional[str]) -> List[str]:
+        """Recent choices of an opponent, oldest first."""
+        return list(self._history.get(opponent_id, ()))
+
+    def version(self, opponent_id: Optional[str]) -> int:
+        """Counter bumped whenever a choice of this opponent is recorded."""
+        return self._versions.get(opponent_id, 0)
+
+    def items(self) -> Iterator[Tuple[str, List[str]]]:
+        """(opponent_id, choices) pairs, oldest choice first."""
+        for opponent_id, choices in self._history.items():
+            yield opponent_id, list(choices)
+
+    def record(self, opponent_id: str, choice: str) -> bool:
+        """Append one observed opponent choice; returns False if it was not a choice."""
+        if choice not in _VALID_CHOICES:
+            return False  # e.g. NO_RESPONSE after a timeout
+        history = self._history.get(opponent_id)
+        if history is None:
+            history = self._history[opponent_id] = deque(maxlen=self.max_choices)
+        history.append(choice)
+        self._versions[opponent_id] = self._versions.get(opponent_id, 0) + 1
+        self._unsaved += 1
+        return True
+
+    def record_game_over(self, msg: dict) -> List[Tuple[str, str]]:
+        """Learn opponent choices from a GAME_OVER message; returns what was recorded."""
+        choices = msg.get(Field.GAME_RESULT, {}).get("choices", {})
+        recorded = [
+            (player_id, choice) for player_id, choice in choices.items()
+            if player_id != self.player_id and self.record(player_id, choice)
+        ]
+        if self.persist_every > 0 and self._unsaved >= self.persist_every:
+            self.persist_in_background()
+        return recorded
+
+    def persist_in_background(self) -> None:
+        """Snapshot the cache and write it on the background writer thread."""
+        if self._unsaved:
+            snapshot, self._unsaved = self._snapshot(), 0
+            try:
+                self._pending_save = _background_writer().submit(self._repository.save, snapshot)
+            except RuntimeError:  # Interpreter shutdown: no new threads
+                self._repository.save(snapshot)
+
+    def flush(self) -> None:
+        """Wait for the pending background write, if any; a failed one is redone by persist()."""
+        pending, self._pending_save = self._pending_save, None
+        if pending is not None and pending.exception() is not None:
+            self._unsaved = max(self._unsaved, 1)
+
+    def persist(self) -> None:
+        """Write the cache to disk now if anything changed (e.g. on shutdown)."""
+        self.flush()
+        if self._unsaved:
+            self._repository.save(self._snapshot())
+            self._unsaved = 0
+
+    def _snapshot(self) -> Dict[str, List[str]]:
+        return {opp: list(choices) for opp, choices in self._history.items()}
@@ -0,0 +1,102 @@
+"""Multi-tenant player host: many GenericPlayers behind one process and port.
+
+Each hosted player keeps its own strategy, logger, opponent history and
+standings; only the event loop and the HTTP server are shared. Messages are
+routed by path (``/mcp/{player_id}``), which is also the endpoint each player
+registers with. Messages posted to the bare ``/mcp`` path are routed by their
+``recipient`` field, falling back to ``player_id``.
+"""
+
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from agents.generic_player import GenericPlayer, _exit_process
+from agents.player_message_handlers import handle_mcp_message
+from agents.player_registration import register_with_league_manager
+from SHARED.constants import (
+    HEALTH_PATH, HTTP_PROTOCOL, LOCALHOST, MCP_PATH, SERVER_HOST, Field, LogEvent, Status,
+)
+from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_request
+from SHARED.league_sdk.admin_routes import add_admin_routes
+from SHARED.league_sdk.http_metrics import add_metrics
+from SHARED.league_sdk.readiness import health_response
+
+PlayerSpec = Tuple[str, str, Optional[int]]  # (player_id, strategy_name, seed)
+
+
+def pooled_endpoint(port: int, player_id: str) -> str:
+    """Contact endpoint of a pooled player."""
+    return f"{HTTP_PROTOCOL}://{LOCALHOST}:{port}{MCP_PATH}/{player_id}"
+
+
+class PlayerPool:
+    """Hosts N players in one event loop, routing messages by player_id."""
+
+    def __init__(self, port: int, players: Iterable[PlayerSpec], registration_stagger_s: float = 0.0):
+        self.port = port
+        self.registration_stagger_s = registration_stagger_s
+        self.players: Dict[str, GenericPlayer] = {}
+        for player_id, strategy_name, seed in players:
+            player = GenericPlayer(player_id, strategy_name, port, seed, pooled_endpoint(port, player_id), serve=False)
+            player.on_shutdown = lambda pid=player_id: self._player_stopped(pid)
+            self.players[player_id] = player
+        self._running = set(self.players)
+        self.on_shutdown = _exit_process
+        self.app = FastAPI(title=f"Player pool :{port}")
+        self._setup_routes()
+        add_admin_routes(self.app)
+        add_metrics(self.app, f"player_pool_{port}")
+
+    def _setup_routes(self):
+        @self.app.post(MCP_PATH + "/{player_id}")
+        async def player_endpoint(player_id: str, request: Request) -> JSONResponse:
+            return await self._route(player_id, request)
+
+        @self.app.post(MCP_PATH)
+        async def shared_endpoint(request: Request) -> JSONResponse:
+            try:
+                raw_message = await request.json()
+            except ValueError:
+                return JSONResponse(content={Field.STATUS: Status.ERROR}, status_code=400)
+            message = extract_jsonrpc_params(raw_message) if is_jsonrpc_request(raw_message) else raw_message
+            recipient = message.get(Field.RECIPIENT) or message.get(Field.PLAYER_ID)
+            return await self._route(recipient, request)
+
+        @self.app.get(HEALTH_PATH)
+        async def health() -> dict:
+            return health_response(f"player_pool:{self.port}")
+
+        @self.app.on_event("startup")
+        async def startup():
+            for index, player in enumerate(self.players.values()):
+                player.logger.log_message(
+                    LogEvent.STARTUP, {Field.PLAYER_ID: player.player_id, "port": self.port}
+                )
+                delay = index * self.registration_stagger_s
+                asyncio.create_task(register_with_league_manager(player, delay))
+
+    async def _route(self, player_id: Optional[str], request: Request) -> JSONResponse:
+        player = self.players.get(player_id)
+        if player is None:
+            return JSONResponse(
+                content={Field.STATUS: Status.ERROR, "message": f"Unknown player: {player_id}"},
+                status_code=404,
+            )
+        return await handle_mcp_message(player, request)
+
+    def _player_stopped(self, player_id: str) -> None:
+        """Exit once every hosted player has shut down."""
+        self._running.discard(player_id)
+        if not self._running:
+            self.on_shutdown()
+
+    def run(self):
+        uvicorn.run(self.app, host=SERVER_HOST, port=self.port)
+
+
+def create_pool_app(port: int, players: Iterable[PlayerSpec], registration_stagger_s: float = 0.0) -> FastAPI:
+    return PlayerPool(port, players, registration_stagger_s).app
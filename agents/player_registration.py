@@ -0,0 +1,63 @@
+"""League registration for player agents - extracted for line count compliance."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from SHARED.constants import AGENT_VERSION, Capability, Field, GameID, LogEvent, Status, Timeout
+from SHARED.contracts import build_league_register_request
+from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_response
+from SHARED.league_sdk.agent_comm import send_with_retry
+from SHARED.league_sdk.config_service import get_lm_endpoint, get_system_config
+from SHARED.league_sdk.readiness import wait_until_ready
+
+if TYPE_CHECKING:
+    from agents.generic_player import GenericPlayer
+
+
+async def register_with_league_manager(player: "GenericPlayer", delay: float = 0) -> None:
+    """Register a player as soon as the League Manager is reachable.
+
+    Stores the auth token and seed from the response. ``delay`` only staggers
+    registrations of pooled players.
+    """
+    try:
+        if delay:
+            await asyncio.sleep(delay)
+        config = get_system_config()
+        await wait_until_ready(get_lm_endpoint(), config.timeouts[Timeout.AGENT_STARTUP])
+        msg = build_league_register_request(
+            player_id=player.player_id,
+            display_name=f"Player {player.player_id}",
+            version=AGENT_VERSION,
+            contact_endpoint=player.endpoint,
+            game_types=[GameID.EVEN_ODD],
+            capabilities=[Capability.STANDINGS_DELTA],
+        )
+        player.logger.log_message("REGISTERING", {"endpoint": get_lm_endpoint()})
+        resp = await send_with_retry(
+            get_lm_endpoint(),
+            msg,
+            max_retries=config.retry_policy["max_retries"],
+            timeout=config.timeouts["http_request"],
+            retry_delay=config.retry_policy["retry_delay"],
+        )
+        # Extract content from JSON-RPC response (result or params)
+        if resp:
+            if is_jsonrpc_response(resp):
+                inner = resp.get("result", {})
+            else:
+                inner = extract_jsonrpc_params(resp)
+            status = inner.get(Field.STATUS)
+            if status in (Status.ACCEPTED, Status.REGISTERED):
+                player.auth_token = inner.get(Field.AUTH_TOKEN)
+                if player.seed is None:
+                    player.seed = inner.get(Field.SEED)
+                player.logger.log_message(
+                    LogEvent.PLAYER_REGISTERED, {Field.PLAYER_ID: player.player_id, Field.SEED: player.seed}
+                )
+            else:
+                player.logger.log_error(LogEvent.ERROR, f"Registration failed: {resp}")
+        else:
+            player.logger.log_error(LogEvent.ERROR, "Registration failed: No response")
+    except Exception as e:
+        player.logger.log_error("REGISTRATION_EXCEPTION", f"{type(e).__name__}: {e}")
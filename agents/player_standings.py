@@ -0,0 +1,67 @@
+"""Player-side standings view built from full and delta LEAGUE_STANDINGS_UPDATEs."""
+
+from typing import Any, Dict, List, Optional
+
+from SHARED.constants import Field, QueryType, StandingsMode, Timeout
+from SHARED.contracts import build_league_query
+from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_response
+from SHARED.league_sdk.agent_comm import send_with_retry
+from SHARED.league_sdk.config_service import get_lm_endpoint, get_system_config
+
+
+class StandingsView:
+    """Local copy of the league table, kept in sync by version number."""
+
+    def __init__(self):
+        # The League Manager starts at version 0 with an empty table
+        self.version = 0
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.stale = False
+
+    def apply(self, update: Dict[str, Any]) -> bool:
+        """Apply an update; returns False if a delta cannot be applied (version gap)."""
+        rows = update.get(Field.STANDINGS, [])
+        version = update.get(Field.STANDINGS_VERSION)
+        if update.get(Field.UPDATE_MODE, StandingsMode.FULL) == StandingsMode.DELTA:
+            if version is not None and version <= self.version and not self.stale:
+                return True  # Already have it
+            if update.get(Field.BASE_VERSION) != self.version or self.stale:
+                self.stale = True
+                return False
+            for row in rows:
+                self.rows[row[Field.PLAYER_ID]] = row
+        else:
+            self.rows = {row[Field.PLAYER_ID]: row for row in rows}
+        if version is not None:
+            self.version = version
+        self.stale = False
+        return True
+
+    def table(self) -> List[Dict[str, Any]]:
+        """Standings sorted by rank."""
+        return sorted(self.rows.values(), key=lambda r: r.get("rank", 0))
+
+    def get(self, player_id: str) -> Optional[Dict[str, Any]]:
+        return self.rows.get(player_id)
+
+
+async def request_standings_snapshot(player, league_id: str) -> None:
+    """Ask the League Manager for a full snapshot after a delta version gap."""
+    if not player.auth_token:
+        return
+    try:
+        query = build_league_query(player.player_id, league_id, player.auth_token, QueryType.GET_STANDINGS)
+        config = get_system_config()
+        resp = await send_with_retry(
+            get_lm_endpoint(),
+            query,
+            max_retries=config.retry_policy["max_retries"],
+            timeout=config.timeouts[Timeout.HTTP_REQUEST],
+            retry_delay=config.retry_policy["retry_delay"],
+        )
+        inner = resp.get("result", {}) if is_jsonrpc_response(resp or {}) else extract_jsonrpc_params(resp or {})
+        if inner.get("success"):
+            player.standings.apply(inner.get(Field.DATA, {}))
+            player.logger.log_message("STANDINGS_RESYNCED", {Field.STANDINGS_VERSION: player.standings.version})
+    except Exception as e:
+        player.logger.log_error("STANDINGS_RESYNC_ERROR", f"{type(e).__name__}: {e}")
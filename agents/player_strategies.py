@@ -1,28 +1,42 @@
-"""Player strategy implementations for Even-Odd game."""
+"""Player strategy implementations for Even-Odd game.
 
+Every strategy accepts an optional per-match random stream (rng) so seeded
+league runs are reproducible; the global generator is used when it is None.
+Strategies also receive the opponent_id, and may expose observe(opponent_id,
+choice) to learn incrementally from GAME_OVER results.
+"""
+
+import asyncio
 import random
-import time
 from collections import Counter
+from typing import Any, Dict, Optional
 
-from SHARED.constants import ParityChoice
-from SHARED.league_sdk.config_loader import load_system_config
+from agents.player_ngram import NGramPredictor
+from SHARED.constants import ParityChoice, StrategyType
+from SHARED.league_sdk.config_service import get_system_config
 
 
 class RandomStrategy:
     """Random parity choice strategy."""
 
-    def choose_parity(self, opponent_history: list) -> str:
+    def choose_parity(
+        self, opponent_history: list, rng: Optional[random.Random] = None,
+        opponent_id: Optional[str] = None,
+    ) -> str:
         """Choose randomly between even and odd."""
-        return random.choice([ParityChoice.EVEN, ParityChoice.ODD])
+        return (rng or random).choice([ParityChoice.EVEN, ParityChoice.ODD])
 
 
 class FrequencyStrategy:
     """Counter opponent's most frequent choice."""
 
-    def choose_parity(self, opponent_history: list) -> str:
+    def choose_parity(
+        self, opponent_history: list, rng: Optional[random.Random] = None,
+        opponent_id: Optional[str] = None,
+    ) -> str:
         """Choose opposite of opponent's most frequent choice."""
         if not opponent_history:
-            return random.choice([ParityChoice.EVEN, ParityChoice.ODD])
+            return (rng or random).choice([ParityChoice.EVEN, ParityChoice.ODD])
 
         counter = Counter(opponent_history)
         most_common = counter.most_common(1)[0][0]
@@ -30,29 +44,38 @@ class FrequencyStrategy:
 
 
 class PatternStrategy:
-    """Detect and exploit patterns in opponent choices."""
-
-    def choose_parity(self, opponent_history: list) -> str:
-        """Look for 3-choice patterns to predict next move."""
-        if len(opponent_history) < 3:
-            return random.choice([ParityChoice.EVEN, ParityChoice.ODD])
-
-        last_three = tuple(opponent_history[-3:])
-        pattern_predictions = {}
-
-        for i in range(len(opponent_history) - 3):
-            pattern = tuple(opponent_history[i : i + 3])
-            next_choice = opponent_history[i + 3]
-            if pattern not in pattern_predictions:
-                pattern_predictions[pattern] = []
-            pattern_predictions[pattern].append(next_choice)
+    """Detect and exploit patterns in opponent choices.
 
-        if last_three in pattern_predictions:
-            predictions = pattern_predictions[last_three]
-            predicted = Counter(predictions).most_common(1)[0][0]
-            return ParityChoice.ODD if predicted == ParityChoice.EVEN else ParityChoice.EVEN
+    Keeps an incremental n-gram predictor per opponent, fed through observe(),
+    so each decision costs O(pattern_length) regardless of history length.
+    """
 
-        return random.choice([ParityChoice.EVEN, ParityChoice.ODD])
+    def __init__(self, pattern_length: int = 3, min_confidence: float = 0.6):
+        self.pattern_length = pattern_length
+        self.min_confidence = min_confidence
+        self._predictors: Dict[str, NGramPredictor] = {}
+
+    def observe(self, opponent_id: str, choice: str) -> None:
+        """Feed one observed opponent choice into that opponent's predictor."""
+        predictor = self._predictors.get(opponent_id)
+        if predictor is None:
+            predictor = self._predictors[opponent_id] = NGramPredictor(self.pattern_length)
+        predictor.observe(choice)
+
+    def choose_parity(
+        self, opponent_history: list, rng: Optional[random.Random] = None,
+        opponent_id: Optional[str] = None,
+    ) -> str:
+        """Counter the predicted next opponent choice, else choose randomly."""
+        predictor = self._predictors.get(opponent_id) if opponent_id is not None else None
+        if predictor is None:
+            # No observe() stream for this opponent: build from the given history
+            predictor = NGramPredictor(self.pattern_length)
+            predictor.observe_all(opponent_history)
+        predicted = predictor.predict(self.min_confidence)
+        if predicted is None:
+            return (rng or random).choice([ParityChoice.EVEN, ParityChoice.ODD])
+        return ParityChoice.ODD if predicted == ParityChoice.EVEN else ParityChoice.EVEN
 
 
 class TimeoutStrategy:
@@ -64,15 +87,20 @@ class TimeoutStrategy:
 
     def __init__(self):
         """Initialize with system config timeout values."""
-        self._system_config = load_system_config()
-        self._timeout = self._system_config.timeouts.get("parity_choice", 30)
+        self._timeout = get_system_config().timeouts.get("parity_choice", 30)
+
+    async def choose_parity(
+        self, opponent_history: list, rng: Optional[random.Random] = None,
+        opponent_id: Optional[str] = None,
+    ) -> str:
+        """Sleep longer than timeout, then return a choice (which will be too late).
 
-    def choose_parity(self, opponent_history: list) -> str:
-        """Sleep longer than timeout, then return a choice (which will be too late)."""
+        Sleeps asynchronously so the player keeps serving other messages.
+        """
         # Wait 1 second longer than the configured timeout
         delay = self._timeout + 1
-        time.sleep(delay)
-        return random.choice([ParityChoice.EVEN, ParityChoice.ODD])
+        await asyncio.sleep(delay)
+        return (rng or random).choice([ParityChoice.EVEN, ParityChoice.ODD])
 
 
 # Strategy mapping
@@ -82,3 +110,14 @@ STRATEGIES = {
     "pattern": PatternStrategy,
     "timeout": TimeoutStrategy,
 }
+
+
+def create_strategy(strategy_name: str, settings: Optional[Dict[str, Any]] = None):
+    """Instantiate a strategy, applying its strategy_settings where supported."""
+    if strategy_name == StrategyType.PATTERN:
+        settings = settings or {}
+        return PatternStrategy(
+            pattern_length=settings.get("pattern_length", 3),
+            min_confidence=settings.get("min_confidence", 0.6),
+        )
+    return STRATEGIES.get(strategy_name, RandomStrategy)()
@@ -0,0 +1,120 @@
+"""Non-blocking strategy execution for player agents.
+
+Coroutine strategies are awaited directly. Synchronous (possibly CPU-bound)
+strategies run on a dedicated worker thread, so the player's event loop keeps
+answering acks and broadcasts while a decision is computed. Strategy calls,
+including observe(), are serialized on that thread, so strategies do not need
+to be thread-safe. Every decision is bounded by a deadline. A thread cannot
+be interrupted, so a call that overruns it is abandoned: later calls move to
+a fresh worker thread instead of queueing behind it (the abandoned call, and
+calls already queued behind it, may still finish on the old thread).
+"""
+
+import asyncio
+import inspect
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from SHARED.constants import Timeout
+from SHARED.league_sdk.config_service import get_system_config
+
+
+class StrategyRunner:
+    """Runs strategy decisions off the event loop with a deadline."""
+
+    def __init__(self, deadline_s: Optional[float] = None):
+        if deadline_s is None:
+            deadline_s = get_system_config().timeouts.get(Timeout.PARITY_CHOICE, 30)
+        self.deadline_s = deadline_s
+        self._executor = _worker()
+        self._queued = 0
+        self._pending: Set[Future] = set()  # Submitted to the worker, cancelled on shutdown
+
+    @property
+    def queue_depth(self) -> int:
+        """Strategy calls submitted to the worker thread and not finished yet."""
+        return self._queued
+
+    async def choose(
+        self, strategy, opponent_history: List[str], rng: Optional[random.Random] = None,
+        opponent_id: Optional[str] = None,
+    ) -> str:
+        """Return the strategy's choice; raises asyncio.TimeoutError past the deadline."""
+        decision = self.start(strategy, opponent_history, rng, opponent_id)
+        try:
+            return await asyncio.wait_for(decision, timeout=self.deadline_s)
+        except asyncio.TimeoutError:
+            self.abandon_worker()
+            raise
+
+    def start(
+        self, strategy, opponent_history: List[str], rng: Optional[random.Random] = None,
+        opponent_id: Optional[str] = None,
+    ) -> Awaitable[str]:
+        """Start a decision without a deadline; the caller awaits (or bounds) it."""
+        if inspect.iscoroutinefunction(strategy.choose_parity):
+            return strategy.choose_parity(opponent_history, rng, opponent_id=opponent_id)
+        return self._submit(strategy.choose_parity, opponent_history, rng, opponent_id=opponent_id)
+
+    def observe(self, strategy, opponent_id: str, choice: str) -> None:
+        """Forward an observed opponent choice, queued behind pending decisions."""
+        observe = getattr(strategy, "observe", None)
+        if observe is None:
+            return
+        try:
+            self._submit(observe, opponent_id, choice)
+        except RuntimeError:  # No running loop (e.g. startup priming)
+            observe(opponent_id, choice)
+
+    def prime(self, strategy, history: Iterable[Tuple[str, List[str]]]) -> None:
+        """Replay persisted (opponent_id, choices) into an incremental strategy."""
+        for opponent_id, choices in history:
+            for choice in choices:
+                self.observe(strategy, opponent_id, choice)
+
+    def abandon_worker(self) -> None:
+        """Run later calls on a fresh thread if the worker is stuck in an overdue call."""
+        if any(pending.running() for pending in self._pending):
+            stuck, self._executor = self._executor, _worker()
+            stuck.shutdown(wait=False)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "asyncio.Future":
+        loop = asyncio.get_running_loop()
+        pending = self._executor.submit(fn, *args, **kwargs)
+        self._pending.add(pending)
+        pending.add_done_callback(self._pending.discard)
+        future = asyncio.wrap_future(pending, loop=loop)
+        self._queued += 1
+        future.add_done_callback(self._finished)
+        return future
+
+    def _finished(self, _future: "asyncio.Future") -> None:
+        self._queued -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker, dropping calls not started yet (cancel_futures needs Python 3.9)."""
+        for pending in list(self._pending):
+            pending.cancel()
+        self._executor.shutdown(wait=False)
+
+
+def _worker() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="strategy")
+
+
+_default_runner: Optional[StrategyRunner] = None
+
+
+def create_strategy_runner(settings: Optional[Dict[str, Any]] = None) -> StrategyRunner:
+    """Create a runner from player.json strategy_execution settings."""
+    deadline_ms = (settings or {}).get("decision_deadline_ms")
+    return StrategyRunner(deadline_ms / 1000 if deadline_ms else None)
+
+
+def get_strategy_runner() -> StrategyRunner:
+    """Get the shared strategy runner (deadline from the parity_choice timeout)."""
+    global _default_runner
+    if _default_runner is None:
+        _default_runner = StrategyRunner()
+    return _default_runner
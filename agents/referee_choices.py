@@ -1,9 +1,9 @@
 """Choice collection logic for referee matches."""
 
-from SHARED.constants import Field, LogEvent, Winner
+from SHARED.constants import LATENCY_FIELD, Field, LogEvent, PhaseEvent, Winner
 from SHARED.contracts import build_choose_parity_call
 from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_request
-from SHARED.league_sdk.agent_comm import send
+from SHARED.league_sdk.agent_comm import timed_send
 
 
 def _extract_choice(resp: dict) -> str:
@@ -44,14 +44,19 @@ async def collect_choices(
         player_standings=player_standings,
         timeout_seconds=30,
     )
-    resp_a, resp_b = await send(ep_a, req_a), await send(ep_b, req_b)
-    # Extract choices from JSON-RPC envelope if present
-    choice_a = _extract_choice(resp_a)
-    choice_b = _extract_choice(resp_b)
-    if choice_a:
-        context.record_choice(player_a, choice_a)
-    if choice_b:
-        context.record_choice(player_b, choice_b)
+    choices = []
+    for player_id, endpoint, request in ((player_a, ep_a, req_a), (player_b, ep_b, req_b)):
+        resp, latency_ms = await timed_send(endpoint, request)
+        # Extract choice from JSON-RPC envelope if present
+        choice = _extract_choice(resp)
+        if choice:
+            context.record_choice(player_id, choice)
+            referee.logger.log_message(
+                PhaseEvent.CHOICE_RECEIVED,
+                {Field.MATCH_ID: match_id, Field.PLAYER_ID: player_id, LATENCY_FIELD: latency_ms},
+            )
+        choices.append(choice)
+    choice_a, choice_b = choices
     # Handle timeout scenarios
     if not choice_a and not choice_b:
         referee.logger.log_error(LogEvent.TIMEOUT, "Both players timed out - DRAW")
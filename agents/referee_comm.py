@@ -3,11 +3,7 @@
 from SHARED.constants import Field, Timeout
 from SHARED.contracts import build_game_over, build_match_result_report
 from SHARED.league_sdk.agent_comm import send, send_with_retry
-from SHARED.league_sdk.config_loader import load_agent_config, load_system_config
-
-_system_config = load_system_config()
-_agents_config = load_agent_config()
-_lm_endpoint = _agents_config["league_manager"]["endpoint"]
+from SHARED.league_sdk.config_service import get_lm_endpoint, get_system_config
 
 
 async def notify_game_over(
@@ -62,8 +58,14 @@ async def notify_game_over(
         referee.logger.log_error("GAME_OVER_ERROR", f"Failed to send GAME_OVER: {e}", {"error": str(e)})
 
 
-async def report_result(referee, league_id, round_id, match_id, player_a, player_b, winner):
-    """Report match result to League Manager with retry."""
+async def report_result(
+    referee, league_id, round_id, match_id, player_a, player_b, winner, seed=None
+):
+    """Report match result to League Manager.
+
+    Goes through the referee's result batcher when batching is enabled,
+    otherwise sent immediately with retry.
+    """
     from SHARED.constants import Winner
 
     try:
@@ -84,14 +86,20 @@ async def report_result(referee, league_id, round_id, match_id, player_a, player
             score={player_a: 1 if actual_winner == player_a else 0, player_b: 1 if actual_winner == player_b else 0},
             drawn_number=0,  # Will be updated when we have context
             choices={},  # Will be updated when we have context
+            match_seed=seed,
         )
-        referee.logger.log_message("SENDING_MATCH_RESULT_REPORT", {"to_lm": _lm_endpoint, "match_id": match_id})
+        batcher = getattr(referee, "result_batcher", None)
+        if batcher is not None:
+            await batcher.add(msg["params"])
+            return
+        referee.logger.log_message("SENDING_MATCH_RESULT_REPORT", {"to_lm": get_lm_endpoint(), "match_id": match_id})
+        config = get_system_config()
         await send_with_retry(
-            _lm_endpoint,
+            get_lm_endpoint(),
             msg,
-            max_retries=_system_config.retry_policy["max_retries"],
-            timeout=_system_config.timeouts[Timeout.HTTP_REQUEST],
-            retry_delay=_system_config.retry_policy["retry_delay"],
+            max_retries=config.retry_policy["max_retries"],
+            timeout=config.timeouts[Timeout.HTTP_REQUEST],
+            retry_delay=config.retry_policy["retry_delay"],
         )
         referee.logger.log_message("MATCH_RESULT_REPORT_SENT", {"match_id": match_id})
     except Exception as e:
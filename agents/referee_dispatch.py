@@ -0,0 +1,73 @@
+"""Referee MCP message dispatch - routes incoming messages to handlers."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from fastapi import BackgroundTasks, Request
+from fastapi.responses import JSONResponse
+
+from agents.referee_http_handlers import (
+    handle_broadcast_message,
+    handle_game_join_ack,
+    handle_parity_choice,
+    handle_round_announcement,
+)
+from SHARED.constants import Field, LogEvent, MessageType, Status
+from SHARED.contracts.jsonrpc_helpers import (
+    extract_jsonrpc_params,
+    get_jsonrpc_id,
+    is_jsonrpc_request,
+    wrap_jsonrpc_response,
+)
+from SHARED.league_sdk.tracing import server_span
+
+
+async def handle_referee_request(referee, request: Request, background_tasks: BackgroundTasks) -> JSONResponse:
+    """Handle one HTTP request to a referee's MCP endpoint."""
+    try:
+        response = handle_raw_referee_message(referee, await request.json(), background_tasks)
+        return JSONResponse(content=response)
+    except Exception as e:
+        referee.logger.log_error(LogEvent.REQUEST_ERROR, str(e))
+        return JSONResponse(content={Field.STATUS: Status.ERROR, "message": str(e)}, status_code=500)
+
+
+def handle_raw_referee_message(
+    referee, raw: Dict[str, Any], background_tasks: BackgroundTasks
+) -> Dict[str, Any]:
+    """Handle one decoded message (HTTP body or in-process delivery)."""
+    referee.logger.log_message(LogEvent.RECEIVED, raw)
+    message = extract_jsonrpc_params(raw) if is_jsonrpc_request(raw) else raw
+    request_id = get_jsonrpc_id(raw) if is_jsonrpc_request(raw) else None
+    with server_span(referee.referee_id, raw):
+        response = dispatch_referee_message(referee, message, background_tasks, request_id)
+    referee.logger.log_message(LogEvent.SENT, response)
+    return response
+
+
+def dispatch_referee_message(
+    referee, message: Dict[str, Any], background_tasks: BackgroundTasks, request_id: Optional[int]
+) -> Dict[str, Any]:
+    """Handle one protocol message and return the response body."""
+    msg_type = message.get(Field.MESSAGE_TYPE)
+    if msg_type == MessageType.ROUND_ANNOUNCEMENT:
+        return handle_round_announcement(message, referee, background_tasks, request_id)
+    if msg_type == MessageType.GAME_JOIN_ACK:
+        return handle_game_join_ack(message, referee, request_id)
+    if msg_type == MessageType.PARITY_CHOICE:
+        return handle_parity_choice(message, referee, request_id)
+    if msg_type in (
+        MessageType.ROUND_COMPLETED,
+        MessageType.LEAGUE_STANDINGS_UPDATE,
+        MessageType.LEAGUE_COMPLETED,
+    ):
+        response = handle_broadcast_message(message, referee, request_id)
+        if msg_type == MessageType.LEAGUE_COMPLETED:
+            asyncio.create_task(referee._shutdown_gracefully())
+        return response
+    if msg_type == MessageType.SHUTDOWN_COMMAND:
+        referee.logger.log_message("SHUTDOWN_RECEIVED", {})
+        result = {Field.STATUS: Status.ACKNOWLEDGED}
+        asyncio.create_task(referee._shutdown_gracefully())
+        return wrap_jsonrpc_response(result, request_id) if request_id else result
+    return {Field.STATUS: Status.ERROR, "message": "Unknown message type"}
@@ -1,6 +1,7 @@
 """Game logic for Even-Odd game and game rules factory."""
 
 import random
+from typing import Optional
 
 from SHARED.constants import EVEN_ODD_MAX_NUMBER, EVEN_ODD_MIN_NUMBER, GameID, ParityChoice, Winner
 
@@ -8,8 +9,8 @@ from SHARED.constants import EVEN_ODD_MAX_NUMBER, EVEN_ODD_MIN_NUMBER, GameID, P
 class BaseGameRules:
     """Base class for all game rules - defines the interface."""
 
-    def draw_number(self) -> int:
-        """Draw a random number for the game."""
+    def draw_number(self, rng: Optional[random.Random] = None) -> int:
+        """Draw a random number for the game (from rng if given)."""
         raise NotImplementedError
 
     def validate_parity_choice(self, choice: str) -> bool:
@@ -29,9 +30,13 @@ class EvenOddGameRules(BaseGameRules):
         self.draw_range = (EVEN_ODD_MIN_NUMBER, EVEN_ODD_MAX_NUMBER)
         self.valid_choices = [ParityChoice.EVEN, ParityChoice.ODD]
 
-    def draw_number(self) -> int:
-        """Draw random number between 1 and 10 inclusive."""
-        return random.randint(self.draw_range[0], self.draw_range[1])
+    def draw_number(self, rng: Optional[random.Random] = None) -> int:
+        """Draw random number between 1 and 10 inclusive.
+
+        Args:
+            rng: Per-match random stream; the global generator is used if None
+        """
+        return (rng or random).randint(self.draw_range[0], self.draw_range[1])
 
     def get_parity(self, number: int) -> str:
         """Get parity of number (even or odd)."""
@@ -4,7 +4,7 @@ from typing import Any, Dict, Optional
 
 from SHARED.constants import Field, LogEvent, MessageType, Status
 from SHARED.contracts.jsonrpc_helpers import wrap_jsonrpc_response
-from SHARED.league_sdk.endpoint_resolver import get_player_endpoint
+from SHARED.league_sdk.trace_context import bind
 
 
 def _wrap_ack(result: Dict[str, Any], request_id: Optional[int]) -> Dict[str, Any]:
@@ -14,10 +14,20 @@ def _wrap_ack(result: Dict[str, Any], request_id: Optional[int]) -> Dict[str, An
     return result
 
 
+def _resolve_endpoint(referee, player_id: str, pushed: Optional[str]) -> Optional[str]:
+    """Use the endpoint pushed by the LM, falling back to the last one seen."""
+    if pushed:
+        referee.player_endpoints.set_player(player_id, pushed)
+        return pushed
+    return referee.player_endpoints.get_player(player_id)
+
+
 def handle_round_announcement(message: dict, referee, background_tasks, request_id: Optional[int] = None) -> dict:
     """Handle ROUND_ANNOUNCEMENT message from LM.
 
-    Referee filters matches assigned to its endpoint and starts them.
+    Referee filters matches assigned to its endpoint and starts them. Player
+    endpoints come from the announcement (League Manager session registry) and
+    are remembered in the referee's in-memory cache; no config is read here.
     """
     league_id = message.get(Field.LEAGUE_ID)
     round_id = message.get(Field.ROUND_ID)
@@ -33,7 +43,7 @@ def handle_round_announcement(message: dict, referee, background_tasks, request_
         "ROUND_ANNOUNCEMENT_RECEIVED",
         {
             "round_id": round_id,
-            "total_matches": len(matches),
+            "total_matches": message.get(Field.TOTAL_MATCHES, len(matches)),
             "my_matches": len(my_matches),
         },
     )
@@ -44,9 +54,8 @@ def handle_round_announcement(message: dict, referee, background_tasks, request_
         player_a_id = match.get("player_A_id")
         player_b_id = match.get("player_B_id")
 
-        # Resolve player endpoints from config
-        player_a_endpoint = get_player_endpoint(player_a_id)
-        player_b_endpoint = get_player_endpoint(player_b_id)
+        player_a_endpoint = _resolve_endpoint(referee, player_a_id, match.get(Field.PLAYER_A_ENDPOINT))
+        player_b_endpoint = _resolve_endpoint(referee, player_b_id, match.get(Field.PLAYER_B_ENDPOINT))
 
         if not player_a_endpoint or not player_b_endpoint:
             referee.logger.log_error(
@@ -61,11 +70,12 @@ def handle_round_announcement(message: dict, referee, background_tasks, request_
                 Field.MATCH_ID: match_id,
                 Field.PLAYER_A_ID: player_a_id,
                 Field.PLAYER_B_ID: player_b_id,
+                Field.MATCH_SEED: match.get(Field.MATCH_SEED),
             },
         )
 
         background_tasks.add_task(
-            referee.run_match,
+            bind(referee.run_match),  # Runs after the reply: keep this request's trace
             league_id,
             round_id,
             match_id,
@@ -73,6 +83,7 @@ def handle_round_announcement(message: dict, referee, background_tasks, request_
             player_b_id,
             player_a_endpoint,
             player_b_endpoint,
+            match.get(Field.MATCH_SEED),
         )
 
     result = {Field.STATUS: Status.ACKNOWLEDGED, "matches_started": len(my_matches)}
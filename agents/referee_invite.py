@@ -1,9 +1,9 @@
 """Player invitation logic for referee matches."""
 
-from SHARED.constants import Field, GameID, LogEvent, MessageType
+from SHARED.constants import LATENCY_FIELD, Field, GameID, LogEvent, MessageType, PhaseEvent
 from SHARED.contracts import build_game_invitation
 from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_request
-from SHARED.league_sdk.agent_comm import send
+from SHARED.league_sdk.agent_comm import timed_send
 
 
 def _extract_message(resp: dict) -> dict:
@@ -39,15 +39,16 @@ async def invite_players(
         role_in_match="player_b",
         game_type=GameID.EVEN_ODD,
     )
-    resp_a = await send(ep_a, inv_a)
-    resp_b = await send(ep_b, inv_b)
-    # Extract params from JSON-RPC envelope if response is wrapped
-    msg_a = _extract_message(resp_a)
-    msg_b = _extract_message(resp_b)
-    if msg_a.get(Field.MESSAGE_TYPE) == MessageType.GAME_JOIN_ACK:
-        context.record_join(player_a, msg_a.get(Field.CONVERSATION_ID))
-    if msg_b.get(Field.MESSAGE_TYPE) == MessageType.GAME_JOIN_ACK:
-        context.record_join(player_b, msg_b.get(Field.CONVERSATION_ID))
+    for player_id, endpoint, invitation in ((player_a, ep_a, inv_a), (player_b, ep_b, inv_b)):
+        resp, latency_ms = await timed_send(endpoint, invitation)
+        # Extract params from JSON-RPC envelope if response is wrapped
+        msg = _extract_message(resp)
+        if msg.get(Field.MESSAGE_TYPE) == MessageType.GAME_JOIN_ACK:
+            context.record_join(player_id, msg.get(Field.CONVERSATION_ID))
+            referee.logger.log_message(
+                PhaseEvent.PLAYER_JOINED,
+                {Field.MATCH_ID: match_id, Field.PLAYER_ID: player_id, LATENCY_FIELD: latency_ms},
+            )
     if not context.both_players_joined():
         referee.logger.log_error(LogEvent.TIMEOUT, "Players did not join")
         return False
@@ -4,6 +4,9 @@ This module provides the main match execution entry point.
 Implementation is split into smaller modules for maintainability.
 """
 
+import random
+from typing import Optional
+
 from agents.referee_choices import collect_choices
 from agents.referee_comm import notify_game_over, report_result
 from agents.referee_invite import invite_players
@@ -20,14 +23,19 @@ async def run_match_phases(
     player_b: str,
     player_a_endpoint: str,
     player_b_endpoint: str,
+    seed: Optional[int] = None,
 ):
-    """Orchestrate a complete match (called when LM sends RUN_MATCH)."""
+    """Orchestrate a complete match (called when LM sends RUN_MATCH).
+
+    seed selects the match's random stream; an unseeded stream is used if None.
+    """
     referee.logger.log_message(
         LogEvent.MATCH_START,
         {
             Field.MATCH_ID: match_id,
             Field.PLAYER_A_ID: player_a,
             Field.PLAYER_B_ID: player_b,
+            Field.MATCH_SEED: seed,
         },
     )
     state_machine = MatchStateMachine()
@@ -66,7 +74,8 @@ async def run_match_phases(
     state_machine.transition(MatchState.DRAWING_NUMBER)
     if both_responded:
         # Normal case: both players responded, determine winner by game rules
-        drawn_number = referee.game_rules.draw_number()
+        rng = random.Random(seed) if seed is not None else None
+        drawn_number = referee.game_rules.draw_number(rng)
         winner = referee.game_rules.determine_winner(
             context.player_a_choice, context.player_b_choice, drawn_number
         )
@@ -106,7 +115,7 @@ async def run_match_phases(
     )
     # Phase 5: Report to LM
     await report_result(
-        referee, league_id, round_id, match_id, player_a, player_b, winner
+        referee, league_id, round_id, match_id, player_a, player_b, winner, seed
     )
     state_machine.transition(MatchState.FINISHED)
     referee.logger.log_message(
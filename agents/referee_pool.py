@@ -0,0 +1,107 @@
+"""Multi-tenant referee host: K logical referees behind one process and port.
+
+Each hosted referee keeps its own active_matches, player endpoint cache and
+result batcher, and registers with the League Manager under its own ID and
+endpoint (``/mcp/{referee_id}``). Outgoing messages of all referees share the
+process-wide pooled transport (see SHARED.league_sdk.agent_comm). Messages
+posted to the bare ``/mcp`` path are routed by ``recipient`` or ``referee_id``.
+"""
+
+import asyncio
+from typing import Callable, Dict, Iterable, Optional
+
+import uvicorn
+from fastapi import BackgroundTasks, FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from agents.generic_referee import GenericReferee
+from agents.referee_dispatch import handle_referee_request
+from SHARED.constants import (
+    HEALTH_PATH, HTTP_PROTOCOL, LOCALHOST, MCP_PATH, SERVER_HOST, Field, GameID, LogEvent, Status,
+)
+from SHARED.contracts.jsonrpc_helpers import extract_jsonrpc_params, is_jsonrpc_request
+from SHARED.league_sdk.admin_routes import add_admin_routes
+from SHARED.league_sdk.http_metrics import add_metrics
+from SHARED.league_sdk.agent_comm import get_transport
+from SHARED.league_sdk.log_writer import exit_after_flush
+from SHARED.league_sdk.readiness import health_response
+
+
+def pooled_referee_endpoint(port: int, referee_id: str) -> str:
+    """Contact endpoint of a pooled referee."""
+    return f"{HTTP_PROTOCOL}://{LOCALHOST}:{port}{MCP_PATH}/{referee_id}"
+
+
+class RefereePool:
+    """Hosts K referees in one event loop, routing messages by referee_id."""
+
+    def __init__(self, port: int, referee_ids: Iterable[str], game_type: str = GameID.EVEN_ODD):
+        self.port = port
+        self.referees: Dict[str, GenericReferee] = {}
+        for referee_id in referee_ids:
+            referee = GenericReferee(referee_id, port, game_type, pooled_referee_endpoint(port, referee_id))
+            referee.on_shutdown = lambda rid=referee_id: self._referee_stopped(rid)
+            self.referees[referee_id] = referee
+        self._running = set(self.referees)
+        self.on_shutdown: Callable[[], None] = exit_after_flush
+        self.app = FastAPI(title=f"Referee pool :{port}")
+        self._setup_routes()
+        add_admin_routes(self.app)
+        add_metrics(self.app, f"referee_pool_{port}")
+
+    def _setup_routes(self):
+        @self.app.post(MCP_PATH + "/{referee_id}")
+        async def referee_endpoint(referee_id: str, request: Request, background_tasks: BackgroundTasks):
+            return await self._route(referee_id, request, background_tasks)
+
+        @self.app.post(MCP_PATH)
+        async def shared_endpoint(request: Request, background_tasks: BackgroundTasks) -> JSONResponse:
+            try:
+                raw_message = await request.json()
+            except ValueError:
+                return JSONResponse(content={Field.STATUS: Status.ERROR}, status_code=400)
+            message = extract_jsonrpc_params(raw_message) if is_jsonrpc_request(raw_message) else raw_message
+            recipient = message.get(Field.RECIPIENT) or message.get(Field.REFEREE_ID)
+            return await self._route(recipient, request, background_tasks)
+
+        @self.app.get(HEALTH_PATH)
+        async def health() -> dict:
+            return health_response(f"referee_pool:{self.port}")
+
+        @self.app.on_event("startup")
+        async def startup():
+            for referee in self.referees.values():
+                referee.logger.log_message(
+                    LogEvent.STARTUP, {Field.REFEREE_ID: referee.referee_id, "port": self.port}
+                )
+                asyncio.create_task(referee.register_with_league_manager())
+
+    async def _route(
+        self, referee_id: Optional[str], request: Request, background_tasks: BackgroundTasks
+    ) -> JSONResponse:
+        referee = self.referees.get(referee_id)
+        if referee is None:
+            return JSONResponse(
+                content={Field.STATUS: Status.ERROR, "message": f"Unknown referee: {referee_id}"},
+                status_code=404,
+            )
+        return await handle_referee_request(referee, request, background_tasks)
+
+    def _referee_stopped(self, referee_id: str) -> None:
+        """Close pooled connections and exit once every hosted referee has shut down."""
+        self._running.discard(referee_id)
+        if not self._running:
+            asyncio.ensure_future(self._close_and_exit())
+
+    async def _close_and_exit(self) -> None:
+        transport = get_transport()
+        if hasattr(transport, "aclose"):
+            await transport.aclose()
+        self.on_shutdown()
+
+    def run(self):
+        uvicorn.run(self.app, host=SERVER_HOST, port=self.port)
+
+
+def create_referee_pool_app(port: int, referee_ids: Iterable[str], game_type: str = GameID.EVEN_ODD) -> FastAPI:
+    return RefereePool(port, referee_ids, game_type).app
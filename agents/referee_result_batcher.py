@@ -0,0 +1,88 @@
+"""Referee result batching - coalesces MATCH_RESULT_REPORTs into MATCH_RESULT_BATCH.
+
+Reports are flushed when the batch reaches ``max_batch_size`` or ``linger_ms``
+after the first queued report, whichever comes first, and on shutdown.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from SHARED.constants import Field, Timeout
+from SHARED.contracts import build_match_result_batch
+from SHARED.league_sdk.agent_comm import send_with_retry
+from SHARED.league_sdk.config_service import get_agent_defaults, get_system_config
+
+
+class ResultBatcher:
+    """Buffers result reports for one referee and sends them in batches."""
+
+    def __init__(self, referee_id: str, lm_endpoint: str, logger,
+                 max_batch_size: int = 16, linger_ms: int = 50):
+        self.referee_id, self.lm_endpoint, self.logger = referee_id, lm_endpoint, logger
+        self.max_batch_size = max(1, max_batch_size)
+        self.linger_s = linger_ms / 1000
+        self._pending: List[Dict[str, Any]] = []
+        self._linger_task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, report: Dict[str, Any]) -> None:
+        """Queue a MATCH_RESULT_REPORT body (JSON-RPC params) for delivery."""
+        self._pending.append(report)
+        if len(self._pending) >= self.max_batch_size:
+            await self.flush()
+        elif self._linger_task is None:
+            self._linger_task = asyncio.create_task(self._flush_after_linger())
+
+    async def _flush_after_linger(self) -> None:
+        await asyncio.sleep(self.linger_s)
+        self._linger_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything queued so far (one request per league)."""
+        if self._linger_task is not None and self._linger_task is not asyncio.current_task():
+            self._linger_task.cancel()
+        self._linger_task = None
+        reports, self._pending = self._pending, []
+        by_league: Dict[str, List[Dict[str, Any]]] = {}
+        for report in reports:
+            by_league.setdefault(report.get(Field.LEAGUE_ID), []).append(report)
+        for league_id, league_reports in by_league.items():
+            await self._send(league_id, league_reports)
+
+    async def _send(self, league_id: str, reports: List[Dict[str, Any]]) -> None:
+        match_ids = [r.get(Field.MATCH_ID) for r in reports]
+        try:
+            msg = build_match_result_batch(self.referee_id, league_id, reports)
+            self.logger.log_message("SENDING_MATCH_RESULT_BATCH", {"to_lm": self.lm_endpoint, "match_ids": match_ids})
+            config = get_system_config()
+            response = await send_with_retry(
+                self.lm_endpoint,
+                msg,
+                max_retries=config.retry_policy["max_retries"],
+                timeout=config.timeouts[Timeout.HTTP_REQUEST],
+                retry_delay=config.retry_policy["retry_delay"],
+            )
+            if response is None:  # Retries exhausted: the results never reached the LM
+                self.logger.log_error("MATCH_RESULT_BATCH_ERROR", "Batch dropped after retries", {"match_ids": match_ids})
+                return
+            self.logger.log_message("MATCH_RESULT_BATCH_SENT", {"match_ids": match_ids})
+        except Exception as e:
+            self.logger.log_error("MATCH_RESULT_BATCH_ERROR", f"Failed to send batch: {e}", {"match_ids": match_ids})
+
+
+def create_result_batcher(referee_id: str, lm_endpoint: str, logger) -> Optional[ResultBatcher]:
+    """Create a batcher from referee defaults, or None if batching is disabled."""
+    settings = get_agent_defaults("referee").get("result_batching", {})
+    if not settings.get("enabled", False):
+        return None
+    return ResultBatcher(
+        referee_id,
+        lm_endpoint,
+        logger,
+        max_batch_size=settings.get("max_batch_size", 16),
+        linger_ms=settings.get("linger_ms", 50),
+    )
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Per-phase match latency report from the agent logs.
+
+Streams every referee log (including rotated and compressed segments) and
+prints p50/p90/p99 latencies of each match phase per referee, player and
+round, followed by the slowest players and referees:
+
+    python analyze_latency.py
+    python analyze_latency.py --by player --phase player_choice
+    python analyze_latency.py --csv latency.csv
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from SHARED.league_sdk.latency_analysis import DEFAULT_LOG_DIR, analyze_logs
+from SHARED.league_sdk.latency_histogram import slowest
+
+DIMENSIONS = ["all", "referee", "player", "round"]
+# Phase that best shows how slow an agent of each dimension is
+STRAGGLER_PHASES = {"player": "player_choice", "referee": "match"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-phase match latency percentiles from agent logs")
+    parser.add_argument("--log-dir", type=Path, default=DEFAULT_LOG_DIR)
+    parser.add_argument("--by", choices=DIMENSIONS, nargs="+", default=DIMENSIONS, help="Groupings to print")
+    parser.add_argument("--phase", nargs="+", help="Only these phases, e.g. join player_choice")
+    parser.add_argument("--top", type=int, default=5, help="Slowest agents to list per dimension")
+    parser.add_argument("--csv", type=Path, help="Also write the full summary to this CSV file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    summary = analyze_logs(args.log_dir)
+    elapsed = time.perf_counter() - started
+    if summary.empty:
+        print(f"no match phase events found in {args.log_dir}", file=sys.stderr)
+        return
+    if args.csv:
+        summary.to_csv(args.csv, index=False)
+    shown = summary[summary["dimension"].isin(args.by)]
+    if args.phase:
+        shown = shown[shown["phase"].isin(args.phase)]
+    with pd.option_context("display.width", 160, "display.max_rows", None, "display.float_format", "{:.2f}".format):
+        print(shown.to_string(index=False))
+        for dimension, phase in STRAGGLER_PHASES.items():
+            stragglers = slowest(summary, dimension, phase, top=args.top)
+            if not stragglers.empty:
+                print(f"\nslowest {dimension}s by p90 {phase}:")
+                print(stragglers[["key", "count", "p50_ms", "p90_ms", "p99_ms", "max_ms"]].to_string(index=False))
+    print(f"\nanalyzed {args.log_dir} in {elapsed:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from api.routes import games_router, league_router, matches_router, players_router
 from api.websocket.connection_manager import manager
+from SHARED.league_sdk.http_metrics import add_metrics
 
 # Create FastAPI app with OpenAPI configuration
 app = FastAPI(
@@ -56,6 +57,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+add_metrics(app, "API")  # Request metrics and GET /metrics
 
 # Include routers with /api/v1 prefix
 API_PREFIX = "/api/v1"
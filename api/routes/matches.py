@@ -1,10 +1,13 @@
 """Matches API routes."""
 
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 
 from api.schemas.live import LiveMatchState, PlayerStatus
-from api.schemas.matches import MatchListResponse, MatchResponse
+from api.schemas.matches import MatchListResponse, MatchResponse, MatchTimelineResponse
 from api.services.league_service import LeagueService
+from SHARED.league_sdk.log_index import LogIndex
 
 router = APIRouter(prefix="/matches", tags=["Matches"])
 league_service = LeagueService()
@@ -50,6 +53,24 @@ async def get_match(match_id: str, league_id: str = DEFAULT_LEAGUE_ID):
     raise HTTPException(status_code=404, detail=f"Match '{match_id}' not found")
 
 
+@router.get("/{match_id}/timeline", response_model=MatchTimelineResponse, summary="Get match log timeline")
+def get_match_timeline(match_id: str, limit: Optional[int] = None):
+    """
+    Get every log entry about a match from all agents, in time order.
+
+    The log index is brought up to date incrementally before the query. The
+    route is synchronous, so FastAPI runs this scan in its threadpool instead
+    of blocking the event loop.
+    """
+    index = LogIndex()
+    try:
+        index.update()
+        events = index.timeline(match_id=match_id, limit=limit)
+    finally:
+        index.close()
+    return MatchTimelineResponse(match_id=match_id, events=events, total=len(events))
+
+
 @router.get("/{match_id}/live", response_model=LiveMatchState, summary="Get live match state")
 async def get_live_match_state(match_id: str):
     """
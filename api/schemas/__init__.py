@@ -11,7 +11,7 @@ from .league import (
     StartLeagueResponse,
 )
 from .live import LiveMatchState, RoundResult, WebSocketMessage
-from .matches import MatchListResponse, MatchResponse
+from .matches import MatchListResponse, MatchResponse, MatchTimelineResponse
 from .players import PlayerHistoryResponse, PlayerListResponse, PlayerResponse
 
 __all__ = [
@@ -28,6 +28,7 @@ __all__ = [
     "AgentsStatusResponse",
     "MatchResponse",
     "MatchListResponse",
+    "MatchTimelineResponse",
     "PlayerResponse",
     "PlayerListResponse",
     "PlayerHistoryResponse",
@@ -33,6 +33,14 @@ class MatchResponse(BaseModel):
     rounds_played: List[Dict[str, Any]] = Field(default_factory=list)
 
 
+class MatchTimelineResponse(BaseModel):
+    """Response model for a match's cross-agent log timeline."""
+
+    match_id: str
+    events: List[Dict[str, Any]]
+    total: int
+
+
 class MatchListResponse(BaseModel):
     """Response model for list of matches."""
 
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Cross-agent log timeline for a match, round or conversation.
+
+Updates the log index incrementally, then prints every matching entry from
+all agent logs (including rotated and compressed segments) in time order:
+
+    python query_logs.py --match R1M1
+    python query_logs.py --round 2 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from SHARED.league_sdk.log_index import DEFAULT_INDEX_PATH, DEFAULT_LOG_DIR, LogIndex
+
+
+def _summary(entry: dict) -> str:
+    data = entry.get("data") or entry.get("details") or entry.get("context") or {}
+    message_type = data.get("message_type") or (data.get("params") or {}).get("message_type", "")
+    return f"{entry.get('timestamp', '')}  {entry.get('agent_id', ''):<8} {entry.get('event_type', ''):<28} {message_type}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query agent logs by match, round or conversation")
+    parser.add_argument("--match", dest="match_id", help="match_id, e.g. R1M1")
+    parser.add_argument("--round", dest="round_id", help="round_id, e.g. 2")
+    parser.add_argument("--conversation", dest="conversation_id", help="conversation_id")
+    parser.add_argument("--limit", type=int, help="Return at most this many entries")
+    parser.add_argument("--json", action="store_true", help="Print full entries as JSONL")
+    parser.add_argument("--no-update", action="store_true", help="Query the index without updating it")
+    parser.add_argument("--log-dir", type=Path, default=DEFAULT_LOG_DIR)
+    parser.add_argument("--index", type=Path, default=DEFAULT_INDEX_PATH)
+    args = parser.parse_args()
+    if not (args.match_id or args.round_id or args.conversation_id):
+        parser.error("give --match, --round and/or --conversation")
+
+    index = LogIndex(args.log_dir, args.index)
+    started = time.perf_counter()
+    if not args.no_update:
+        stats = index.update()
+        print(f"indexed {stats['lines']} new lines in {stats['files']} files", file=sys.stderr)
+    queried = time.perf_counter()
+    entries = index.timeline(args.match_id, args.round_id, args.conversation_id, args.limit)
+    done = time.perf_counter()
+    for entry in entries:
+        print(json.dumps(entry) if args.json else _summary(entry))
+    print(
+        f"{len(entries)} entries (update {1000 * (queried - started):.1f} ms, query {1000 * (done - queried):.1f} ms)",
+        file=sys.stderr,
+    )
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
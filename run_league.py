@@ -17,8 +17,12 @@ Execution Flow:
    - LM updates standings
 5. LM sends LEAGUE_COMPLETED to all agents
 6. All agents (Players, Referees, LM) shut down gracefully via protocol
+
+With --in-process, all agents run in this process on one event loop and
+exchange messages through the in-process transport instead of HTTP.
 """
 
+import argparse
 import asyncio
 import signal
 import sys
@@ -26,18 +30,11 @@ import time
 
 from agents.league_manager.orchestration import start_all_agents, wait_for_agents
 from SHARED.constants import LogEvent, Timeout
-from SHARED.league_sdk.config_loader import (
-    load_agent_config,
-    load_system_config,
-)
+from SHARED.league_sdk.config_service import get_agent_config, get_system_config
 from SHARED.league_sdk.logger import LeagueLogger
 
-# Load system config once at module level
-_system_config = load_system_config()
-_agents_config = load_agent_config()
-
 logger = LeagueLogger("LAUNCHER")
-_processes = []
+_supervisor = None
 
 
 def signal_handler(signum, frame):
@@ -46,42 +43,80 @@ def signal_handler(signum, frame):
     sys.exit(0)
 
 
-async def run_league():
+def _stop_on_signal(signum: int) -> None:
+    """Stop every agent process group when the launcher is interrupted."""
+    logger.log_message(LogEvent.SHUTDOWN, {"reason": "signal", "signal": signum})
+    if _supervisor is not None:
+        asyncio.ensure_future(_supervisor.stop())
+
+
+async def run_league(restart_crashed: bool = False, max_restarts: int = 3):
     """Main launcher function.
-    
+
     The launcher only starts agents - the LM auto-starts the league
     when all expected players and referees have registered.
     """
-    global _processes
+    global _supervisor
     logger.log_message("LAUNCHER_START", {})
+    if sys.platform != "win32":
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, _stop_on_signal, signum)
 
     # Load configurations
-    agents_config = load_agent_config()
+    agents_config = get_agent_config()
 
-    # Step 1: Start all agent processes
+    # Step 1: Start all agent processes (in parallel, supervised)
     logger.log_message("STARTING_AGENTS", {})
-    _processes = await start_all_agents(agents_config, logger)
+    _supervisor = await start_all_agents(agents_config, logger, restart_crashed, max_restarts)
 
     # Step 2: Wait for agents to initialize
-    await wait_for_agents(_system_config.timeouts[Timeout.AGENT_STARTUP], logger)
+    await wait_for_agents(get_system_config().timeouts[Timeout.AGENT_STARTUP], logger)
 
     # Step 3: Wait for all processes to exit naturally via protocol
     # LM auto-starts when all agents register, then sends LEAGUE_COMPLETED
     # Agents shut down gracefully after receiving LEAGUE_COMPLETED
     logger.log_message("WAITING_FOR_PROCESSES_TO_EXIT", {})
 
-    for proc in _processes:
-        proc.wait()  # Block until process exits
+    exit_codes = await _supervisor.wait()
+
+    logger.log_message(
+        "LAUNCHER_COMPLETE", {"all_processes_exited": True, "exit_codes": exit_codes}
+    )
+
 
-    logger.log_message("LAUNCHER_COMPLETE", {"all_processes_exited": True})
+async def run_league_single_process(debug: bool) -> None:
+    """Run the whole league in this process (no agent subprocesses, no HTTP)."""
+    from agents.inprocess_league import run_league_in_process
+
+    logger.log_message("LAUNCHER_START", {"mode": "in_process"})
+    started = time.perf_counter()
+    standings = await run_league_in_process(debug=debug)
+    elapsed = time.perf_counter() - started
+    logger.log_message("LAUNCHER_COMPLETE", {"mode": "in_process", "elapsed_s": round(elapsed, 3)})
+    for row in standings:
+        print(f"{row.get('rank', '-'):>3}  {row['player_id']:<8} {row.get('points', 0):>4} pts")
+    print(f"League completed in {elapsed:.2f}s")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the even/odd league")
+    parser.add_argument("--in-process", action="store_true", help="Run all agents in one process")
+    parser.add_argument("--debug-serialization", action="store_true",
+                        help="With --in-process, round-trip every message through JSON")
+    parser.add_argument("--restart-crashed", action="store_true",
+                        help="Restart agent processes that exit with an error")
+    parser.add_argument("--max-restarts", type=int, default=3)
+    args = parser.parse_args()
+
     # Setup signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        asyncio.run(run_league())
+        if args.in_process:
+            asyncio.run(run_league_single_process(args.debug_serialization))
+        else:
+            asyncio.run(run_league(args.restart_crashed, args.max_restarts))
     except KeyboardInterrupt:
         logger.log_message(LogEvent.SHUTDOWN, {"reason": "user_interrupt"})
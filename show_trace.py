@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Waterfall of one match or round from the exported trace spans.
+
+Shows every span of the match (or round) across all agents - the referee's
+sends, the players' handling, the result report reaching the League
+Manager - indented by nesting, with its offset, duration and a time bar:
+
+    python show_trace.py --match R1M1
+    python show_trace.py --round 2
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from SHARED.league_sdk.trace_waterfall import find_root, waterfall
+from SHARED.league_sdk.tracing import DEFAULT_TRACE_DIR
+
+BAR_WIDTH = 40
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show a match or round as a span waterfall")
+    parser.add_argument("--match", dest="match_id", help="match_id, e.g. R1M1")
+    parser.add_argument("--round", dest="round_id", help="round_id, e.g. 2")
+    parser.add_argument("--trace-dir", type=Path, default=Path(DEFAULT_TRACE_DIR))
+    args = parser.parse_args()
+    if bool(args.match_id) == bool(args.round_id):
+        parser.error("give exactly one of --match or --round")
+
+    if args.match_id:
+        root = find_root(args.trace_dir, "match", match_id=args.match_id)
+    else:
+        root = find_root(args.trace_dir, "round", round_id=args.round_id)
+    if root is None:
+        print(f"no trace found in {args.trace_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    rows = waterfall(args.trace_dir, root)
+    origin = root["start_ns"]
+    total = max(max(span["end_ns"] for _, span in rows) - origin, 1)  # Batched reports may end later
+    print(f"trace {root['trace_id']}  {(total / 1e6):.2f} ms  {len(rows)} spans")
+    print(f"{'start_ms':>9} {'dur_ms':>8}  {'agent':<8} span")
+    for depth, span in rows:
+        offset, duration = span["start_ns"] - origin, span["end_ns"] - span["start_ns"]
+        left = min(int(BAR_WIDTH * offset / total), BAR_WIDTH - 1)
+        bar = " " * left + "#" * max(1, min(int(BAR_WIDTH * duration / total), BAR_WIDTH - left))
+        label = "  " * depth + span["name"] + ("  !" + span["error"] if span["error"] else "")
+        print(f"{offset / 1e6:9.2f} {duration / 1e6:8.2f}  {span['agent_id']:<8} {label:<44} |{bar:<{BAR_WIDTH}}|")
+
+
+if __name__ == "__main__":
+    main()
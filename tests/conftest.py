@@ -3,6 +3,29 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+from SHARED.league_sdk import log_writer  # noqa: E402
+from SHARED.league_sdk.log_rotation import RotationPolicy  # noqa: E402
+from SHARED.league_sdk.tracing import configure_tracing, reset_tracing  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope="session")
+def non_rotating_log_writer():
+    """Log without rotation, so production retention never prunes tracked fixtures such as test_logs/."""
+    log_writer.reset_log_writer()
+    log_writer._writer = log_writer.LogWriter(rotation=RotationPolicy())
+    yield
+    log_writer.reset_log_writer()
+
+
+@pytest.fixture(autouse=True)
+def tracing_disabled():
+    """No span export unless a test opts in (tests/test_tracing.py exports to tmp_path)."""
+    configure_tracing(enabled=False)
+    yield
+    reset_tracing()
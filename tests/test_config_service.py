@@ -0,0 +1,75 @@
+"""Tests for the lazily loaded, mtime-cached configuration service."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from SHARED.league_sdk.config_service import ConfigService, get_config_service, get_system_config
+
+ROOT = Path(__file__).parent.parent
+
+
+def _copy_config(tmp_path: Path) -> Path:
+    target = tmp_path / "SHARED" / "config"
+    shutil.copytree(ROOT / "SHARED" / "config", target)
+    return target
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_repeated_access_returns_cached_object(tmp_path):
+    service = ConfigService(_copy_config(tmp_path))
+    assert service.system() is service.system()
+    assert service.agents() is service.agents()
+    assert service.agent_defaults("player") is service.agent_defaults("player")
+
+
+def test_changed_file_is_reloaded(tmp_path):
+    root = _copy_config(tmp_path)
+    service = ConfigService(root)
+    first = service.system()
+    path = root / "system.json"
+    data = json.loads(path.read_text())
+    data["retry_policy"]["max_retries"] = 9
+    path.write_text(json.dumps(data))
+    _bump_mtime(path)
+    second = service.system()
+    assert second is not first
+    assert second.retry_policy["max_retries"] == 9
+
+
+def test_clear_forces_reload(tmp_path):
+    service = ConfigService(_copy_config(tmp_path))
+    first = service.agents()
+    service.clear()
+    assert service.agents() is not first
+
+
+def test_lm_endpoint_from_agents_config(tmp_path):
+    service = ConfigService(_copy_config(tmp_path))
+    assert service.lm_endpoint() == service.agents()["league_manager"]["endpoint"]
+
+
+def test_relative_root_follows_working_directory(monkeypatch, tmp_path):
+    root = _copy_config(tmp_path)
+    path = root / "system.json"
+    data = json.loads(path.read_text())
+    data["active_league_id"] = "league_from_tmp"
+    path.write_text(json.dumps(data))
+    monkeypatch.chdir(tmp_path)
+    assert get_system_config().active_league_id == "league_from_tmp"
+    assert get_config_service() is get_config_service()
+
+
+def test_contracts_import_does_not_load_jsonschema():
+    code = "import sys, SHARED.contracts; print('jsonschema' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,131 @@
+"""Tests for speculative parity decisions precomputed on GAME_INVITATION."""
+
+import asyncio
+
+import pytest
+
+from agents.player_decision_cache import DecisionCache, create_decision_cache
+from agents.player_handlers import handle_invitation, handle_parity_call
+from agents.player_opponent_history import OpponentHistoryCache
+from agents.player_strategy_runner import StrategyRunner
+from SHARED.constants import Field, ParityChoice
+
+
+class _Logger:
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        pass
+
+
+class _Repo:
+    def load(self):
+        return {}
+
+    def save(self, data):
+        pass
+
+
+class _CountingStrategy:
+    def __init__(self, fail=False):
+        self.calls, self.fail = [], fail
+
+    def choose_parity(self, opponent_history, rng=None, opponent_id=None):
+        self.calls.append(list(opponent_history))
+        if self.fail:
+            raise ValueError("boom")
+        return ParityChoice.ODD if len(opponent_history) % 2 else ParityChoice.EVEN
+
+
+def _cache(strategy, max_entries=64):
+    history = OpponentHistoryCache("P01", persist_every=0, repository=_Repo())
+    return DecisionCache(strategy, StrategyRunner(deadline_s=1), history, max_entries), history
+
+
+def test_invitation_precomputes_and_call_answers_from_memory():
+    strategy = _CountingStrategy()
+    decisions, _ = _cache(strategy)
+
+    async def scenario():
+        invitation = {Field.MATCH_ID: "R1M1", Field.OPPONENT_ID: "P02"}
+        handle_invitation("P01", invitation, _Logger(), "conv", decisions)
+        await asyncio.sleep(0.05)
+        call = {Field.MATCH_ID: "R1M1", Field.CONTEXT: {Field.OPPONENT_ID: "P02"}}
+        return await handle_parity_call("P01", call, strategy, _Logger(), decisions=decisions)
+
+    response = asyncio.run(scenario())
+    assert response["params"][Field.PARITY_CHOICE] == ParityChoice.EVEN
+    assert len(strategy.calls) == 1 and "R1M1" not in decisions
+
+
+def test_new_opponent_information_invalidates_speculation():
+    strategy = _CountingStrategy()
+    decisions, history = _cache(strategy)
+
+    async def scenario():
+        decisions.speculate("R2M1", "P02")
+        await asyncio.sleep(0.05)
+        history.record("P02", ParityChoice.ODD)  # GAME_OVER from another match
+        return await decisions.decide("R2M1", "P02")
+
+    assert asyncio.run(scenario()) == ParityChoice.ODD
+    assert strategy.calls == [[], [ParityChoice.ODD]]
+
+
+def test_different_opponent_or_seed_recomputes():
+    strategy = _CountingStrategy()
+    decisions, _ = _cache(strategy)
+
+    async def scenario():
+        decisions.speculate("R1M1", "P02", seed=1)
+        await decisions.decide("R1M1", "P02", seed=2)
+
+    asyncio.run(scenario())
+    assert len(strategy.calls) == 2
+
+
+def test_failed_speculation_falls_back_to_fresh_decision():
+    strategy = _CountingStrategy(fail=True)
+    decisions, _ = _cache(strategy)
+
+    async def scenario():
+        decisions.speculate("R1M1", "P02")
+        await asyncio.sleep(0.05)
+        strategy.fail = False
+        return await decisions.decide("R1M1", "P02")
+
+    assert asyncio.run(scenario()) == ParityChoice.EVEN
+
+
+def test_slow_speculation_still_bounded_by_deadline():
+    class _Slow:
+        async def choose_parity(self, opponent_history, rng=None, opponent_id=None):
+            await asyncio.sleep(1)
+
+    history = OpponentHistoryCache("P01", persist_every=0, repository=_Repo())
+    decisions = DecisionCache(_Slow(), StrategyRunner(deadline_s=0.05), history)
+
+    async def scenario():
+        decisions.speculate("R1M1", "P02")
+        await decisions.decide("R1M1", "P02")
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
+
+
+def test_unclaimed_speculations_are_evicted():
+    decisions, _ = _cache(_CountingStrategy(), max_entries=2)
+
+    async def scenario():
+        for i in range(3):
+            decisions.speculate(f"R1M{i}", "P02")
+
+    asyncio.run(scenario())
+    assert "R1M0" not in decisions and "R1M2" in decisions
+
+
+def test_speculation_can_be_disabled():
+    runner, history = StrategyRunner(deadline_s=1), OpponentHistoryCache("P01", repository=_Repo())
+    assert create_decision_cache({"speculative_decisions": False}, None, runner, history) is None
+    assert create_decision_cache({}, None, runner, history) is not None
@@ -0,0 +1,85 @@
+"""Tests for endpoint resolution from the League Manager session registry."""
+
+from fastapi import BackgroundTasks
+
+from agents.league_manager.assignments import build_match_assignments
+from agents.league_manager.scheduler import get_match_schedule
+from agents.referee_http_handlers import handle_round_announcement
+from SHARED.constants import Field
+from SHARED.contracts import build_round_announcement
+from SHARED.contracts.schema_validator import validate_message
+from SHARED.league_sdk.endpoint_cache import EndpointCache
+
+REF_EP = "http://localhost:8001/mcp"
+PLAYERS = {pid: {"endpoint": f"http://localhost:91{i:02d}/mcp"} for i, pid in enumerate(
+    ["P01", "P02", "P03", "P04", "P99"])}
+REFEREES = {"REF01": {"endpoint": REF_EP}}
+
+
+class _Referee:
+    def __init__(self):
+        self.endpoint = REF_EP
+        self.player_endpoints = EndpointCache()
+        self.errors = []
+
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        self.errors.append(message)
+
+    @property
+    def logger(self):
+        return self
+
+    async def run_match(self, *args):
+        pass
+
+
+def _assignments():
+    schedule = get_match_schedule(sorted(PLAYERS), sorted(REFEREES))
+    return build_match_assignments(schedule[0], PLAYERS, REFEREES, master_seed=1)
+
+
+def test_schedule_includes_dynamically_registered_players():
+    schedule = get_match_schedule(sorted(PLAYERS), sorted(REFEREES))
+    players = {m[k] for r in schedule for m in r for k in ("player_a", "player_b")}
+    assert "P99" in players
+
+
+def test_assignments_carry_session_endpoints():
+    for assignment in _assignments():
+        assert assignment[Field.PLAYER_A_ENDPOINT] == PLAYERS[assignment["player_A_id"]]["endpoint"]
+        assert assignment[Field.PLAYER_B_ENDPOINT] == PLAYERS[assignment["player_B_id"]]["endpoint"]
+        assert assignment["referee_endpoint"] == REF_EP
+
+
+def test_announcement_with_endpoints_validates():
+    msg = build_round_announcement("league_2025_even_odd", 1, _assignments())
+    assert validate_message(msg["params"]) == []
+
+
+def test_referee_uses_pushed_endpoints_and_caches_them():
+    referee, tasks = _Referee(), BackgroundTasks()
+    matches = _assignments()
+    handle_round_announcement({Field.ROUND_ID: 1, Field.MATCHES: matches}, referee, tasks)
+    assert len(tasks.tasks) == len(matches)
+    first = matches[0]
+    assert tasks.tasks[0].args[5] == first[Field.PLAYER_A_ENDPOINT]
+    assert referee.player_endpoints.get_player(first["player_A_id"]) == first[Field.PLAYER_A_ENDPOINT]
+
+
+def test_referee_falls_back_to_cached_endpoint():
+    referee, tasks = _Referee(), BackgroundTasks()
+    referee.player_endpoints.set_player("P01", "http://cached/mcp")
+    match = {"match_id": "R1M1", "player_A_id": "P01", "player_B_id": "P02",
+             "referee_endpoint": REF_EP, Field.PLAYER_B_ENDPOINT: "http://b/mcp"}
+    handle_round_announcement({Field.MATCHES: [match]}, referee, tasks)
+    assert tasks.tasks[0].args[5] == "http://cached/mcp"
+
+
+def test_referee_skips_match_with_unknown_endpoint():
+    referee, tasks = _Referee(), BackgroundTasks()
+    match = {"match_id": "R1M1", "player_A_id": "P01", "player_B_id": "P02", "referee_endpoint": REF_EP}
+    handle_round_announcement({Field.MATCHES: [match]}, referee, tasks)
+    assert tasks.tasks == [] and referee.errors
@@ -0,0 +1,96 @@
+"""Tests for the /metrics endpoint, request middleware and state gauges."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from agents.agent_metrics import active_matches, result_batch_pending, track_referee
+from agents.player_strategy_runner import StrategyRunner
+from SHARED.constants import METRICS_PATH
+from SHARED.contracts.jsonrpc_helpers import wrap_jsonrpc_request
+from SHARED.league_sdk.http_metrics import add_metrics, in_flight, requests_total
+from SHARED.league_sdk.loop_lag import ensure_loop_lag_monitor, lag_seconds, stop_loop_lag_monitor
+from SHARED.league_sdk.metrics import MetricsRegistry, get_metrics_registry
+from SHARED.league_sdk.prometheus_text import render
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+def test_render_exposition_format():
+    registry = MetricsRegistry()
+    registry.counter("sends_total", "Sends", ("endpoint",)).inc(('http://a/"x"',), 2)
+    registry.gauge("depth", "Queue depth", ("queue",)).set_function(("log",), lambda: 7)
+    wait = registry.histogram("wait_seconds", "Wait")
+    for seconds in (0.0004, 0.003, 0.003, 2.0):
+        wait.observe((), seconds)
+    lines = render(registry).splitlines()
+    assert "# TYPE sends_total counter" in lines
+    assert 'sends_total{endpoint="http://a/\\"x\\""} 2' in lines
+    assert 'depth{queue="log"} 7' in lines
+    assert 'wait_seconds_bucket{le="0.0005"} 1' in lines
+    assert 'wait_seconds_bucket{le="0.0025"} 1' in lines and 'wait_seconds_bucket{le="0.005"} 3' in lines
+    assert 'wait_seconds_bucket{le="1.0"} 3' in lines and 'wait_seconds_bucket{le="+Inf"} 4' in lines
+    assert "wait_seconds_count 4" in lines
+    assert any(line.startswith("wait_seconds_sum 2.006") for line in lines)
+
+
+def test_middleware_counts_requests_per_message_type():
+    app = FastAPI()
+    add_metrics(app, "P01")
+
+    @app.post("/mcp/{referee_id}")
+    async def mcp(referee_id: str, request: Request):
+        assert in_flight.value() == 1
+        return {"echo": (await request.json())["params"]["message_type"]}
+
+    message = wrap_jsonrpc_request("game_invitation", {"message_type": "GAME_INVITATION"}, 1)
+    with TestClient(app) as client:
+        assert client.post("/mcp/REF01", json=message).json() == {"echo": "GAME_INVITATION"}
+        client.post("/mcp/REF02", json=message)
+        assert client.get("/nowhere").status_code == 404
+        text = client.get(METRICS_PATH).text
+    assert requests_total.value(("/mcp/{referee_id}", "GAME_INVITATION", "200")) == 2
+    assert requests_total.value(("unmatched", "-", "404")) == 1
+    assert in_flight.value() == 0
+    assert 'http_request_seconds_count{route="/mcp/{referee_id}",message_type="GAME_INVITATION"} 2' in text
+    assert "log_write_backlog" in text and "# TYPE event_loop_lag_seconds histogram" in text
+
+
+def test_loop_lag_monitor_sees_a_blocked_loop():
+    async def block():
+        ensure_loop_lag_monitor(0.005)
+        await asyncio.sleep(0.01)
+        time.sleep(0.06)  # Blocks the loop
+        await asyncio.sleep(0.02)
+        stop_loop_lag_monitor()
+
+    asyncio.run(block())
+    assert lag_seconds.samples()[()].max >= 50_000
+
+
+def test_state_gauges_read_agent_state():
+    referee = SimpleNamespace(referee_id="REF09", active_matches={"R1M1": {}}, result_batcher=None)
+    track_referee(referee)
+    referee.active_matches["R1M2"] = {}
+    assert active_matches.samples()[("REF09",)] == 2
+    assert result_batch_pending.samples()[("REF09",)] == 0
+
+    runner = StrategyRunner(deadline_s=1)
+
+    async def decide():
+        pending = runner._submit(time.sleep, 0.02)
+        depth = runner.queue_depth
+        await pending
+        return depth, runner.queue_depth
+
+    assert asyncio.run(decide()) == (1, 0)
+    runner.shutdown()
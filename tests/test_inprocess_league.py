@@ -0,0 +1,78 @@
+"""Tests for the in-process transport and the all-in-one league mode."""
+
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from SHARED.league_sdk.inprocess_transport import InProcessTransport
+from SHARED.league_sdk.transport import TransportType, create_transport
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def test_in_process_transport_is_registered():
+    transport = create_transport(TransportType.IN_PROCESS, timeout=30)
+    assert isinstance(transport, InProcessTransport)
+
+
+def test_send_dispatches_to_registered_handler():
+    transport, seen = InProcessTransport(), []
+
+    async def handler(message):
+        seen.append(message)
+        return {"status": "ok"}
+
+    transport.register_endpoint("inproc://A/mcp", handler)
+    message = {"message_type": "PING"}
+    assert asyncio.run(transport.send("inproc://A/mcp", message)) == {"status": "ok"}
+    assert seen[0] is message  # No copy outside debug mode
+    assert asyncio.run(transport.send("inproc://B/mcp", message)) is None
+
+
+def test_failing_handler_looks_like_a_failed_request():
+    transport = InProcessTransport()
+
+    async def handler(message):
+        raise RuntimeError("boom")
+
+    transport.register_endpoint("inproc://A/mcp", handler)
+    assert asyncio.run(transport.send_with_retry("inproc://A/mcp", {}, max_retries=1)) is None
+
+
+def test_debug_mode_checks_serialization():
+    transport, seen = InProcessTransport(debug=True), []
+
+    async def handler(message):
+        seen.append(message)
+        return {"echo": message["value"]}
+
+    transport.register_endpoint("inproc://A/mcp", handler)
+    message = {"value": 1}
+    assert asyncio.run(transport.send("inproc://A/mcp", message)) == {"echo": 1}
+    assert seen[0] == message and seen[0] is not message
+    with pytest.raises(TypeError):
+        asyncio.run(transport.send("inproc://A/mcp", {"value": object()}))
+
+
+def test_full_league_runs_in_one_process(tmp_path):
+    """Runs a real league (fresh interpreter, scratch data dir) without HTTP."""
+    shutil.copytree(PROJECT_ROOT / "SHARED" / "config", tmp_path / "SHARED" / "config")
+    script = (
+        "import asyncio, json\n"
+        "from agents.inprocess_league import run_league_in_process\n"
+        "print(json.dumps(asyncio.run(run_league_in_process(debug=True, timeout=60))))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    standings = json.loads(result.stdout.strip().splitlines()[-1])
+    assert sorted(row["player_id"] for row in standings) == ["P01", "P02", "P03", "P04"]
+    assert all(row["games_played"] == 3 for row in standings)
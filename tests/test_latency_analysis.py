@@ -0,0 +1,89 @@
+"""Tests for per-phase match latency analysis from referee logs."""
+
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from SHARED.league_sdk.latency_analysis import analyze_logs
+from SHARED.league_sdk.latency_histogram import LatencyHistograms, slowest
+
+
+def _line(ms, agent_id, event_type, data):
+    entry = {
+        "timestamp": f"2026-01-01T00:00:{ms // 1000:02d}.{ms % 1000:03d}Z", "level": "INFO",
+        "agent_id": agent_id, "event_type": event_type, "data": data,
+    }
+    return json.dumps(entry) + "\n"
+
+
+def _match(start, referee_id, match_id, players=("P01", "P02"), report="MATCH_RESULT_REPORT_SENT"):
+    """A match whose phases take 10, 20, 1, 2 and 30 ms."""
+    lines = [_line(start, referee_id, "STARTING_MATCH", {"match_id": match_id})]
+    for i, player_id in enumerate(players):
+        lines.append(_line(start + 5 * (i + 1), referee_id, "PLAYER_JOINED",
+                           {"match_id": match_id, "player_id": player_id, "latency_ms": 5.0 * (i + 1)}))
+    for i, player_id in enumerate(players):
+        lines.append(_line(start + 10 + 10 * (i + 1), referee_id, "CHOICE_RECEIVED",
+                           {"match_id": match_id, "player_id": player_id, "latency_ms": 10.0}))
+    lines.append(_line(start + 31, referee_id, "WINNER_DETERMINED", {"match_id": match_id}))
+    lines.append(_line(start + 33, referee_id, "GAME_OVER_SENT", {"match_id": match_id}))
+    if report:
+        lines.append(_line(start + 63, referee_id, report, {"match_id": match_id}))
+    return "".join(lines)
+
+
+@pytest.fixture
+def logs(tmp_path):
+    with gzip.open(tmp_path / "REF01.20260101T000000000Z.log.jsonl.gz", "wt") as f:
+        f.write(_match(0, "REF01", "R1M1"))
+    (tmp_path / "REF01.log.jsonl").write_text(
+        _match(1000, "REF01", "R2M1") + _line(1001, "REF01", "RECEIVED", {"match_id": "R2M1"})
+    )
+    batched = _match(2000, "REF02", "R1M2", ("P03", "P04"), report=None)
+    batched += _line(2100, "REF02", "MATCH_RESULT_BATCH_SENT", {"match_ids": ["R1M2"]})
+    (tmp_path / "REF02.log.jsonl").write_text(batched + _match(3000, "REF02", "R2M2", report=None))
+    return tmp_path
+
+
+def _row(summary, phase, dimension="all", key="all"):
+    rows = summary[(summary.phase == phase) & (summary.dimension == dimension) & (summary.key == key)]
+    assert len(rows) == 1
+    return rows.iloc[0]
+
+
+@pytest.mark.parametrize("batch_events", [1, 3, 50_000])
+def test_phase_latencies_per_group(logs, batch_events):
+    summary = analyze_logs(logs, batch_events)
+    for phase, ms in (("join", 10), ("choices", 20), ("decide", 1), ("notify", 2)):
+        assert _row(summary, phase)["count"] == 4
+        assert _row(summary, phase)["max_ms"] == ms
+    assert _row(summary, "report")["count"] == 3  # R2M2 was never reported
+    assert _row(summary, "report", "referee", "REF02")["max_ms"] == 67  # Reported in a batch
+    assert _row(summary, "match", "round", "2")["count"] == 1
+    assert _row(summary, "player_join", "player", "P02")["mean_ms"] == 10
+    assert _row(summary, "player_choice", "player", "P03")["count"] == 1
+    assert set(summary.dimension) == {"all", "referee", "round", "player"}
+
+
+def test_histogram_percentiles_within_one_bin():
+    values = np.random.default_rng(7).lognormal(mean=3, sigma=1, size=20_000)
+    histograms = LatencyHistograms()
+    for chunk in np.array_split(values, 4):
+        histograms.add(pd.DataFrame({"phase": "match", "dimension": "all", "key": "all", "ms": chunk}))
+    row = histograms.summary().iloc[0]
+    assert row["count"] == 20_000 and row["max_ms"] == values.max()
+    for q in (50, 90, 99):
+        assert row[f"p{q}_ms"] == pytest.approx(np.percentile(values, q), rel=0.03)
+
+
+def test_slowest_agents_first():
+    histograms = LatencyHistograms()
+    histograms.add(pd.DataFrame({
+        "phase": "player_choice", "dimension": "player",
+        "key": ["P01", "P02", "P02", "P03"], "ms": [5.0, 50.0, 40.0, 500.0],
+    }))
+    stragglers = slowest(histograms.summary(), "player", "player_choice", top=2)
+    assert list(stragglers["key"]) == ["P03", "P02"]
@@ -0,0 +1,127 @@
+"""Tests for the incremental cross-agent log index."""
+
+import gzip
+import json
+import threading
+
+import pytest
+
+from SHARED.league_sdk import gzip_seek
+from SHARED.league_sdk.log_index import LogIndex
+from SHARED.league_sdk.log_scan import line_keys, read_entries
+
+
+def _line(second, agent_id, event_type, data):
+    entry = {
+        "timestamp": f"2026-01-01T00:00:{second:02d}.000Z", "level": "INFO",
+        "agent_id": agent_id, "event_type": event_type, "data": data,
+    }
+    return json.dumps(entry) + "\n"
+
+
+def _invitation(match_id, conversation_id):
+    return {"params": {"match_id": match_id, "round_id": 1, "conversation_id": conversation_id}}
+
+
+@pytest.fixture
+def logs(tmp_path):
+    log_dir = tmp_path / "agents"
+    log_dir.mkdir()
+    (log_dir / "REF01.log.jsonl").write_text(
+        _line(1, "REF01", "SENT", _invitation("R1M1", "c1")) + _line(3, "REF01", "SENT", _invitation("R1M2", "c2"))
+    )
+    (log_dir / "P01.log.jsonl").write_text(_line(2, "P01", "RECEIVED", _invitation("R1M1", "c1")))
+    with gzip.open(log_dir / "LM01.20260101T000000000Z.log.jsonl.gz", "wt") as f:
+        f.write(_line(0, "LM01", "SENT", {"matches": [{"match_id": "R1M1"}]}))
+    return log_dir
+
+
+def test_line_keys_found_at_any_depth():
+    timestamp, keys = line_keys(_line(5, "P01", "RECEIVED", _invitation("R1M1", "c9")).encode())
+    assert timestamp == "2026-01-01T00:00:05.000Z"
+    assert keys == {(0, "R1M1"), (1, "1"), (2, "c9")}
+
+
+def test_match_timeline_across_agents_and_segments(logs, tmp_path):
+    index = LogIndex(logs, tmp_path / "index.sqlite3")
+    assert index.update()["files"] == 3
+    timeline = index.timeline(match_id="R1M1")
+    assert [(e["agent_id"], e["timestamp"][-7:]) for e in timeline] == [
+        ("LM01", "00.000Z"), ("REF01", "01.000Z"), ("P01", "02.000Z"),
+    ]
+    assert [e["agent_id"] for e in index.timeline(round_id=1)] == ["REF01", "P01", "REF01"]
+    assert len(index.timeline(match_id="R1M1", conversation_id="c2")) == 0
+    assert len(index.timeline(match_id="R1M1", limit=1)) == 1
+    with pytest.raises(ValueError):
+        index.timeline()
+    index.close()
+
+
+def test_update_is_incremental(logs, tmp_path):
+    index = LogIndex(logs, tmp_path / "index.sqlite3")
+    index.update()
+    assert index.update() == {"files": 0, "lines": 0, "dropped": 0}
+    partial = _line(4, "P01", "SENT", _invitation("R1M1", "c1"))
+    with open(logs / "P01.log.jsonl", "a") as f:
+        f.write(partial[:20])  # Still being written
+    assert index.update()["lines"] == 0
+    with open(logs / "P01.log.jsonl", "a") as f:
+        f.write(partial[20:])
+    assert index.update()["lines"] == 1
+    assert len(index.timeline(match_id="R1M1")) == 4
+    index.close()
+
+
+def test_rotated_and_deleted_files(logs, tmp_path):
+    index = LogIndex(logs, tmp_path / "index.sqlite3")
+    index.update()
+    active = logs / "REF01.log.jsonl"
+    active.rename(logs / "REF01.20260101T000001000Z.log.jsonl")  # Rotation
+    active.write_text(_line(9, "REF01", "SENT", _invitation("R2M1", "c3")))
+    (logs / "P01.log.jsonl").unlink()
+    stats = index.update()
+    assert stats["dropped"] == 1 and stats["lines"] == 3  # Replaced REF01 file is re-indexed
+    assert [e["agent_id"] for e in index.timeline(match_id="R1M1")] == ["LM01", "REF01"]
+    assert len(index.timeline(match_id="R2M1")) == 1
+    index.close()
+
+
+def test_concurrent_updates_do_not_collide(logs, tmp_path):
+    for i in range(20):
+        (logs / f"PX{i:02d}.log.jsonl").write_text(_line(5, f"PX{i:02d}", "SENT", _invitation("R1M1", "c1")))
+    LogIndex(logs, tmp_path / "index.sqlite3").close()
+    barrier, errors = threading.Barrier(4), []
+
+    def update():
+        index = LogIndex(logs, tmp_path / "index.sqlite3")
+        barrier.wait()
+        try:
+            index.update()
+        except Exception as e:  # noqa: BLE001 - collected for the assertion
+            errors.append(e)
+        index.close()
+
+    threads = [threading.Thread(target=update) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    index = LogIndex(logs, tmp_path / "index.sqlite3")
+    assert errors == [] and len(index.timeline(match_id="R1M1")) == 23
+    index.close()
+
+
+def test_gzip_reads_resume_from_seek_points(tmp_path, monkeypatch):
+    monkeypatch.setattr(gzip_seek, "SEEK_POINT_SPACING", 4096)
+    monkeypatch.setattr(gzip_seek, "_CHUNK", 512)
+    lines = [_line(i % 60, "P01", "SENT", {"n": i, "pad": "x" * (i % 50)}).encode() for i in range(600)]
+    segment = tmp_path / "P01.20260101T000000000Z.log.jsonl.gz"
+    segment.write_bytes(gzip.compress(b"".join(lines[:300])) + gzip.compress(b"".join(lines[300:])))  # Two members
+    offsets = [sum(len(line) for line in lines[:i]) for i in range(len(lines))]
+    builds = []
+    monkeypatch.setattr(gzip_seek, "_build", lambda path, build=gzip_seek._build: builds.append(path) or build(path))
+    wanted = [599, 0, 310, 299, 300, 150]
+    for _ in range(2):
+        entries = read_entries(segment, [offsets[i] for i in wanted])
+        assert [entry["data"]["n"] for _, entry in entries] == sorted(wanted)
+    assert len(builds) == 1 and len(gzip_seek.seek_points(segment)) > 5
@@ -0,0 +1,103 @@
+"""Tests for log level filtering, sampling, payload caps and the admin toggle."""
+
+import json
+import random
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from SHARED.constants import ADMIN_LOGGING_PATH, PayloadMode
+from SHARED.league_sdk import log_policy, log_writer
+from SHARED.league_sdk.admin_routes import add_admin_routes
+from SHARED.league_sdk.log_policy import LogPolicy, get_log_policy
+from SHARED.league_sdk.log_writer import LogWriter
+from SHARED.league_sdk.logger import LeagueLogger, LogLevel
+
+
+def _entry(payload):
+    entry = {"level": "INFO", "event_type": "RECEIVED", "data": payload}
+    return entry, json.dumps(entry)
+
+
+def test_minimum_level_drops_lower_levels():
+    policy = LogPolicy(min_level="WARN")
+    assert not policy.allows("INFO", "RECEIVED")
+    assert policy.allows("WARN", "RECEIVED") and policy.allows("ERROR", "ERROR")
+
+
+def test_sampling_rate_per_event_type():
+    policy = LogPolicy(sample_rates={"RECEIVED": 0.25, "SENT": 0.0}, rng=random.Random(1))
+    kept = sum(policy.allows("INFO", "RECEIVED") for _ in range(2000))
+    assert 400 < kept < 600
+    assert not any(policy.allows("INFO", "SENT") for _ in range(100))
+    assert policy.allows("INFO", "STARTUP")
+    assert policy.allows("ERROR", "SENT")  # Errors are never sampled away
+
+
+def test_oversized_payload_truncated_with_hash():
+    policy = LogPolicy(max_payload_bytes=100)
+    entry, line = _entry({"standings": ["P%03d" % i for i in range(100)]})
+    data = json.loads(policy.cap(entry, line))["data"]
+    assert data["oversized"] and data["bytes"] > 100 and len(data["sha256"]) == 64
+    assert len(data["preview"]) == 100
+
+
+def test_oversized_payload_hash_only_and_small_payload_untouched():
+    policy = LogPolicy(max_payload_bytes=100, oversized_payloads=PayloadMode.HASH)
+    entry, line = _entry("x" * 500)
+    assert "preview" not in json.loads(policy.cap(entry, line))["data"]
+    small_entry, small_line = _entry({"ok": True})
+    assert policy.cap(small_entry, small_line) is small_line
+
+
+def test_debug_payloads_bypass_caps_and_sampling():
+    policy = LogPolicy(sample_rates={"SENT": 0.0}, max_payload_bytes=10, debug_payloads=True)
+    entry, line = _entry("x" * 500)
+    assert policy.cap(entry, line) == line
+    assert policy.allows("INFO", "SENT")
+
+
+def test_configure_rejects_unknown_values():
+    policy = LogPolicy()
+    bad_settings = (
+        {"min_level": "LOUD"}, {"oversized_payloads": "zip"}, {"colour": "red"}, {"max_payload_bytes": "100"},
+        {"max_payload_bytes": -1}, {"sample_rates": "x"}, {"sample_rates": {"SENT": 2}}, {"debug_payloads": "yes"},
+    )
+    for bad in bad_settings:
+        try:
+            policy.configure(**bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad}")
+    assert policy.max_payload_bytes is None and policy.sample_rates == {}
+
+
+def test_logger_applies_agent_policy(monkeypatch, tmp_path):
+    monkeypatch.setattr(log_writer, "_writer", LogWriter(buffered=False))
+    monkeypatch.setattr(log_policy, "_policies", {})
+    logger = LeagueLogger("P01", tmp_path)
+    assert logger.policy is get_log_policy("P01")
+    logger.policy.set_level("INFO")
+    logger.log_message("NOISE", {}, LogLevel.DEBUG)
+    logger.log_message("KEPT", {})
+    events = [json.loads(line)["event_type"] for line in logger.log_file.read_text().splitlines()]
+    assert events == ["KEPT"]
+
+
+def test_admin_endpoint_toggles_debug_payloads(monkeypatch):
+    monkeypatch.setattr(log_policy, "_policies", {})
+    get_log_policy("P01")
+    get_log_policy("P02")
+    app = FastAPI()
+    add_admin_routes(app)
+    client = TestClient(app, client=("127.0.0.1", 50000))
+    response = client.post(ADMIN_LOGGING_PATH, json={"agent_id": "P01", "debug_payloads": True})
+    assert response.status_code == 200
+    assert response.json()["P01"]["debug_payloads"] and not response.json()["P02"]["debug_payloads"]
+    client.post(ADMIN_LOGGING_PATH, json={"min_level": "WARN"})
+    assert {p["min_level"] for p in client.get(ADMIN_LOGGING_PATH).json().values()} == {"WARN"}
+    assert client.post(ADMIN_LOGGING_PATH, json={"agent_id": "X"}).status_code == 404
+    assert client.post(ADMIN_LOGGING_PATH, json={"min_level": "LOUD"}).status_code == 400
+    assert client.post(ADMIN_LOGGING_PATH, json={"max_payload_bytes": "100"}).status_code == 400
+    assert client.post(ADMIN_LOGGING_PATH, json=[1]).status_code == 400
+    assert TestClient(app, client=("10.1.2.3", 50000)).post(ADMIN_LOGGING_PATH, json={}).status_code == 403
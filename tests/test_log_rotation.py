@@ -0,0 +1,91 @@
+"""Tests for log rotation, background compression and retention."""
+
+import gzip
+import json
+import time
+
+from SHARED.league_sdk.log_retention import SegmentMaintainer
+from SHARED.league_sdk.log_rotation import (
+    LogSegment,
+    RotationPolicy,
+    rotated_segments,
+    segment_path,
+    segment_start,
+)
+from SHARED.league_sdk.log_writer import LogWriter
+
+LINE = json.dumps({"timestamp": "2026-01-02T03:04:05.678Z", "event_type": "X"}) + "\n"
+
+
+def test_segment_names_encode_start_time(tmp_path):
+    path = tmp_path / "P01.log.jsonl"
+    segment = segment_path(path, 1767323045.678)
+    assert segment.name == "P01.20260102T030405678Z.log.jsonl"
+    assert abs(segment_start(segment) - 1767323045.678) < 0.001
+    assert segment_start(path) is None
+    later = segment_path(path, 1767323045.678 + 3600)
+    assert sorted([later, segment]) == [segment, later]
+
+
+def test_size_rotation_starts_new_file(tmp_path):
+    path = tmp_path / "P01.log.jsonl"
+    before = time.time()
+    writer = LogWriter(buffered=False, rotation=RotationPolicy(max_bytes=len(LINE) * 3, compress=False))
+    for _ in range(7):
+        writer.write(path, LINE)
+    writer.close()
+    segments = rotated_segments(path)
+    assert len(segments) == 2
+    assert [len(p.read_text().splitlines()) for p in segments] == [3, 3]
+    assert len(path.read_text().splitlines()) == 1
+    assert before - 0.001 <= segment_start(segments[0]) <= segment_start(segments[1]) <= time.time() + 0.01
+
+
+def test_existing_file_keeps_first_entry_time(tmp_path):
+    path = tmp_path / "P01.log.jsonl"
+    path.write_text(LINE)
+    segment = LogSegment(path)
+    assert segment.rotate().name == "P01.20260102T030405678Z.log.jsonl"
+
+
+def test_age_rotation(tmp_path):
+    segment = LogSegment(tmp_path / "P01.log.jsonl")
+    assert not segment.due(RotationPolicy(max_age_s=60))  # Empty files never rotate
+    segment.write(LINE)
+    segment.started = time.time() - 120
+    assert segment.due(RotationPolicy(max_age_s=60))
+    assert not segment.due(RotationPolicy(max_bytes=10_000))
+    segment.close()
+
+
+def test_rotated_segments_compressed(tmp_path):
+    path = tmp_path / "P01.log.jsonl"
+    writer = LogWriter(buffered=False, rotation=RotationPolicy(max_bytes=len(LINE)))
+    writer.write(path, LINE)
+    writer.close()  # Waits for the background compression
+    (segment,) = rotated_segments(path)
+    assert segment.name.endswith(".log.jsonl.gz")
+    with gzip.open(segment, "rt", encoding="utf-8") as f:
+        assert f.read() == LINE
+
+
+def test_retention_by_count_and_age(tmp_path):
+    path = tmp_path / "P01.log.jsonl"
+    now = time.time()
+    for days_ago in (30, 3, 2, 1):
+        segment_path(path, now - days_ago * 86400).write_text(LINE)
+    SegmentMaintainer(RotationPolicy(compress=False, max_segments=2)).maintain(path)
+    assert [round((now - segment_start(p)) / 86400) for p in rotated_segments(path)] == [2, 1]
+    SegmentMaintainer(RotationPolicy(compress=False, retention_days=1.5)).maintain(path)
+    assert [round((now - segment_start(p)) / 86400) for p in rotated_segments(path)] == [1]
+
+
+def test_maintenance_runs_inline_once_executors_refuse_work(tmp_path):
+    path = tmp_path / "P01.log.jsonl"
+    maintainer = SegmentMaintainer(RotationPolicy())
+    maintainer.submit(path)
+    maintainer._executor.shutdown()  # As at interpreter exit, when the atexit close rotates
+    segment_path(path, time.time()).write_text(LINE)
+    maintainer.submit(path)
+    (segment,) = rotated_segments(path)
+    assert segment.name.endswith(".log.jsonl.gz")
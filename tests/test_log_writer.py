@@ -0,0 +1,81 @@
+"""Tests for the buffered background log writer."""
+
+import json
+
+from SHARED.constants import FsyncPolicy
+from SHARED.league_sdk import log_writer
+from SHARED.league_sdk.log_writer import LogWriter
+from SHARED.league_sdk.logger import LeagueLogger
+
+
+def _lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_buffered_lines_written_on_flush(tmp_path):
+    writer = LogWriter(flush_interval_s=60)
+    path = tmp_path / "a.log.jsonl"
+    for i in range(3):
+        writer.write(path, f"{i}\n")
+    writer.flush()
+    assert _lines(path) == ["0", "1", "2"]
+    writer.close()
+
+
+def test_one_persistent_handle_per_file(tmp_path):
+    writer = LogWriter(flush_interval_s=0)
+    first, second = tmp_path / "a.log", tmp_path / "b.log"
+    for _ in range(5):
+        writer.write(first, "x\n")
+        writer.write(second, "y\n")
+    writer.flush()
+    assert set(writer._files) == {first, second}
+    handle = writer._files[first]
+    writer.write(first, "z\n")
+    writer.flush()
+    assert writer._files[first] is handle
+    assert _lines(first) == ["x"] * 5 + ["z"]
+    writer.close()
+
+
+def test_close_writes_pending_lines_and_closes_files(tmp_path):
+    writer = LogWriter(flush_interval_s=60)
+    path = tmp_path / "a.log"
+    writer.write(path, "last\n")
+    writer.close()
+    assert _lines(path) == ["last"]
+    assert writer._files == {}
+
+
+def test_unbuffered_and_always_fsync_write_synchronously(tmp_path):
+    for writer in (LogWriter(buffered=False), LogWriter(fsync=FsyncPolicy.ALWAYS)):
+        path = tmp_path / f"{writer.buffered}.log"
+        writer.write(path, "now\n")
+        assert _lines(path) == ["now"]
+        assert writer._thread is None
+        writer.close()
+
+
+def test_league_logger_uses_shared_writer(monkeypatch, tmp_path):
+    monkeypatch.setattr(log_writer, "_writer", LogWriter(flush_interval_s=60))
+    logger = LeagueLogger("P01", tmp_path)
+    data = {"n": 1}
+    logger.log_message("EVENT", data)
+    data["n"] = 2  # Entries are serialized when logged
+    logger.flush()
+    entry = json.loads(_lines(logger.log_file)[0])
+    assert entry["event_type"] == "EVENT" and entry["data"] == {"n": 1}
+    log_writer._writer.close()
+
+
+def test_failed_batch_does_not_stop_the_writer(tmp_path, capsys):
+    writer = LogWriter(flush_interval_s=0)
+    bad, good = tmp_path / "missing" / "dir" / "a.log", tmp_path / "b.log"
+    (tmp_path / "missing").write_text("not a directory")
+    writer.write(bad, "lost\n")
+    writer.flush(timeout=1.0)
+    writer.write(good, "kept\n")
+    writer.flush(timeout=1.0)
+    assert writer._thread.is_alive() and _lines(good) == ["kept"]
+    assert "league-log-writer" in capsys.readouterr().err
+    writer.close()
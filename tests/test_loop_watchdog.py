@@ -0,0 +1,63 @@
+"""Tests for the blocking-call watchdog."""
+
+import asyncio
+import time
+
+from SHARED.constants import LogEvent
+from SHARED.league_sdk.loop_lag import ensure_loop_lag_monitor, stop_loop_lag_monitor
+from SHARED.league_sdk.loop_watchdog import BlockingWatchdog, block_seconds, blocked_total, create_watchdog
+
+
+class _Logger:
+    def __init__(self, agent_id):
+        self.agent_id, self.warnings = agent_id, []
+
+    def warn(self, event_type, data):
+        self.warnings.append((event_type, data))
+
+
+def _blocking_report_writer():
+    time.sleep(0.2)  # Synchronous I/O stand-in
+
+
+def _run(watchdog, work):
+    async def main():
+        ensure_loop_lag_monitor(0.25, watchdog)
+        await asyncio.sleep(0.03)
+        await work()
+        await asyncio.sleep(0.05)
+        stop_loop_lag_monitor()
+
+    asyncio.run(main())
+
+
+def test_blocking_call_is_reported_with_its_stack():
+    logger = _Logger("LM99")
+    watchdog = BlockingWatchdog(logger, threshold_s=0.05, interval_s=0.01)
+    before = blocked_total.value(("LM99",))
+
+    async def handler():
+        _blocking_report_writer()
+
+    _run(watchdog, handler)
+    assert [event for event, _ in logger.warnings] == [LogEvent.LOOP_BLOCKED]
+    report = logger.warnings[0][1]
+    assert report["blocked_ms"] >= 150 and report["threshold_ms"] == 50
+    assert any("_blocking_report_writer" in frame for frame in report["stack"])
+    assert blocked_total.value(("LM99",)) == before + 1
+    assert block_seconds.samples()[("LM99",)].max >= 150_000
+
+
+def test_cooperative_work_is_not_reported():
+    logger = _Logger("LM98")
+
+    async def handler():
+        for _ in range(10):
+            await asyncio.sleep(0.005)
+
+    _run(BlockingWatchdog(logger, threshold_s=0.05, interval_s=0.01), handler)
+    assert logger.warnings == []
+
+
+def test_watchdog_is_opt_in():
+    assert create_watchdog("P01") is None
@@ -0,0 +1,72 @@
+"""Tests for the incremental n-gram PatternStrategy."""
+
+import random
+
+from agents.player_handlers import handle_game_over
+from agents.player_ngram import NGramPredictor
+from agents.player_opponent_history import OpponentHistoryCache
+from agents.player_strategies import PatternStrategy, RandomStrategy, create_strategy
+from SHARED.constants import ParityChoice, StrategyType
+from SHARED.contracts import build_game_over
+from SHARED.league_sdk.repositories import OpponentChoicesRepository
+
+EVEN, ODD = ParityChoice.EVEN, ParityChoice.ODD
+
+
+class _Logger:
+    def log_message(self, event, data=None):
+        pass
+
+
+def test_predictor_learns_alternation():
+    predictor = NGramPredictor(order=2)
+    predictor.observe_all([EVEN, ODD] * 5)
+    assert predictor.predict(0.9) == EVEN
+
+
+def test_predictor_backs_off_to_shorter_context():
+    predictor = NGramPredictor(order=3)
+    predictor.observe_all([EVEN, EVEN, ODD, ODD, EVEN, ODD])
+    # Context (even, odd) was followed once by odd; longest context is unseen
+    assert predictor.predict(0.5) == ODD
+
+
+def test_predictor_respects_confidence_threshold():
+    predictor = NGramPredictor(order=1)
+    predictor.observe_all([ODD, EVEN, ODD, ODD, EVEN, ODD])
+    assert predictor.predict(0.99) is None
+
+
+def test_count_tables_do_not_grow_with_history():
+    predictor = NGramPredictor(order=3)
+    predictor.observe_all(random.Random(1).choice([EVEN, ODD]) for _ in range(5000))
+    assert len(predictor._counts) <= 2 + 4 + 8
+
+
+def test_strategy_counters_observed_opponent():
+    strategy = PatternStrategy(pattern_length=2, min_confidence=0.6)
+    for choice in [EVEN, ODD] * 4:
+        strategy.observe("P02", choice)
+    # Opponent will play even next, so play odd
+    assert strategy.choose_parity([], random.Random(0), opponent_id="P02") == ODD
+
+
+def test_strategy_without_observe_stream_uses_history():
+    strategy = PatternStrategy()
+    assert strategy.choose_parity([ODD, ODD, ODD, ODD, ODD]) == EVEN
+
+
+def test_create_strategy_applies_pattern_settings():
+    strategy = create_strategy(StrategyType.PATTERN, {"pattern_length": 5, "min_confidence": 0.8})
+    assert strategy.pattern_length == 5 and strategy.min_confidence == 0.8
+    assert isinstance(create_strategy("unknown"), RandomStrategy)
+
+
+def test_game_over_feeds_strategy_observe(tmp_path):
+    cache = OpponentHistoryCache("P01", repository=OpponentChoicesRepository("P01", tmp_path))
+    strategy = PatternStrategy(pattern_length=1, min_confidence=0.5)
+    for i, choice in enumerate([ODD, ODD, ODD]):
+        msg = build_game_over("league", 1, f"R{i}M1", "REF01", "WIN", "P01", 4, "even",
+                              {"P01": EVEN, "P02": choice}, "normal")["params"]
+        handle_game_over(msg, _Logger(), cache, strategy)
+    assert strategy.choose_parity(cache.get("P02"), opponent_id="P02") == EVEN
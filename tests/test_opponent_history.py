@@ -0,0 +1,96 @@
+"""Tests for the resident per-opponent history cache in player agents."""
+
+import asyncio
+import threading
+
+from agents.player_handlers import handle_game_over, handle_parity_call
+from agents.player_opponent_history import OpponentHistoryCache
+from SHARED.constants import Field, ParityChoice
+from SHARED.contracts import build_choose_parity_call, build_game_over
+from SHARED.league_sdk.repositories import OpponentChoicesRepository
+
+
+class _Logger:
+    def log_message(self, event, data=None):
+        pass
+
+
+class _RecordingStrategy:
+    def __init__(self):
+        self.seen = None
+
+    def choose_parity(self, opponent_history, rng=None, opponent_id=None):
+        self.seen = opponent_history
+        return ParityChoice.EVEN
+
+
+def _game_over(match_id, p01_choice, p02_choice):
+    return build_game_over(
+        "league", 1, match_id, "REF01", "WIN", "P01", 4, "even",
+        {"P01": p01_choice, "P02": p02_choice}, "normal",
+    )["params"]
+
+
+def _cache(tmp_path, **kwargs):
+    return OpponentHistoryCache("P01", repository=OpponentChoicesRepository("P01", tmp_path), **kwargs)
+
+
+def test_game_over_records_only_opponent_choices(tmp_path):
+    cache = _cache(tmp_path)
+    cache.record_game_over(_game_over("R1M1", ParityChoice.EVEN, ParityChoice.ODD))
+    assert cache.get("P02") == [ParityChoice.ODD]
+    assert cache.get("P01") == []
+
+
+def test_history_is_bounded_per_opponent(tmp_path):
+    cache = _cache(tmp_path, max_choices_per_opponent=3, persist_every=0)
+    for choice in [ParityChoice.EVEN, ParityChoice.ODD, ParityChoice.ODD, ParityChoice.EVEN]:
+        cache.record("P02", choice)
+    assert cache.get("P02") == [ParityChoice.ODD, ParityChoice.ODD, ParityChoice.EVEN]
+
+
+def test_no_response_is_ignored(tmp_path):
+    cache = _cache(tmp_path)
+    cache.record_game_over(_game_over("R1M1", ParityChoice.EVEN, "NO_RESPONSE"))
+    assert cache.get("P02") == []
+
+
+def test_periodic_persist_and_reload(tmp_path):
+    cache = _cache(tmp_path, persist_every=2)
+    cache.record_game_over(_game_over("R1M1", ParityChoice.EVEN, ParityChoice.ODD))
+    assert not (tmp_path / "P01" / "opponent_choices.json").exists()
+    cache.record_game_over(_game_over("R2M1", ParityChoice.EVEN, ParityChoice.EVEN))
+    cache.flush()  # The periodic write runs on the background writer thread
+    reloaded = _cache(tmp_path)
+    reloaded.load()
+    assert reloaded.get("P02") == [ParityChoice.ODD, ParityChoice.EVEN]
+
+
+def test_parity_call_uses_cached_opponent_history(tmp_path):
+    cache = _cache(tmp_path)
+    handle_game_over(_game_over("R1M1", ParityChoice.EVEN, ParityChoice.ODD), _Logger(), cache)
+    call = build_choose_parity_call("league", 2, "R2M1", "REF01", "P01", "P02", {})["params"]
+    strategy = _RecordingStrategy()
+    response = asyncio.run(handle_parity_call("P01", call, strategy, _Logger(), opponent_history=cache))
+    assert strategy.seen == [ParityChoice.ODD]
+    assert response["params"][Field.PARITY_CHOICE] == ParityChoice.EVEN
+
+
+def test_periodic_persist_runs_off_the_calling_thread(tmp_path):
+    class _Repository:
+        def load(self):
+            return {}
+
+        def save(self, choices):
+            self.thread, self.saved = threading.current_thread().name, choices
+
+    repository = _Repository()
+    cache = OpponentHistoryCache("P01", persist_every=1, repository=repository)
+    cache.record_game_over(_game_over("R1M1", ParityChoice.EVEN, ParityChoice.ODD))
+    cache.record("P02", ParityChoice.EVEN)  # Recorded after the snapshot was taken
+    cache.flush()
+    assert repository.thread.startswith("opponent-history-writer")
+    assert repository.saved == {"P02": [ParityChoice.ODD]}
+    cache.persist()  # Shutdown: the rest is written synchronously
+    assert repository.thread == threading.current_thread().name
+    assert repository.saved == {"P02": [ParityChoice.ODD, ParityChoice.EVEN]}
@@ -0,0 +1,89 @@
+"""Tests for the parity-call decision deadline, as seen by player and referee."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from agents import referee_choices
+from agents.player_decision_cache import DecisionCache
+from agents.player_handlers import handle_invitation, handle_parity_call
+from agents.player_opponent_history import OpponentHistoryCache
+from agents.player_strategies import RandomStrategy
+from agents.player_strategy_runner import StrategyRunner
+from agents.referee_match_state import MatchContext
+from SHARED.constants import DECISION_DEADLINE_ERROR, Field, ParityChoice, Winner
+from SHARED.contracts import build_choose_parity_call
+
+
+class _Logger:
+    def __init__(self):
+        self.errors = []
+
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        self.errors.append(event)
+
+
+class _SlowStrategy:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def choose_parity(self, opponent_history, rng=None, opponent_id=None):
+        time.sleep(self.delay)
+        return ParityChoice.ODD
+
+
+class _SlowAsyncStrategy(_SlowStrategy):
+    async def choose_parity(self, opponent_history, rng=None, opponent_id=None):
+        await asyncio.sleep(self.delay)
+        return ParityChoice.ODD
+
+
+def _call():
+    return build_choose_parity_call("league", 1, "R1M1", "REF01", "P01", "P02", {})["params"]
+
+
+def test_parity_call_past_deadline_returns_jsonrpc_error():
+    logger = _Logger()
+    response = asyncio.run(
+        handle_parity_call("P01", _call(), _SlowStrategy(0.3), logger,
+                           runner=StrategyRunner(deadline_s=0.05), request_id=7)
+    )
+    assert response["id"] == 7 and response["error"]["code"] == DECISION_DEADLINE_ERROR
+    assert response["error"]["data"] == {Field.MATCH_ID: "R1M1", Field.PLAYER_ID: "P01"}
+    assert "result" not in response and "params" not in response and logger.errors
+
+
+def test_referee_scores_deadline_error_as_timeout(monkeypatch):
+    strategies = {"P01": _SlowStrategy(0.3), "P02": RandomStrategy()}
+
+    async def player_answers(endpoint, request):
+        return await handle_parity_call(
+            endpoint, request["params"], strategies[endpoint], _Logger(), runner=StrategyRunner(deadline_s=0.05)
+        ), 1.0
+
+    monkeypatch.setattr(referee_choices, "timed_send", player_answers)
+    referee = SimpleNamespace(referee_id="REF01", logger=_Logger())
+    context = MatchContext("R1M1", "P01", "P02")
+    outcome = asyncio.run(
+        referee_choices.collect_choices(referee, context, "league", 1, "R1M1", "P01", "P02", "P01", "P02")
+    )
+    assert outcome == (False, Winner.PLAYER_B)
+    assert context.player_a_choice is None and context.player_b_choice is not None
+
+
+def test_speculation_does_not_let_a_slow_strategy_beat_the_deadline():
+    strategy = _SlowAsyncStrategy(0.2)  # Twice the deadline
+    history = OpponentHistoryCache("P01", persist_every=0, repository=SimpleNamespace(load=dict))
+    decisions = DecisionCache(strategy, StrategyRunner(deadline_s=0.1), history)
+
+    async def scenario():
+        handle_invitation("P01", {Field.MATCH_ID: "R1M1", Field.OPPONENT_ID: "P02"}, _Logger(), "conv", decisions)
+        await asyncio.sleep(0.15)  # Referee collects join acks; the call's own deadline would end at 0.25 s
+        call = {Field.MATCH_ID: "R1M1", Field.CONTEXT: {Field.OPPONENT_ID: "P02"}}
+        return await handle_parity_call("P01", call, strategy, _Logger(), decisions=decisions)
+
+    response = asyncio.run(scenario())
+    assert response["error"]["code"] == DECISION_DEADLINE_ERROR
@@ -0,0 +1,72 @@
+"""Tests for the multi-tenant player host."""
+
+from fastapi.testclient import TestClient
+
+from agents import generic_player
+from agents.player_pool import PlayerPool, pooled_endpoint
+from SHARED.constants import Field, ParityChoice, Status
+from SHARED.contracts import build_choose_parity_call, build_game_invitation
+
+
+class _Logger:
+    def __init__(self, agent_id):
+        self.agent_id = agent_id
+
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        pass
+
+
+def _pool(monkeypatch, stopped=None):
+    monkeypatch.setattr(generic_player, "LeagueLogger", _Logger)
+    pool = PlayerPool(8100, [("PT01", "random", 1), ("PT02", "frequency", 2)])
+    if stopped is not None:
+        pool.on_shutdown = lambda: stopped.append(True)
+    return pool
+
+
+def test_players_keep_their_own_state_and_endpoint(monkeypatch):
+    pool = _pool(monkeypatch)
+    first, second = pool.players["PT01"], pool.players["PT02"]
+    assert first.endpoint == pooled_endpoint(8100, "PT01") == "http://localhost:8100/mcp/PT01"
+    assert first.strategy is not second.strategy
+    assert first.opponent_history is not second.opponent_history
+    assert first.logger.agent_id == "PT01" and second.logger.agent_id == "PT02"
+    assert first.app is None and second.app is None  # Only the pool's app is served
+
+
+def test_routes_by_path(monkeypatch):
+    client = TestClient(_pool(monkeypatch).app)
+    call = build_choose_parity_call("league", 1, "R1M1", "REF01", "PT02", "PT01", {})
+    response = client.post("/mcp/PT02", json=call)
+    assert response.status_code == 200
+    assert response.json()["params"][Field.PLAYER_ID] == "PT02"
+    assert response.json()["params"][Field.PARITY_CHOICE] in (ParityChoice.EVEN, ParityChoice.ODD)
+
+
+def test_routes_bare_path_by_recipient_or_player_id(monkeypatch):
+    client = TestClient(_pool(monkeypatch).app)
+    invitation = build_game_invitation("league", 1, "R1M1", "REF01", "PT02", "PT01", "PLAYER_A")
+    assert invitation["params"][Field.RECIPIENT] == "PT02"
+    response = client.post("/mcp", json=invitation)
+    assert response.json()["params"][Field.PLAYER_ID] == "PT02"
+    call = build_choose_parity_call("league", 1, "R1M1", "REF01", "PT01", "PT02", {})
+    response = client.post("/mcp", json=call)
+    assert response.json()["params"][Field.PLAYER_ID] == "PT01"
+
+
+def test_unknown_player_is_404(monkeypatch):
+    response = TestClient(_pool(monkeypatch).app).post("/mcp/P99", json={})
+    assert response.status_code == 404
+    assert response.json()[Field.STATUS] == Status.ERROR
+
+
+def test_pool_exits_after_last_player_stops(monkeypatch):
+    stopped = []
+    pool = _pool(monkeypatch, stopped)
+    pool.players["PT01"].on_shutdown()
+    assert not stopped
+    pool.players["PT02"].on_shutdown()
+    assert stopped == [True]
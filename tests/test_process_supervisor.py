@@ -0,0 +1,90 @@
+"""Tests for the cross-platform agent process supervisor."""
+
+import asyncio
+import sys
+import time
+
+from agents.league_manager.process_supervisor import ProcessSupervisor
+from SHARED.constants import LogEvent
+
+
+class _Logger:
+    def __init__(self):
+        self.events = []
+
+    def log_message(self, event, data=None):
+        self.events.append(event)
+
+    def log_error(self, event, message, data=None):
+        self.events.append(event)
+
+
+def _script(tmp_path, name, body):
+    path = tmp_path / name
+    path.write_text(body)
+    return str(path)
+
+
+def _supervisor(tmp_path, logger, **kwargs):
+    return ProcessSupervisor(logger, log_dir=tmp_path / "logs", restart_delay_s=0, **kwargs)
+
+
+def test_agents_start_in_parallel_with_current_interpreter(tmp_path):
+    logger = _Logger()
+    script = _script(tmp_path, "slow.py", "import sys, time; time.sleep(0.5); print(sys.executable)")
+    supervisor = _supervisor(tmp_path, logger)
+
+    async def scenario():
+        started = time.monotonic()
+        await supervisor.start_all([("A1", script), ("A2", script), ("A3", script)])
+        codes = await supervisor.wait()
+        return codes, time.monotonic() - started
+
+    codes, elapsed = asyncio.run(scenario())
+    assert codes == {"A1": 0, "A2": 0, "A3": 0}
+    assert elapsed < 1.4  # Not three sleeps in sequence
+    assert (tmp_path / "logs" / "A1.out.log").read_text().strip() == sys.executable
+    assert logger.events.count(LogEvent.AGENT_EXITED) == 3
+
+
+def test_crashed_agent_is_restarted_up_to_the_limit(tmp_path):
+    logger = _Logger()
+    script = _script(tmp_path, "crash.py", "import sys; print('boom'); sys.exit(3)")
+    supervisor = _supervisor(tmp_path, logger, max_restarts=2)
+
+    async def scenario():
+        await supervisor.start("A1", script, restart=True)
+        return await supervisor.wait()
+
+    assert asyncio.run(scenario()) == {"A1": 3}
+    agent = supervisor.agents["A1"]
+    assert agent.restarts == 2 and agent.exit_codes == [3, 3, 3]
+    assert logger.events.count(LogEvent.AGENT_CRASHED) == 3
+    assert (tmp_path / "logs" / "A1.out.log").read_text().count("boom") == 3
+
+
+def test_crash_without_restart_is_reported_once(tmp_path):
+    logger = _Logger()
+    script = _script(tmp_path, "crash.py", "raise SystemExit(1)")
+    supervisor = _supervisor(tmp_path, logger)
+
+    async def scenario():
+        await supervisor.start("A1", script)
+        return await supervisor.wait()
+
+    assert asyncio.run(scenario()) == {"A1": 1}
+    assert LogEvent.AGENT_RESTARTED not in logger.events
+
+
+def test_stop_terminates_running_agents(tmp_path):
+    script = _script(tmp_path, "forever.py", "import time\nwhile True: time.sleep(0.1)")
+    supervisor = _supervisor(tmp_path, _Logger())
+
+    async def scenario():
+        await supervisor.start("A1", script, restart=True)
+        await asyncio.sleep(0.2)
+        await supervisor.stop(timeout=2)
+        return await asyncio.wait_for(supervisor.wait(), 5)
+
+    codes = asyncio.run(scenario())
+    assert codes["A1"] != 0 and supervisor.agents["A1"].restarts == 0
@@ -0,0 +1,93 @@
+"""Tests for the on-demand CPU and memory profiling endpoints."""
+
+import pstats
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from SHARED.constants import ADMIN_MEMORY_PATH, ADMIN_PROFILE_PATH, ADMIN_TOKEN_ENV
+from SHARED.league_sdk import profile_output
+from SHARED.league_sdk.admin_routes import add_admin_routes
+
+LOCAL = ("127.0.0.1", 50000)
+_retained = []
+
+
+def _hot_function():
+    return sum(i * i for i in range(20000))
+
+
+def _spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        _hot_function()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_output, "profiling_settings", lambda: {"output_dir": str(tmp_path)})
+    app = FastAPI()
+    add_admin_routes(app)
+
+    @app.post("/work")
+    async def work():
+        _spin(0.05)
+        return {}
+
+    with TestClient(app, client=LOCAL) as local:
+        yield local
+
+
+def test_sampling_session_writes_folded_stacks(client):
+    assert client.post(ADMIN_PROFILE_PATH + "/start", json={"mode": "sampling", "interval_ms": 2}).json()["running"]
+    assert client.post(ADMIN_PROFILE_PATH + "/start").status_code == 409
+    client.post("/work")
+    result = client.post(ADMIN_PROFILE_PATH + "/stop").json()
+    assert result["mode"] == "sampling" and result["samples"] > 5
+    lines = open(result["file"]).read().splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_hot_function" in line for line in lines)
+    assert client.post(ADMIN_PROFILE_PATH + "/stop").status_code == 409
+
+
+def test_cprofile_session_dumps_pstats(client):
+    assert client.post(ADMIN_PROFILE_PATH + "/start", json={"mode": "cprofile"}).status_code == 200
+    assert client.get(ADMIN_PROFILE_PATH).json()["mode"] == "cprofile"
+    client.post("/work")
+    result = client.post(ADMIN_PROFILE_PATH + "/stop", json={"top": 50}).json()
+    assert any("_hot_function" in row["function"] for row in result["top"])
+    stats = pstats.Stats(result["file"])
+    assert any(func == "_hot_function" for _, _, func in stats.stats)
+
+
+def test_memory_snapshots_show_growth(client):
+    assert client.post(ADMIN_MEMORY_PATH + "/start", json={"frames": 5}).json()["tracing"]
+    try:
+        first = client.post(ADMIN_MEMORY_PATH + "/snapshot").json()
+        assert first["compared_to"] is None
+        _retained.append([bytes(1000) for _ in range(2000)])  # ~2 MB that stays alive
+        second = client.post(ADMIN_MEMORY_PATH + "/snapshot").json()
+        assert second["compared_to"] == first["snapshot"]
+        growth = second["top"][0]
+        assert "test_profiling.py" in growth["location"]
+        assert growth["size_diff_bytes"] > 1_900_000
+        missing = client.post(ADMIN_MEMORY_PATH + "/snapshot", json={"compare_to": "nope"})
+        assert missing.status_code == 409
+    finally:
+        assert client.post(ADMIN_MEMORY_PATH + "/stop").json()["tracing"] is False
+        _retained.clear()
+
+
+def test_profiling_is_local_only_or_authenticated(monkeypatch):
+    app = FastAPI()
+    add_admin_routes(app)
+    remote = TestClient(app, client=("10.1.2.3", 50000))
+    assert remote.get(ADMIN_PROFILE_PATH).status_code == 403
+    monkeypatch.setenv(ADMIN_TOKEN_ENV, "s3cret")
+    assert remote.get(ADMIN_PROFILE_PATH, headers={"Authorization": "Bearer wrong"}).status_code == 403
+    assert remote.get(ADMIN_PROFILE_PATH, headers={"Authorization": "Bearer s3cret"}).json()["running"] is False
+    assert remote.get("/admin/logging").status_code == 200  # Reading the log policy stays open
+    bad = TestClient(app, client=LOCAL).post(ADMIN_PROFILE_PATH + "/start", json={"colour": "red"})
+    assert bad.status_code == 400
@@ -0,0 +1,81 @@
+"""Tests for agent readiness probes (/health) replacing fixed startup sleeps."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agents import generic_player
+from agents.generic_player import GenericPlayer
+from SHARED.constants import Field, Status
+from SHARED.league_sdk import agent_comm
+from SHARED.league_sdk.inprocess_transport import InProcessTransport
+from SHARED.league_sdk.readiness import health_url, wait_for_all, wait_until_ready
+
+
+class _Logger:
+    def __init__(self, agent_id):
+        pass
+
+    def log_message(self, event, data=None):
+        pass
+
+
+class _FlakyTransport(InProcessTransport):
+    """Reports an endpoint ready after a number of failed probes."""
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures, self.probes = failures, 0
+
+    async def probe(self, endpoint):
+        self.probes += 1
+        return self.probes > self.failures
+
+
+@pytest.fixture
+def transport():
+    yield
+    agent_comm.reset_transport()
+
+
+def test_health_url_drops_mcp_path():
+    assert health_url("http://localhost:8101/mcp") == "http://localhost:8101/health"
+    assert health_url("http://localhost:8100/mcp/P07") == "http://localhost:8100/health"
+
+
+def test_agent_serves_health(monkeypatch):
+    monkeypatch.setattr(generic_player, "LeagueLogger", _Logger)
+    response = TestClient(GenericPlayer("PT01", "random", 8101).app).get("/health")
+    assert response.status_code == 200
+    assert response.json() == {Field.STATUS: Status.OK, "agent_id": "PT01"}
+
+
+def test_wait_returns_as_soon_as_peer_is_ready(transport):
+    agent_comm.set_transport(_FlakyTransport(failures=3))
+    started = time.monotonic()
+    assert asyncio.run(wait_until_ready("http://localhost:8000/mcp", timeout=5))
+    assert time.monotonic() - started < 0.5  # 20 + 40 + 80 ms of backoff
+
+
+def test_wait_gives_up_after_timeout(transport):
+    agent_comm.set_transport(_FlakyTransport(failures=10**6))
+    assert not asyncio.run(wait_until_ready("http://localhost:8000/mcp", timeout=0.1))
+
+
+def test_wait_for_all_reports_each_endpoint(transport):
+    inproc = InProcessTransport()
+    agent_comm.set_transport(inproc)
+
+    async def handler(message):
+        return {}
+
+    inproc.register_endpoint("inproc://A/mcp", handler)
+    ready = asyncio.run(wait_for_all(["inproc://A/mcp", "inproc://B/mcp"], timeout=0.05))
+    assert ready == {"inproc://A/mcp": True, "inproc://B/mcp": False}
+
+
+def test_http_probe_fails_fast_without_server():
+    agent_comm.reset_transport()
+    assert not asyncio.run(wait_until_ready("http://127.0.0.1:9/mcp", timeout=0.1))
@@ -0,0 +1,105 @@
+"""Tests for the multi-tenant referee host and the pooled HTTP transport."""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from agents import generic_referee
+from agents.referee_pool import RefereePool, pooled_referee_endpoint
+from SHARED.constants import Field, MessageType, Status
+from SHARED.league_sdk.transport import HTTPTransport
+
+
+class _Logger:
+    def __init__(self, agent_id):
+        self.agent_id = agent_id
+
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        pass
+
+
+def _pool(monkeypatch):
+    monkeypatch.setattr(generic_referee, "LeagueLogger", _Logger)
+    pool = RefereePool(8010, ["REF01", "REF02"])
+    for referee in pool.referees.values():
+        referee.run_match = _no_match
+    return pool
+
+
+async def _no_match(*args):
+    pass
+
+
+def _announcement(referee_endpoint):
+    match = {
+        Field.MATCH_ID: "R1M1", "player_A_id": "P01", "player_B_id": "P02",
+        "referee_endpoint": referee_endpoint,
+        Field.PLAYER_A_ENDPOINT: "http://localhost:8101/mcp",
+        Field.PLAYER_B_ENDPOINT: "http://localhost:8102/mcp",
+    }
+    return {
+        Field.MESSAGE_TYPE: MessageType.ROUND_ANNOUNCEMENT, Field.LEAGUE_ID: "league",
+        Field.ROUND_ID: 1, Field.MATCHES: [match],
+    }
+
+
+def test_referees_are_isolated_with_own_endpoints(monkeypatch):
+    pool = _pool(monkeypatch)
+    ref1, ref2 = pool.referees["REF01"], pool.referees["REF02"]
+    assert ref1.endpoint == pooled_referee_endpoint(8010, "REF01") == "http://localhost:8010/mcp/REF01"
+    assert ref1.active_matches is not ref2.active_matches
+    assert ref1.player_endpoints is not ref2.player_endpoints
+
+
+def test_announcement_starts_matches_only_on_addressed_referee(monkeypatch):
+    pool = _pool(monkeypatch)
+    client = TestClient(pool.app)
+    body = _announcement(pool.referees["REF02"].endpoint)
+    assert client.post("/mcp/REF02", json=body).json()["matches_started"] == 1
+    assert client.post("/mcp/REF01", json=body).json()["matches_started"] == 0
+    assert pool.referees["REF02"].player_endpoints.get_player("P01") == "http://localhost:8101/mcp"
+    assert pool.referees["REF01"].player_endpoints.get_player("P01") is None
+
+
+def test_bare_path_routes_by_recipient_and_unknown_is_404(monkeypatch):
+    client = TestClient(_pool(monkeypatch).app)
+    body = _announcement("elsewhere")
+    body[Field.RECIPIENT] = "REF01"
+    assert client.post("/mcp", json=body).json()[Field.STATUS] == Status.ACKNOWLEDGED
+    assert client.post("/mcp/REF99", json=body).status_code == 404
+
+
+def test_pool_exits_after_last_referee_stops(monkeypatch):
+    pool, stopped = _pool(monkeypatch), []
+    pool.on_shutdown = lambda: stopped.append(True)
+
+    async def scenario():
+        pool.referees["REF01"].on_shutdown()
+        pool.referees["REF02"].on_shutdown()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert stopped == [True]
+
+
+def test_http_transport_reuses_one_client_per_loop():
+    transport = HTTPTransport(timeout=1, max_connections=4)
+
+    async def clients():
+        first, second = transport._get_client(), transport._get_client()
+        await transport.aclose()
+        return first, second
+
+    first, second = asyncio.run(clients())
+    assert first is second and first.is_closed
+
+    async def client_in_new_loop():
+        client = transport._get_client()
+        await transport.aclose()
+        return client
+
+    assert asyncio.run(client_in_new_loop()) is not first
@@ -0,0 +1,134 @@
+"""Tests for batched match result delivery (referee batcher + LM batch handler)."""
+
+import asyncio
+
+from agents import referee_result_batcher
+from agents.league_manager.handlers import handle_match_result_batch
+from agents.referee_result_batcher import ResultBatcher
+from SHARED.constants import Field, MessageType
+from SHARED.contracts import (
+    build_match_result_batch,
+    build_match_result_batch_ack,
+    build_match_result_report,
+)
+from SHARED.contracts.schema_validator import validate_message
+from SHARED.league_sdk.config_loader import load_league_config
+from SHARED.league_sdk.repositories import PlayerHistoryRepository, StandingsRepository
+
+
+class _Logger:
+    def __init__(self):
+        self.events = []
+
+    def log_message(self, event, data=None):
+        self.events.append(event)
+
+    def log_error(self, event, message, data=None):
+        self.events.append(event)
+
+
+def _report(match_id, winner="P01", league_id="league_2025_even_odd"):
+    return build_match_result_report(
+        league_id, 1, match_id, "REF01", winner, {"P01": 1, "P02": 0}, 4, {}
+    )["params"]
+
+
+def _capture_sends(monkeypatch):
+    sent = []
+
+    async def fake_send(endpoint, msg, **kwargs):
+        sent.append(msg["params"])
+        return {}
+
+    monkeypatch.setattr(referee_result_batcher, "send_with_retry", fake_send)
+    return sent
+
+
+class TestBatchContracts:
+    def test_batch_message_validates(self):
+        msg = build_match_result_batch("REF01", "league_2025_even_odd", [_report("R1M1")])
+        assert msg["method"] == "match_result_batch"
+        assert msg["params"][Field.MESSAGE_TYPE] == MessageType.MATCH_RESULT_BATCH
+        assert validate_message(msg["params"]) == []
+
+    def test_batch_ack_validates(self):
+        msg = build_match_result_batch_ack(["R1M1", "R1M2"], request_id=3)
+        assert msg["id"] == 3
+        assert msg["result"][Field.MATCH_IDS] == ["R1M1", "R1M2"]
+        assert validate_message(msg["result"]) == []
+
+
+class TestResultBatcher:
+    def test_flushes_when_batch_full(self, monkeypatch):
+        sent = _capture_sends(monkeypatch)
+        batcher = ResultBatcher("REF01", "http://lm", _Logger(), max_batch_size=2, linger_ms=10_000)
+
+        async def scenario():
+            await batcher.add(_report("R1M1"))
+            assert sent == []
+            await batcher.add(_report("R1M2"))
+
+        asyncio.run(scenario())
+        assert len(sent) == 1
+        assert [r[Field.MATCH_ID] for r in sent[0][Field.REPORTS]] == ["R1M1", "R1M2"]
+        assert batcher.pending_count == 0
+
+    def test_flushes_after_linger(self, monkeypatch):
+        sent = _capture_sends(monkeypatch)
+        batcher = ResultBatcher("REF01", "http://lm", _Logger(), max_batch_size=10, linger_ms=5)
+
+        async def scenario():
+            await batcher.add(_report("R1M1"))
+            await asyncio.sleep(0.05)
+
+        asyncio.run(scenario())
+        assert len(sent) == 1
+
+    def test_explicit_flush_sends_remaining_and_is_idempotent(self, monkeypatch):
+        sent = _capture_sends(monkeypatch)
+        batcher = ResultBatcher("REF01", "http://lm", _Logger(), max_batch_size=10, linger_ms=10_000)
+
+        async def scenario():
+            await batcher.add(_report("R1M1"))
+            await batcher.flush()
+            await batcher.flush()
+
+        asyncio.run(scenario())
+        assert len(sent) == 1
+
+    def test_undelivered_batch_is_logged_as_error(self, monkeypatch):
+        async def unanswered(endpoint, msg, **kwargs):
+            return None  # Retries exhausted
+
+        monkeypatch.setattr(referee_result_batcher, "send_with_retry", unanswered)
+        logger = _Logger()
+        batcher = ResultBatcher("REF01", "http://lm", logger, max_batch_size=1)
+        asyncio.run(batcher.add(_report("R1M1")))
+        assert logger.events == ["SENDING_MATCH_RESULT_BATCH", "MATCH_RESULT_BATCH_ERROR"]
+
+
+class TestBatchHandler:
+    def test_batch_applied_in_one_standings_update(self, monkeypatch, tmp_path):
+        league_config = load_league_config("league_2025_even_odd")
+        monkeypatch.chdir(tmp_path)
+        repo = StandingsRepository(league_config.league_id)
+        standings = repo.load()
+        standings["standings"] = [
+            {Field.PLAYER_ID: pid, "wins": 0, "losses": 0, "draws": 0,
+             "points": 0, "games_played": 0, "rank": 0}
+            for pid in ("P01", "P02")
+        ]
+        repo.save(standings)
+        message = build_match_result_batch(
+            "REF01", league_config.league_id, [_report("R1M1"), _report("R1M2", winner=None)]
+        )["params"]
+
+        async def scenario():
+            return handle_match_result_batch(message, league_config, _Logger(), request_id=9)
+
+        response = asyncio.run(scenario())
+        assert response["result"][Field.MATCH_IDS] == ["R1M1", "R1M2"]
+        rows = {p[Field.PLAYER_ID]: p for p in repo.load()["standings"]}
+        assert rows["P01"]["wins"] == 1 and rows["P01"]["draws"] == 1
+        assert rows["P02"]["losses"] == 1 and rows["P02"]["games_played"] == 2
+        assert len(PlayerHistoryRepository("P01").load_history()[Field.MATCHES]) == 2
@@ -0,0 +1,79 @@
+"""Tests for targeted (per-recipient) round announcements."""
+
+import asyncio
+
+from agents.league_manager import announcements
+from agents.league_manager.announcements import send_round_announcements, split_assignments
+from agents.league_manager.assignments import build_match_assignments
+from agents.league_manager.scheduler import get_match_schedule
+from SHARED.constants import Field
+from SHARED.contracts.schema_validator import validate_message
+
+PLAYERS = {f"P0{i}": {Field.ENDPOINT: f"http://localhost:810{i}/mcp"} for i in range(1, 6)}
+REFEREES = {
+    "REF01": {Field.ENDPOINT: "http://localhost:8001/mcp"},
+    "REF02": {Field.ENDPOINT: "http://localhost:8002/mcp"},
+}
+
+
+class _Logger:
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        pass
+
+
+def _round_one():
+    schedule = get_match_schedule(sorted(PLAYERS), sorted(REFEREES))
+    return build_match_assignments(schedule[0], PLAYERS, REFEREES)
+
+
+def test_each_referee_gets_only_its_matches():
+    assignments = _round_one()
+    split = split_assignments(assignments, PLAYERS, REFEREES)
+    for info in REFEREES.values():
+        assert all(m[Field.REFEREE_ENDPOINT] == info[Field.ENDPOINT] for m in split[info[Field.ENDPOINT]])
+    referee_total = sum(len(split[info[Field.ENDPOINT]]) for info in REFEREES.values())
+    assert referee_total == len(assignments)
+
+
+def test_each_player_gets_only_its_fixtures():
+    split = split_assignments(_round_one(), PLAYERS, REFEREES)
+    for pid, info in PLAYERS.items():
+        for match in split[info[Field.ENDPOINT]]:
+            assert pid in (match[Field.PLAYER_A_ID], match[Field.PLAYER_B_ID])
+
+
+def test_idle_agents_still_receive_round_header():
+    split = split_assignments(_round_one(), PLAYERS, REFEREES)
+    assert set(split) == {info[Field.ENDPOINT] for info in {**PLAYERS, **REFEREES}.values()}
+    assert [] in split.values()  # 5 players, 2 matches: someone sits out
+
+
+def test_send_round_announcements_targets_recipients(monkeypatch):
+    sent = {}
+
+    async def fake_send(endpoint, message):
+        sent[endpoint] = message["params"]
+
+    monkeypatch.setattr(announcements, "send", fake_send)
+    assignments = _round_one()
+    asyncio.run(send_round_announcements("league", 1, assignments, PLAYERS, REFEREES, _Logger()))
+    assert len(sent) == len(PLAYERS) + len(REFEREES)
+    for params in sent.values():
+        assert params[Field.TOTAL_MATCHES] == len(assignments)
+        assert validate_message(params) == []
+
+
+def test_failed_send_does_not_block_others(monkeypatch):
+    sent = []
+
+    async def flaky_send(endpoint, message):
+        if endpoint.endswith("8101/mcp"):
+            raise ConnectionError("down")
+        sent.append(endpoint)
+
+    monkeypatch.setattr(announcements, "send", flaky_send)
+    asyncio.run(send_round_announcements("league", 1, _round_one(), PLAYERS, REFEREES, _Logger()))
+    assert len(sent) == len(PLAYERS) + len(REFEREES) - 1
@@ -0,0 +1,91 @@
+"""Tests for deterministic seeding (reproducible league runs)."""
+
+import random
+
+from agents.player_strategies import FrequencyStrategy, PatternStrategy, RandomStrategy
+from agents.referee_game_logic import EvenOddGameRules
+from SHARED.constants import Field
+from SHARED.contracts import build_league_register_response, build_match_result_report
+from SHARED.contracts.schema_validator import validate_message
+from SHARED.league_sdk.seeding import (
+    derive_seed,
+    match_seed,
+    player_seed,
+    resolve_master_seed,
+    spawn_rng,
+)
+
+
+class TestSeedDerivation:
+    """Tests for seed derivation helpers."""
+
+    def test_derive_seed_is_stable(self):
+        assert derive_seed(42, "match", "R1M1") == derive_seed(42, "match", "R1M1")
+
+    def test_derive_seed_known_value(self):
+        """Derived seeds must not change between releases (replayability)."""
+        assert derive_seed(123, "match", "R1M1") == 7591759145857233988
+        assert 0 <= derive_seed(123, "x") < 2**63
+
+    def test_spawn_keys_give_independent_seeds(self):
+        seeds = {match_seed(7, f"R1M{i}") for i in range(100)}
+        assert len(seeds) == 100
+
+    def test_master_seed_changes_children(self):
+        assert match_seed(1, "R1M1") != match_seed(2, "R1M1")
+
+    def test_match_and_player_streams_differ(self):
+        assert match_seed(5, "P01") != player_seed(5, "P01")
+
+    def test_resolve_uses_configured_seed(self):
+        assert resolve_master_seed(99) == 99
+
+    def test_resolve_generates_seed_when_missing(self):
+        seed = resolve_master_seed(None)
+        assert isinstance(seed, int) and seed >= 0
+
+    def test_spawn_rng_reproducible(self):
+        a = [spawn_rng(3, "R2M1").random() for _ in range(3)]
+        b = [spawn_rng(3, "R2M1").random() for _ in range(3)]
+        assert a == b
+
+    def test_spawn_rng_unseeded(self):
+        assert isinstance(spawn_rng(None, "R1M1"), random.Random)
+
+
+class TestSeededGameplay:
+    """Seeded streams make draws and strategy choices replayable."""
+
+    def test_draw_number_replays_with_same_seed(self):
+        rules = EvenOddGameRules()
+        seed = match_seed(2025, "R1M1")
+        first = [rules.draw_number(random.Random(seed)) for _ in range(5)]
+        second = [rules.draw_number(random.Random(seed)) for _ in range(5)]
+        assert first == second
+        assert all(1 <= n <= 10 for n in first)
+
+    def test_strategies_replay_with_same_rng(self):
+        for strategy in (RandomStrategy(), FrequencyStrategy(), PatternStrategy()):
+            first = [strategy.choose_parity([], random.Random(11)) for _ in range(5)]
+            second = [strategy.choose_parity([], random.Random(11)) for _ in range(5)]
+            assert first == second
+
+
+class TestSeedInMessages:
+    """Seeds are carried in registration responses and match reports."""
+
+    def test_register_response_includes_seed(self):
+        msg = build_league_register_response("P01", seed=1234, request_id=1)
+        assert msg["result"][Field.SEED] == 1234
+        assert validate_message(msg["result"]) == []
+
+    def test_register_response_omits_seed_by_default(self):
+        msg = build_league_register_response("P01", request_id=1)
+        assert Field.SEED not in msg["result"]
+
+    def test_match_result_report_records_seed(self):
+        msg = build_match_result_report(
+            "league", 1, "R1M1", "REF01", "P01", {"P01": 1, "P02": 0}, 4, {}, match_seed=77
+        )
+        assert msg["params"][Field.RESULT]["details"][Field.MATCH_SEED] == 77
+        assert validate_message(msg["params"]) == []
@@ -0,0 +1,106 @@
+"""Tests for versioned, delta-encoded LEAGUE_STANDINGS_UPDATE broadcasts."""
+
+import asyncio
+from dataclasses import replace
+
+from agents.league_manager import standings_broadcast
+from agents.league_manager.query_handlers import handle_league_query
+from agents.league_manager.standings_broadcast import send_standings_update, supports_delta
+from agents.league_manager.standings_versions import VersionedStandings, get_versioned_standings
+from agents.player_standings import StandingsView
+from SHARED.constants import Capability, Field, QueryType, StandingsMode
+from SHARED.contracts import build_league_query, build_league_register_request, build_league_standings_update
+from SHARED.contracts.schema_validator import validate_message
+from SHARED.league_sdk.config_loader import load_league_config
+from SHARED.league_sdk.repositories import StandingsRepository
+from SHARED.league_sdk.session_manager import AgentType, get_session_manager
+
+
+def _row(pid, points=0, rank=1):
+    return {Field.PLAYER_ID: pid, "wins": points, "losses": 0, "draws": 0,
+            "points": points, "games_played": points, "rank": rank}
+
+
+class _Logger:
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        pass
+
+
+def test_commit_returns_changed_rows_and_bumps_version():
+    versioned = VersionedStandings()
+    assert len(versioned.commit([_row("P01"), _row("P02", rank=2)])) == 2
+    assert versioned.version == 1
+    changed = versioned.commit([_row("P01"), _row("P02", points=3, rank=1)])
+    assert [r[Field.PLAYER_ID] for r in changed] == ["P02"] and versioned.version == 2
+    assert versioned.commit([_row("P01"), _row("P02", points=3, rank=1)]) == []
+    assert versioned.version == 2
+
+
+def test_delta_message_and_capability_validate():
+    msg = build_league_standings_update(
+        "league", 2, [], update_mode=StandingsMode.DELTA, standings_version=3, base_version=2
+    )
+    assert validate_message(msg["params"]) == []
+    reg = build_league_register_request(
+        "P01", "Player", "1.0.0", "http://localhost:8101/mcp", capabilities=[Capability.STANDINGS_DELTA]
+    )
+    assert reg["params"][Field.PLAYER_META][Field.CAPABILITIES] == [Capability.STANDINGS_DELTA]
+    assert supports_delta({"metadata": {Field.CAPABILITIES: [Capability.STANDINGS_DELTA]}})
+    assert not supports_delta({"endpoint": "x"})
+
+
+def test_player_view_applies_full_then_delta_and_detects_gap():
+    view = StandingsView()
+    assert view.apply({Field.STANDINGS: [_row("P01"), _row("P02", rank=2)], Field.STANDINGS_VERSION: 1})
+    delta = {Field.UPDATE_MODE: StandingsMode.DELTA, Field.STANDINGS: [_row("P02", points=3)],
+             Field.STANDINGS_VERSION: 2, Field.BASE_VERSION: 1}
+    assert view.apply(delta) and view.get("P02")["points"] == 3
+    gap = dict(delta, **{Field.STANDINGS_VERSION: 4, Field.BASE_VERSION: 3})
+    assert not view.apply(gap) and view.stale
+    assert view.apply({Field.STANDINGS: [_row("P01")], Field.STANDINGS_VERSION: 4})
+    assert not view.stale and view.version == 4
+
+
+def test_send_standings_update_routes_delta_and_snapshots(monkeypatch, tmp_path):
+    league_config = replace(load_league_config("league_2025_even_odd"), standings_snapshot_interval=2)
+    monkeypatch.chdir(tmp_path)
+    repo = StandingsRepository(league_config.league_id)
+    standings = repo.load()
+    standings["standings"] = [_row("P01", points=3), _row("P02", rank=2)]
+    repo.save(standings)
+    sent = []
+
+    async def fake_broadcast(message, players, referees, logger):
+        sent.append((message["params"], sorted(players), sorted(referees)))
+
+    monkeypatch.setattr(standings_broadcast, "broadcast_to_agents", fake_broadcast)
+    get_versioned_standings().reset()
+    players = {"P01": {"metadata": {Field.CAPABILITIES: [Capability.STANDINGS_DELTA]}}, "P02": {}}
+    asyncio.run(send_standings_update(1, league_config, players, {"REF01": {}}, _Logger()))
+    (full, full_to, refs), (delta, delta_to, _) = sent
+    assert full[Field.UPDATE_MODE] == StandingsMode.FULL and full_to == ["P02"] and refs == ["REF01"]
+    assert delta[Field.UPDATE_MODE] == StandingsMode.DELTA and delta_to == ["P01"]
+    assert delta[Field.BASE_VERSION] == 0 and delta[Field.STANDINGS_VERSION] == 1
+
+    sent.clear()
+    asyncio.run(send_standings_update(2, league_config, players, {}, _Logger()))
+    assert len(sent) == 1 and sent[0][1] == ["P01", "P02"]  # Snapshot round
+    get_versioned_standings().reset()
+
+
+def test_league_query_returns_versioned_snapshot():
+    session = get_session_manager().create_session("PQ01", AgentType.PLAYER, "http://localhost:9999/mcp")
+    try:
+        get_versioned_standings().commit([_row("PQ01")])
+        query = build_league_query("PQ01", "league", session.auth_token, QueryType.GET_STANDINGS)
+        result = handle_league_query(query["params"], _Logger(), request_id=1)["result"]
+        assert result["success"] and result[Field.DATA][Field.STANDINGS_VERSION] == 1
+        assert validate_message(result) == []
+        bad = build_league_query("PQ01", "league", "wrong", QueryType.GET_STANDINGS)
+        assert not handle_league_query(bad["params"], _Logger(), request_id=2)["result"]["success"]
+    finally:
+        get_session_manager().close_session_by_agent("PQ01")
+        get_versioned_standings().reset()
@@ -4,6 +4,7 @@ Tests match context initialization and player handling.
 """
 
 import sys
+import tempfile
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,6 +16,8 @@ from agents.referee_match_state import (
 )
 from SHARED.league_sdk.logger import LeagueLogger
 
+LOG_DIR = Path(tempfile.mkdtemp(prefix="test_logs_"))  # Keeps the tracked test_logs/ untouched
+
 
 def test_match_context_initialization():
     """Test match context initialization."""
@@ -62,7 +65,7 @@ def test_handle_game_join_ack():
     """Test handle_game_join_ack function."""
     ctx = MatchContext("M1", "P01", "P02")
     msg = {"sender": "P01", "conversation_id": "conv1"}
-    assert handle_game_join_ack(msg, ctx, LeagueLogger("test", Path("test_logs")))
+    assert handle_game_join_ack(msg, ctx, LeagueLogger("test", LOG_DIR))
     assert ctx.player_a_joined
 
 
@@ -71,7 +74,7 @@ def test_handle_parity_choice_valid():
     ctx = MatchContext("M1", "P01", "P02")
     # Use correct field name "parity_choice" per protocol
     msg = {"sender": "P01", "parity_choice": "even"}
-    assert handle_parity_choice(msg, ctx, LeagueLogger("test", Path("test_logs")))
+    assert handle_parity_choice(msg, ctx, LeagueLogger("test", LOG_DIR))
     assert ctx.player_a_choice == "even"
 
 
@@ -80,7 +83,7 @@ def test_handle_parity_choice_invalid():
     ctx = MatchContext("M1", "P01", "P02")
     # Use correct field name "parity_choice" per protocol
     msg = {"sender": "P01", "parity_choice": "BLUE"}
-    assert not handle_parity_choice(msg, ctx, LeagueLogger("test", Path("test_logs")))
+    assert not handle_parity_choice(msg, ctx, LeagueLogger("test", LOG_DIR))
 
 
 if __name__ == "__main__":
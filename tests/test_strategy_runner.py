@@ -0,0 +1,127 @@
+"""Tests for non-blocking strategy execution in player agents."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agents.player_handlers import handle_parity_call
+from agents.player_strategy_runner import StrategyRunner
+from agents.player_strategies import RandomStrategy, TimeoutStrategy
+from SHARED.constants import Field, ParityChoice
+from SHARED.contracts import build_choose_parity_call
+
+
+class _Logger:
+    def __init__(self):
+        self.errors = []
+
+    def log_message(self, event, data=None):
+        pass
+
+    def log_error(self, event, message, data=None):
+        self.errors.append(event)
+
+
+class _SlowSyncStrategy:
+    def __init__(self, delay):
+        self.delay, self.thread = delay, None
+        self.observed = []
+
+    def choose_parity(self, opponent_history, rng=None, opponent_id=None):
+        self.thread = threading.current_thread().name
+        time.sleep(self.delay)
+        return ParityChoice.ODD
+
+    def observe(self, opponent_id, choice):
+        self.observed.append((opponent_id, choice))
+
+
+def _call():
+    return build_choose_parity_call("league", 1, "R1M1", "REF01", "P01", "P02", {})["params"]
+
+
+def test_sync_strategy_runs_off_the_event_loop():
+    strategy = _SlowSyncStrategy(0.2)
+    runner = StrategyRunner(deadline_s=2)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        choice = await runner.choose(strategy, [])
+        task.cancel()
+        return choice, ticks
+
+    choice, ticks = asyncio.run(scenario())
+    assert choice == ParityChoice.ODD
+    assert ticks >= 5  # Loop kept running while the strategy slept
+    assert strategy.thread.startswith("strategy")
+
+
+def test_deadline_raises_timeout():
+    runner = StrategyRunner(deadline_s=0.05)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(runner.choose(_SlowSyncStrategy(0.3), []))
+
+
+def test_async_timeout_strategy_does_not_block():
+    strategy = TimeoutStrategy()
+    strategy._timeout = 0
+    runner = StrategyRunner(deadline_s=0.05)
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(runner.choose(strategy, []))
+    assert time.monotonic() - start < 0.5
+
+
+def test_parity_call_with_runner_returns_choice():
+    response = asyncio.run(
+        handle_parity_call("P01", _call(), RandomStrategy(), _Logger(), runner=StrategyRunner(deadline_s=1))
+    )
+    assert response["params"][Field.PARITY_CHOICE] in (ParityChoice.EVEN, ParityChoice.ODD)
+
+
+def test_observe_is_queued_on_strategy_thread_or_direct():
+    strategy, runner = _SlowSyncStrategy(0), StrategyRunner(deadline_s=1)
+    runner.observe(strategy, "P02", ParityChoice.EVEN)  # No loop: called directly
+    assert strategy.observed == [("P02", ParityChoice.EVEN)]
+
+    async def scenario():
+        runner.observe(strategy, "P03", ParityChoice.ODD)
+        await runner.choose(strategy, [])  # Runs after the queued observe
+
+    asyncio.run(scenario())
+    assert strategy.observed[-1] == ("P03", ParityChoice.ODD)
+
+
+def test_shutdown_drops_calls_not_started():
+    strategy, runner = _SlowSyncStrategy(0), StrategyRunner(deadline_s=1)
+
+    async def scenario():
+        running = runner._submit(time.sleep, 0.1)
+        queued = runner._submit(strategy.observe, "P02", ParityChoice.ODD)
+        runner.shutdown()
+        await running
+        return queued.cancelled()
+
+    assert asyncio.run(scenario())
+    assert strategy.observed == []
+
+
+def test_overdue_call_does_not_hold_up_the_next_one():
+    runner = StrategyRunner(deadline_s=0.1)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await runner.choose(_SlowSyncStrategy(0.5), [])
+        return await runner.choose(_SlowSyncStrategy(0), [])
+
+    assert asyncio.run(scenario()) == ParityChoice.ODD
@@ -0,0 +1,108 @@
+"""Tests for trace context propagation and span export."""
+
+import asyncio
+
+import pytest
+
+from SHARED.constants import Field
+from SHARED.contracts import create_base_message
+from SHARED.contracts.jsonrpc_helpers import wrap_jsonrpc_request
+from SHARED.league_sdk.agent_comm import reset_transport, send, set_transport
+from SHARED.league_sdk.inprocess_transport import InProcessTransport
+from SHARED.league_sdk.log_writer import flush_logs
+from SHARED.league_sdk.trace_context import bind, current_span, message_context, parse_traceparent
+from SHARED.league_sdk.trace_waterfall import find_root, read_spans, waterfall
+from SHARED.league_sdk.tracing import configure_tracing, reset_tracing, server_span, span
+
+
+@pytest.fixture
+def trace_dir(tmp_path):
+    configure_tracing(enabled=True, export_dir=str(tmp_path))
+    yield tmp_path
+    reset_tracing()
+
+
+@pytest.fixture
+def transport():
+    transport = InProcessTransport()
+    set_transport(transport)
+    yield transport
+    reset_transport()
+
+
+def _spans(trace_dir):
+    flush_logs()
+    return {s["name"]: s for s in read_spans(trace_dir)}
+
+
+def test_context_travels_with_the_message(trace_dir, transport):
+    received = []
+
+    async def player(raw):
+        received.append(raw)
+        with server_span("P01", raw):
+            return create_base_message("GAME_JOIN_ACK", "player", "P01")
+
+    transport.register_endpoint("inproc://P01/mcp", player)
+
+    async def referee():
+        with span("match", "REF01", match_id="R1M1"):
+            invitation = create_base_message("GAME_INVITATION", "referee", "REF01", match_id="R1M1")
+            return await send("inproc://P01/mcp", wrap_jsonrpc_request("game_invitation", invitation, 1))
+
+    reply = asyncio.run(referee())
+    spans = _spans(trace_dir)
+    match, sent, handled = spans["match"], spans["send GAME_INVITATION"], spans["handle GAME_INVITATION"]
+    assert sent["parent_id"] == match["span_id"] and handled["parent_id"] == sent["span_id"]
+    assert {match["trace_id"], sent["trace_id"], handled["trace_id"]} == {match["trace_id"]}
+    assert (sent["agent_id"], handled["agent_id"]) == ("REF01", "P01")
+    assert sent["attributes"]["match_id"] == "R1M1" and sent["attributes"]["responded"] is True
+    assert message_context(received[0]).span_id == sent["span_id"]
+    assert parse_traceparent(reply[Field.TRACEPARENT]).span_id == handled["span_id"]
+    rows = waterfall(trace_dir, find_root(trace_dir, "match", match_id="R1M1"))
+    assert [(depth, s["name"]) for depth, s in rows] == [
+        (0, "match"), (1, "send GAME_INVITATION"), (2, "handle GAME_INVITATION"),
+    ]
+
+
+def test_disabled_tracing_leaves_messages_alone(trace_dir, transport):
+    configure_tracing(enabled=False)
+    received = []
+
+    async def handler(raw):
+        received.append(raw)
+        return {"status": "ok"}
+
+    transport.register_endpoint("inproc://P01/mcp", handler)
+    with span("match", "REF01") as tags:
+        assert tags is None and current_span() is None
+        message = create_base_message("GAME_OVER", "referee", "REF01")
+    asyncio.run(send("inproc://P01/mcp", message))
+    assert Field.TRACEPARENT not in received[0]
+    assert _spans(trace_dir) == {}
+
+
+def test_bind_runs_later_work_under_the_current_span(trace_dir):
+    async def later():
+        with span("run_match"):
+            pass
+
+    with span("handle ROUND_ANNOUNCEMENT", "REF01"):
+        task = bind(later)
+    asyncio.run(task())
+    spans = _spans(trace_dir)
+    assert spans["run_match"]["parent_id"] == spans["handle ROUND_ANNOUNCEMENT"]["span_id"]
+    assert spans["run_match"]["agent_id"] == "REF01"
+
+
+def test_error_and_new_trace(trace_dir):
+    with span("round", "LM01"):
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("boom")
+        with span("next round", new_trace=True):
+            pass
+    spans = _spans(trace_dir)
+    assert spans["failing"]["error"] == "ValueError: boom"
+    assert spans["next round"]["parent_id"] is None
+    assert spans["next round"]["trace_id"] != spans["round"]["trace_id"]
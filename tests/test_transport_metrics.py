@@ -0,0 +1,118 @@
+"""Tests for the metrics registry and transport-level metrics."""
+
+import asyncio
+import random
+
+import httpx
+import pytest
+
+from SHARED.contracts.jsonrpc_helpers import wrap_jsonrpc_request
+from SHARED.league_sdk.circuit_breaker import CircuitBreakerRegistry
+from SHARED.league_sdk.hdr_histogram import HdrCounts, bucket_index, bucket_upper
+from SHARED.league_sdk.inprocess_transport import InProcessTransport
+from SHARED.league_sdk.metrics import MetricsRegistry, get_metrics_registry
+from SHARED.league_sdk.transport import CircuitOpenError, HTTPTransport
+from SHARED.league_sdk.transport_metrics import (
+    attempts, bytes_received, bytes_sent, circuit_state, errors, latency, record_circuit_transition,
+    rejections, retries, successes, timeouts, transitions, transport_status,
+)
+
+URL = "http://referee.test/mcp"
+INVITE = ("game_invitation", {"message_type": "GAME_INVITATION", "match_id": "R1M1"})
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+def _http(handler, threshold=5):
+    transport = HTTPTransport()
+    transport._cb = CircuitBreakerRegistry(default_failure_threshold=threshold)
+    transport._cb.add_listener(record_circuit_transition)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    transport._get_client = lambda: client
+    return transport
+
+
+def test_hdr_buckets_bound_relative_error():
+    for value in [0, 1, 63, 64, 65, 127, 128, 1000, 123_456, 10**9]:
+        index = bucket_index(value)
+        assert value <= bucket_upper(index) <= value * 1.032 + 1
+        assert bucket_index(bucket_upper(index)) == index
+    counts, rng = HdrCounts(), random.Random(7)
+    values = sorted(int(rng.expovariate(1 / 5000)) for _ in range(20_000))
+    for value in values:
+        counts.record(value)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert exact <= counts.percentile(q) <= exact * 1.04
+    assert counts.percentile(1.0) == values[-1] and len(counts.buckets) < 400
+
+
+def test_registry_returns_one_metric_per_name():
+    registry = MetricsRegistry()
+    counter = registry.counter("sends_total", "Sends", ("endpoint",))
+    assert registry.counter("sends_total", "Sends", ("endpoint",)) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("sends_total", "Sends", ("endpoint",))
+    counter.inc(("a",))
+    counter.inc(("a",), 2)
+    registry.histogram("wait_seconds", "Wait").observe((), 0.25)
+    view = registry.snapshot()
+    assert view["sends_total"]["samples"] == [{"labels": {"endpoint": "a"}, "value": 3}]
+    wait = view["wait_seconds"]["samples"][0]
+    assert wait["count"] == 1 and 249 <= wait["p99_ms"] <= 250 == wait["max_ms"]
+    registry.reset()
+    assert registry.snapshot()["sends_total"]["samples"] == []
+
+
+def test_http_success_counts_attempt_latency_and_bytes():
+    transport = _http(lambda request: httpx.Response(200, json={"status": "ok"}))
+    message = wrap_jsonrpc_request(INVITE[0], INVITE[1], 1)
+    assert asyncio.run(transport.send_with_retry(URL, message)) == {"status": "ok"}
+    labels = (URL, "GAME_INVITATION")
+    assert attempts.value(labels) == successes.value(labels) == 1
+    assert latency.samples()[labels].count == 1 and retries.value(labels) == 0
+    assert bytes_sent.value((URL,)) > 50 and bytes_received.value((URL,)) == len(b'{"status":"ok"}')
+
+
+def test_http_failures_count_errors_retries_and_circuit():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(503)
+
+    transport = _http(handler, threshold=2)
+    message = {"message_type": "MATCH_RESULT_REPORT"}
+    assert asyncio.run(transport.send_with_retry(URL, message, max_retries=2, retry_delay=0)) is None
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(transport.send_with_retry(URL, message))
+    labels = (URL, "MATCH_RESULT_REPORT")
+    assert attempts.value(labels) == 2 and retries.value(labels) == 1
+    assert timeouts.value(labels) == 1 and errors.value(labels + ("http_503",)) == 1
+    assert rejections.value((URL,)) == 1
+    assert transitions.value((URL, "CLOSED", "OPEN")) == 1 and circuit_state.value((URL,)) == 2
+    transport._cb.record_success(URL)
+    assert circuit_state.value((URL,)) == 0
+    status = transport_status()["metrics"]
+    assert status["transport_errors_total"]["samples"][0]["labels"]["error"] == "http_503"
+
+
+def test_in_process_attempts_are_counted():
+    transport = InProcessTransport()
+
+    async def failing(message):
+        raise KeyError("boom")
+
+    transport.register_endpoint("inproc://P01/mcp", failing)
+    asyncio.run(transport.send_with_retry("inproc://P01/mcp", {"message_type": "GAME_OVER"}, 2, 0))
+    asyncio.run(transport.send("inproc://P02/mcp", {"message_type": "GAME_OVER"}))
+    assert errors.value(("inproc://P01/mcp", "GAME_OVER", "KeyError")) == 2
+    assert retries.value(("inproc://P01/mcp", "GAME_OVER")) == 1
+    assert errors.value(("inproc://P02/mcp", "GAME_OVER", "no_handler")) == 1